@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Agent Pool Benchmark
+Compares memory per agent and workforce metric latency for the
+structure-of-arrays AgentPool against the previous dict of AIAgent
+dataclasses
+"""
+
+import asyncio
+import logging
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from pathlib import Path
+from typing import Callable, Dict
+
+sys.path.append(str(Path(__file__).parent.parent / "workflows"))
+
+from ai_workforce_expansion import (  # noqa: E402
+    AgentSpecialization, AgentStatus, AIWorkforceExpansion
+)
+
+AGENTS = 10000
+METRIC_CALLS = 200
+
+
+def legacy_metrics(agent_pool: Dict, distribution: Dict) -> Dict:
+    """Previous per-call walks of the whole pool"""
+    specialization_counts = defaultdict(int)
+    for agent in agent_pool.values():
+        specialization_counts[agent.specialization.value] += 1
+
+    actual_distribution = defaultdict(int)
+    for agent in agent_pool.values():
+        actual_distribution[agent.specialization] += 1
+    coverage = [
+        min(actual_distribution.get(spec, 0) / expected, 1.0)
+        for spec, expected in distribution.items() if expected > 0
+    ]
+
+    active = sum(
+        1 for agent in agent_pool.values()
+        if agent.status in [AgentStatus.IDLE, AgentStatus.ACTIVE]
+    )
+    return {
+        "agents_by_specialization": dict(specialization_counts),
+        "coverage": sum(coverage) / len(coverage),
+        "active_agents": active
+    }
+
+
+async def create_agents(workforce: AIWorkforceExpansion):
+    """AIAgent records as built by the workforce"""
+    specs = list(AgentSpecialization)
+    return await asyncio.gather(*(
+        workforce._create_specialized_agent(specs[i % len(specs)])
+        for i in range(AGENTS)
+    ))
+
+
+def measure(build: Callable) -> float:
+    """Bytes allocated per agent by a pool builder"""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    pool = build()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(
+        stat.size_diff for stat in after.compare_to(before, "filename")
+    )
+    return pool, allocated / AGENTS
+
+
+def time_calls(function: Callable) -> float:
+    """Mean microseconds per call"""
+    start = time.perf_counter()
+    for _ in range(METRIC_CALLS):
+        function()
+    return (time.perf_counter() - start) / METRIC_CALLS * 1e6
+
+
+def main():
+    """Run the agent pool benchmark"""
+    logging.disable(logging.INFO)
+
+    print("🧬 Agent Pool Benchmark")
+    print("=" * 50)
+    print(f"Agents: {AGENTS}")
+
+    workforce = AIWorkforceExpansion()
+
+    def build_legacy():
+        agents = asyncio.run(create_agents(workforce))
+        return {agent.agent_id: agent for agent in agents}
+
+    def build_pool():
+        agents = asyncio.run(create_agents(workforce))
+        for agent in agents:
+            workforce.agent_pool.add(agent)
+        return workforce.agent_pool
+
+    legacy_pool, legacy_bytes = measure(build_legacy)
+    del legacy_pool
+    _, pool_bytes = measure(build_pool)
+    workforce.metrics["total_agents"] = len(workforce.agent_pool)
+
+    legacy_agents = asyncio.run(create_agents(workforce))
+    legacy_pool = {agent.agent_id: agent for agent in legacy_agents}
+    distribution = workforce.specialization_distribution
+    legacy_us = time_calls(
+        lambda: legacy_metrics(legacy_pool, distribution)
+    )
+    pool_us = time_calls(lambda: (
+        workforce.get_workforce_metrics(),
+        workforce._calculate_specialization_coverage(),
+        workforce.agent_pool.count(AgentStatus.IDLE, AgentStatus.ACTIVE)
+    ))
+
+    print(f"  - previous: {legacy_bytes:.0f} bytes/agent, "
+          f"metrics {legacy_us:.0f}us")
+    print(f"  - AgentPool: {pool_bytes:.0f} bytes/agent, "
+          f"metrics {pool_us:.0f}us")
+    print(f"  - memory {legacy_bytes / pool_bytes:.1f}x smaller, "
+          f"metrics {legacy_us / pool_us:.0f}x faster")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Background Retraining Benchmark
+Measures evolve_pattern latency and event-loop lag while models retrain,
+comparing the previous synchronous fit-per-event with background
+policy-driven retraining
+"""
+
+import asyncio
+import logging
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict
+
+import joblib
+import numpy as np
+
+sys.path.append(str(Path(__file__).parent.parent / "workflows"))
+
+from advanced_pattern_learning import AdvancedPatternLearner  # noqa: E402
+from latency_histogram import LatencyHistogram  # noqa: E402
+
+EVENTS = 160
+EVENT_INTERVAL_SECONDS = 0.01
+
+
+class SynchronousRetrainLearner(AdvancedPatternLearner):
+    """Previous behaviour: fit and dump inline on every event past 100"""
+
+    def _schedule_retrain(self, pattern_type: str):
+        pass
+
+    async def evolve_pattern(self, pattern_data: Dict) -> Dict:
+        result = await super().evolve_pattern(pattern_data)
+        pattern_type = pattern_data["type"]
+        history = self.evolution_history[pattern_type]
+        if len(history) >= 100:
+            features, confidence = history.training_data()
+            model = self.pattern_models[pattern_type]
+            model.fit(features, confidence > 0.7)
+            joblib.dump(
+                model, self.model_path / f"{pattern_type}_model.pkl"
+            )
+            self.metrics["model_updates"] += 1
+        return result
+
+
+async def run_stream(learner: AdvancedPatternLearner) -> Dict[str, float]:
+    """Stream events while probing event-loop lag"""
+    latency = LatencyHistogram()
+    lag = LatencyHistogram()
+
+    async def probe():
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(0.005)
+            lag.record((time.perf_counter() - start - 0.005) * 1000)
+
+    prober = asyncio.create_task(probe())
+    rng = np.random.default_rng(3)
+    start = time.perf_counter()
+    for _ in range(EVENTS):
+        event = {
+            "type": "burnout",
+            "timestamp": datetime.now().isoformat(),
+            "risk_score": float(rng.random()),
+            "interaction_count": int(rng.integers(0, 100)),
+            "engagement_score": float(rng.random())
+        }
+        event_start = time.perf_counter()
+        await learner.evolve_pattern(event)
+        latency.record((time.perf_counter() - event_start) * 1000)
+        await asyncio.sleep(EVENT_INTERVAL_SECONDS)
+
+    # Let an in-flight background run finish before stopping
+    for task in list(learner.training_tasks.values()):
+        await task
+    elapsed = time.perf_counter() - start
+    prober.cancel()
+    await learner.shutdown()
+    return {
+        "seconds": elapsed,
+        "updates": learner.metrics["model_updates"],
+        "latency_p50": latency.percentile(0.5),
+        "latency_max": latency.max,
+        "lag_p99": lag.percentile(0.99),
+        "lag_max": lag.max
+    }
+
+
+async def main():
+    """Run the retraining benchmark"""
+    logging.disable(logging.INFO)
+
+    print("🔁 Background Retraining Benchmark")
+    print("=" * 50)
+    print(f"Events: {EVENTS} of one pattern type, "
+          f"{EVENT_INTERVAL_SECONDS * 1000:.0f}ms apart")
+
+    with tempfile.TemporaryDirectory() as model_dir:
+        for label, learner_class in (
+                ("synchronous", SynchronousRetrainLearner),
+                ("background", AdvancedPatternLearner)):
+            learner = learner_class(
+                model_path=str(Path(model_dir) / label),
+                batch_wait_ms=0.0
+            )
+            await learner.initialize()
+            result = await run_stream(learner)
+            print(f"  - {label}: {result['seconds']:.1f}s, "
+                  f"{result['updates']} model updates, event latency "
+                  f"p50 {result['latency_p50']:.1f}ms / "
+                  f"max {result['latency_max']:.0f}ms, loop lag "
+                  f"p99 {result['lag_p99']:.1f}ms / "
+                  f"max {result['lag_max']:.0f}ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Feedback Store Benchmark
+Measures feedback write latency and event-loop lag with a full history,
+comparing the previous rewrite-the-whole-file JSON store with the
+append-only JSONL log
+"""
+
+import asyncio
+import json
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from feedback.feedback_collector import FeedbackCollector  # noqa: E402
+from workflows.latency_histogram import LatencyHistogram  # noqa: E402
+
+WRITES = 500
+WRITE_INTERVAL_SECONDS = 0.002
+
+
+class RewriteFeedbackCollector(FeedbackCollector):
+    """Previous behaviour: load, append, trim and rewrite on every write"""
+
+    async def _store_feedback(self, feedback: Dict):
+        existing_data = []
+        if self.feedback_store.exists():
+            with open(self.feedback_store, 'r') as f:
+                existing_data = json.load(f)
+        existing_data.append(feedback)
+        if len(existing_data) > 1000:
+            existing_data = existing_data[-1000:]
+        with open(self.feedback_store, 'w') as f:
+            json.dump(existing_data, f, indent=2)
+
+
+def make_feedback(collector: FeedbackCollector, i: int) -> Dict:
+    """A feedback entry shaped like collect_intervention_feedback's"""
+    success_metrics = {
+        "success_rate": (i % 10) / 10,
+        "time_saved_hours": i % 5,
+        "users_helped": i % 40,
+        "cost": 10
+    }
+    feedback = {
+        "intervention_id": f"INT-{i:05d}",
+        "timestamp": "2025-01-01T00:00:00",
+        "success_metrics": success_metrics,
+        "calculated_impact": collector._calculate_impact(success_metrics)
+    }
+    feedback["pattern_analysis"] = collector._local_pattern_analysis(
+        feedback
+    )
+    return feedback
+
+
+async def run_writes(collector: FeedbackCollector) -> Dict[str, float]:
+    """Prefill a full history, then stream writes while probing lag"""
+    for i in range(1000):
+        await collector._store_feedback(make_feedback(collector, i))
+    await collector.feedback_log.flush()
+
+    latency = LatencyHistogram()
+    lag = LatencyHistogram()
+
+    async def probe():
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(0.001)
+            lag.record((time.perf_counter() - start - 0.001) * 1000)
+
+    prober = asyncio.create_task(probe())
+    start = time.perf_counter()
+    for i in range(1000, 1000 + WRITES):
+        feedback = make_feedback(collector, i)
+        write_start = time.perf_counter()
+        await collector._store_feedback(feedback)
+        latency.record((time.perf_counter() - write_start) * 1000)
+        await asyncio.sleep(WRITE_INTERVAL_SECONDS)
+    await collector.shutdown()
+    elapsed = time.perf_counter() - start
+    prober.cancel()
+    return {
+        "seconds": elapsed,
+        "latency_p50": latency.percentile(0.5),
+        "latency_p99": latency.percentile(0.99),
+        "lag_p99": lag.percentile(0.99)
+    }
+
+
+async def main():
+    """Run the feedback store benchmark"""
+    logging.disable(logging.WARNING)
+
+    print("🗂️ Feedback Store Benchmark")
+    print("=" * 50)
+    print(f"Writes: {WRITES} on top of a full 1000-entry history")
+
+    with tempfile.TemporaryDirectory() as store_dir:
+        for label, collector in (
+                ("rewrite JSON", RewriteFeedbackCollector(
+                    feedback_store=str(Path(store_dir) / "feedback.json")
+                )),
+                ("append-only JSONL", FeedbackCollector(
+                    feedback_store=str(Path(store_dir) / "feedback.jsonl")
+                ))):
+            result = await run_writes(collector)
+            print(f"  - {label}: {result['seconds']:.2f}s, write latency "
+                  f"p50 {result['latency_p50']:.2f}ms / "
+                  f"p99 {result['latency_p99']:.2f}ms, loop lag "
+                  f"p99 {result['lag_p99']:.1f}ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Global Workflow Pipeline Benchmark
+Measures Week 3 global workflow throughput with the previous strictly
+sequential stages, concurrent workforce dispatch and Week 2 per
+workflow, and the pipelined process_global_batch
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier
+
+sys.path.append(str(Path(__file__).parent.parent / "workflows"))
+
+from advanced_pattern_learning import MODEL_PARAMS  # noqa: E402
+from global_deployment import Region  # noqa: E402
+from week3_integration import Week3Integration  # noqa: E402
+
+WORKFLOWS = 600
+
+
+class SequentialIntegration(Week3Integration):
+    """Previous behaviour: evolve, dispatch, then Week 2, in order"""
+
+    async def _process_in_region(self, workflow: Dict,
+                                 region: Region) -> Tuple[Region, str, Dict]:
+        task_id = await self.ai_workforce.distribute_task({
+            "type": workflow.get("type", "general"),
+            "complexity": workflow.get("complexity", 1.0),
+            "region": region.value
+        })
+        week2_result = await self.week2_integration.process_user_interaction(
+            workflow
+        )
+        return region, task_id, week2_result
+
+
+def make_workflows(batch: int) -> List[Dict]:
+    """Distinct workflows so no stage can serve a cached result"""
+    return [
+        {
+            "type": "pattern_analysis",
+            "user_id": f"user_{batch}_{i}",
+            "user_region": ("us-east", "eu", "asia")[i % 3],
+            "content": f"Status update {batch}-{i}: feeling stretched thin",
+            "complexity": 0.01,
+            "pattern_data": {
+                "type": ("burnout", "crisis", "engagement")[i % 3],
+                "risk_score": (i % 10) / 10,
+                "interaction_count": i % 50
+            }
+        }
+        for i in range(WORKFLOWS)
+    ]
+
+
+async def measure(integration: Week3Integration, batch: int,
+                  pipelined: bool) -> float:
+    """Workflows per second for one pass"""
+    workflows = make_workflows(batch)
+    start = time.perf_counter()
+    if pipelined:
+        await integration.process_global_batch(workflows)
+    else:
+        for workflow in workflows:
+            await integration.process_global_workflow(workflow)
+    return WORKFLOWS / (time.perf_counter() - start)
+
+
+async def run(integration_class, pipelined: bool,
+              model: RandomForestClassifier) -> float:
+    """Throughput of a freshly initialized integration"""
+    integration = integration_class()
+    await integration.initialize_week3_systems()
+    await integration.rollout_task
+
+    learner = integration.pattern_learner
+    for pattern_type in learner.pattern_models:
+        learner.pattern_models[pattern_type] = model
+    # Keep background retraining from competing for the CPU
+    learner.retrain_every_samples = WORKFLOWS * 10
+    learner.retrain_interval_seconds = float("inf")
+    return await measure(integration, 0, pipelined)
+
+
+def main():
+    """Run the pipeline benchmark"""
+    logging.disable(logging.WARNING)
+
+    print("🛤️ Global Workflow Pipeline Benchmark")
+    print("=" * 50)
+    print(f"Workflows per run: {WORKFLOWS}, production-sized pattern models")
+
+    # Production-sized forest shared by every pattern type
+    rng = np.random.default_rng(7)
+    features = rng.random((1000, 50)).astype(np.float32)
+    model = RandomForestClassifier(**MODEL_PARAMS).fit(
+        features, (features[:, 6] > 0.5).astype(int)
+    )
+
+    # Integrations write model artifacts under the working directory
+    with tempfile.TemporaryDirectory() as work_dir:
+        os.chdir(work_dir)
+        baseline = asyncio.run(run(SequentialIntegration, False, model))
+        print(f"  - sequential stages: {baseline:.0f} workflows/s")
+
+        for label, pipelined in (("concurrent dispatch and Week 2", False),
+                                 ("process_global_batch", True)):
+            throughput = asyncio.run(
+                run(Week3Integration, pipelined, model)
+            )
+            print(f"  - {label}: {throughput:.0f} workflows/s "
+                  f"({throughput / baseline:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
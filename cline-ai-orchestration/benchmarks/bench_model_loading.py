@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Pattern Model Loading Benchmark
+Measures cold start and memory of four worker processes that each use
+two of six saved pattern models, loading every model eagerly at startup
+versus lazily with a small resident LRU
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict
+
+import joblib
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier
+
+sys.path.append(str(Path(__file__).parent.parent / "workflows"))
+
+from advanced_pattern_learning import (  # noqa: E402
+    MODEL_PARAMS, AdvancedPatternLearner
+)
+
+WORKERS = 4
+PATTERN_TYPES = (
+    "burnout", "disengagement", "crisis",
+    "recovery", "engagement", "resilience"
+)
+USED_TYPES = ("burnout", "crisis")
+
+
+class EagerLearner(AdvancedPatternLearner):
+    """Previous behaviour: joblib.load every saved model at startup"""
+
+    async def _load_or_create_models(self):
+        await super()._load_or_create_models()
+        for pattern_type, model_file in self.pattern_models.files.items():
+            if model_file is not None:
+                self.pattern_models[pattern_type] = joblib.load(model_file)
+
+
+def process_memory_mb() -> Dict[str, float]:
+    """Resident and proportional set size of this process"""
+    memory = {}
+    with open("/proc/self/smaps_rollup") as rollup:
+        for line in rollup:
+            field, value = line.split()[:2]
+            if field in ("Rss:", "Pss:"):
+                memory[field[:-1].lower()] = int(value) / 1024
+    return memory
+
+
+def run_worker(args) -> Dict[str, float]:
+    """Start a learner, score a few events, report timings and memory"""
+    learner_class, model_dir = args
+    logging.disable(logging.INFO)
+
+    async def serve():
+        learner = learner_class(model_path=model_dir)
+        start = time.perf_counter()
+        await learner.initialize()
+        startup = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for pattern_type in USED_TYPES * 5:
+            await learner.evolve_pattern({
+                "type": pattern_type,
+                "timestamp": datetime.now().isoformat(),
+                "risk_score": 0.6
+            })
+        first_events = time.perf_counter() - start
+        await learner.shutdown()
+        return startup, first_events
+
+    baseline = process_memory_mb()
+    startup, first_events = asyncio.run(serve())
+    memory = process_memory_mb()
+    return {"startup": startup, "first_events": first_events,
+            "learner_rss": memory["rss"] - baseline["rss"], **memory}
+
+
+def save_models(model_dir: str):
+    """Production-sized forests for every pattern type"""
+    rng = np.random.default_rng(0)
+    features = rng.random((1000, 50)).astype(np.float32)
+    labels = rng.integers(0, 2, 1000)
+    model = RandomForestClassifier(**MODEL_PARAMS).fit(features, labels)
+    for pattern_type in PATTERN_TYPES:
+        joblib.dump(model, Path(model_dir) / f"{pattern_type}_model.v1.pkl")
+    return (Path(model_dir) / "burnout_model.v1.pkl").stat().st_size
+
+
+def main():
+    """Run the model loading benchmark"""
+    print("📦 Pattern Model Loading Benchmark")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as model_dir:
+        size = save_models(model_dir)
+        print(f"Workers: {WORKERS}, models: {len(PATTERN_TYPES)} x "
+              f"{size / 1e6:.1f}MB, used per worker: {len(USED_TYPES)}")
+
+        context = multiprocessing.get_context("spawn")
+        for label, learner_class in (("eager", EagerLearner),
+                                     ("lazy", AdvancedPatternLearner)):
+            with context.Pool(WORKERS) as pool:
+                results = pool.map(
+                    run_worker, [(learner_class, model_dir)] * WORKERS
+                )
+            startup = np.mean([r["startup"] for r in results]) * 1000
+            first = np.mean([r["first_events"] for r in results]) * 1000
+            rss = sum(r["rss"] for r in results)
+            pss = sum(r["pss"] for r in results)
+            learner_rss = sum(r["learner_rss"] for r in results)
+            print(f"  - {label}: initialize {startup:.0f}ms, first events "
+                  f"{first:.0f}ms, total RSS {rss:.0f}MB "
+                  f"(learner {learner_rss:.0f}MB), PSS {pss:.0f}MB")
+
+
+if __name__ == "__main__":
+    main()
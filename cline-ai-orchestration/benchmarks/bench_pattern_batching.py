@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Pattern Scoring Batching Benchmark
+Measures evolve_pattern throughput and latency for per-event
+predict_proba calls versus micro-batches of varying size and wait
+"""
+
+import asyncio
+import logging
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier
+
+sys.path.append(str(Path(__file__).parent.parent / "workflows"))
+
+from advanced_pattern_learning import AdvancedPatternLearner  # noqa: E402
+from latency_histogram import LatencyHistogram  # noqa: E402
+
+REQUESTS = 2000
+CLIENTS = 128
+PATTERN_TYPES = ("burnout", "crisis", "disengagement")
+# (label, max batch size, max wait ms)
+CONFIGS = (
+    ("per-event", 1, 0.0),
+    ("batch 16 / 1ms", 16, 1.0),
+    ("batch 64 / 2ms", 64, 2.0),
+    ("batch 256 / 5ms", 256, 5.0),
+)
+
+
+class ScoringOnlyLearner(AdvancedPatternLearner):
+    """Learner with retraining disabled to isolate inference cost"""
+
+    async def _retrain_model(self, pattern_type: str):
+        pass
+
+
+def fit_models(learner: AdvancedPatternLearner):
+    """Fit production-sized forests on synthetic history"""
+    rng = np.random.default_rng(7)
+    features = rng.random((1000, 50)).astype(np.float32)
+    labels = (features[:, 6] > 0.5).astype(int)
+    for pattern_type in learner.pattern_models:
+        learner.pattern_models[pattern_type] = RandomForestClassifier(
+            n_estimators=100, max_depth=10, random_state=42
+        ).fit(features, labels)
+
+
+def make_event(i: int) -> Dict:
+    """Pattern event drawn from a few pattern types"""
+    return {
+        "type": PATTERN_TYPES[i % len(PATTERN_TYPES)],
+        "timestamp": datetime.now().isoformat(),
+        "risk_score": (i % 100) / 100,
+        "interaction_count": i % 80,
+        "engagement_score": 0.3
+    }
+
+
+async def run_load(learner: AdvancedPatternLearner) -> Dict[str, float]:
+    """Closed-loop clients each issuing requests back to back"""
+    histogram = LatencyHistogram()
+    counter = iter(range(REQUESTS))
+
+    async def client():
+        for i in counter:
+            start = time.perf_counter()
+            await learner.evolve_pattern(make_event(i))
+            histogram.record((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(CLIENTS)))
+    elapsed = time.perf_counter() - start
+    return {
+        "throughput": REQUESTS / elapsed,
+        "p50": histogram.percentile(0.5),
+        "p99": histogram.percentile(0.99),
+        "batch": learner.prediction_batcher.mean_batch_size()
+    }
+
+
+async def main():
+    """Run the batching benchmark"""
+    logging.disable(logging.INFO)
+
+    print("🧠 Pattern Scoring Batching Benchmark")
+    print("=" * 50)
+    print(f"Requests: {REQUESTS}, concurrent clients: {CLIENTS}, "
+          f"pattern types: {len(PATTERN_TYPES)}")
+
+    with tempfile.TemporaryDirectory() as model_dir:
+        baseline = None
+        for label, batch_size, wait_ms in CONFIGS:
+            learner = ScoringOnlyLearner(
+                model_path=model_dir,
+                batch_size=batch_size,
+                batch_wait_ms=wait_ms
+            )
+            await learner.initialize()
+            fit_models(learner)
+
+            result = await run_load(learner)
+            baseline = baseline or result["throughput"]
+            print(f"  - {label}: {result['throughput']:.0f} req/s "
+                  f"({result['throughput'] / baseline:.1f}x), "
+                  f"mean batch {result['batch']:.1f}, "
+                  f"p50 {result['p50']:.1f}ms, p99 {result['p99']:.1f}ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
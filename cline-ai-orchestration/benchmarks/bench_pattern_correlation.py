@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Cross-Pattern Correlation Benchmark
+Compares per-pair feature extraction and np.corrcoef with the tiled
+correlation matrix in analyze_cross_pattern_correlations
+"""
+
+import asyncio
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).parent.parent / "workflows"))
+
+from advanced_pattern_learning import AdvancedPatternLearner  # noqa: E402
+
+PATTERN_COUNTS = (100, 250, 500, 2000)
+PAIRWISE_LIMIT = 500
+PATTERN_TYPES = ("burnout", "disengagement", "crisis", "recovery")
+
+
+def make_patterns(count: int) -> List[Dict]:
+    """Pattern events with varied timing and scores"""
+    rng = np.random.default_rng(11)
+    return [
+        {
+            "type": PATTERN_TYPES[i % len(PATTERN_TYPES)],
+            "timestamp": f"2025-06-{1 + i % 28:02d}T{i % 24:02d}:00:00",
+            "risk_score": float(rng.random()),
+            "interaction_count": int(rng.integers(0, 100)),
+            "engagement_score": float(rng.random()),
+            "response_rate": float(rng.random()),
+            "support_score": float(rng.random())
+        }
+        for i in range(count)
+    ]
+
+
+def pairwise_correlations(learner: AdvancedPatternLearner,
+                          patterns: List[Dict]) -> int:
+    """Previous approach: extract and corrcoef each pair separately"""
+    strong = 0
+    for i in range(len(patterns)):
+        for j in range(i + 1, len(patterns)):
+            features1 = learner._extract_advanced_features(patterns[i])
+            features2 = learner._extract_advanced_features(patterns[j])
+            correlation = np.corrcoef(features1, features2)[0, 1]
+            if abs(correlation) > 0.7:
+                strong += 1
+    return strong
+
+
+async def main():
+    """Run the correlation benchmark"""
+    logging.disable(logging.INFO)
+
+    print("🔗 Cross-Pattern Correlation Benchmark")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as model_dir:
+        learner = AdvancedPatternLearner(model_path=model_dir)
+        await learner.initialize()
+
+        for count in PATTERN_COUNTS:
+            patterns = make_patterns(count)
+
+            start = time.perf_counter()
+            result = await learner.analyze_cross_pattern_correlations(
+                patterns
+            )
+            vectorized = time.perf_counter() - start
+            line = (f"  - {count} patterns: vectorized "
+                    f"{vectorized * 1000:.1f}ms "
+                    f"({len(result['correlations'])} strong pairs)")
+
+            if count <= PAIRWISE_LIMIT:
+                start = time.perf_counter()
+                pairwise_correlations(learner, patterns)
+                pairwise = time.perf_counter() - start
+                line += (f", pairwise {pairwise * 1000:.0f}ms "
+                         f"({pairwise / vectorized:.0f}x)")
+            print(line)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Real-time Monitor Throughput Benchmark
+Measures event throughput with 1000 registered streams on one core
+Target: 50,000 events/second
+"""
+
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / "workflows"))
+
+from realtime_monitor import create_monitoring_system  # noqa: E402
+
+STREAM_COUNT = 1000
+EVENT_COUNT = 200000
+BATCH_SIZE = 1000
+TARGET_EVENTS_PER_SECOND = 50000
+
+
+def make_events(count: int):
+    """Build a mixed event stream spread across all streams"""
+    pattern_event = {
+        "type": "pattern_detected",
+        "payload": {"risk_score": 0.8, "indicators": ["exhausted"]}
+    }
+    metric_event = {
+        "type": "performance_metric",
+        "payload": {"error_rate": 0.01, "response_time_ms": 120}
+    }
+    return [
+        (f"stream_{i % STREAM_COUNT}",
+         pattern_event if i % 4 else metric_event)
+        for i in range(count)
+    ]
+
+
+async def create_monitor():
+    """Create a monitor with the default handlers and 1000 streams"""
+    monitor = await create_monitoring_system()
+    for i in range(STREAM_COUNT):
+        await monitor.register_stream(f"stream_{i}", {"type": "bench"})
+    return monitor
+
+
+async def bench_single_events(events) -> float:
+    """Throughput of one process_event call per event"""
+    monitor = await create_monitor()
+    start = time.perf_counter()
+    for stream_id, event in events:
+        await monitor.process_event(stream_id, event)
+    return len(events) / (time.perf_counter() - start)
+
+
+async def bench_batched_events(events) -> float:
+    """Throughput of process_events_batch"""
+    monitor = await create_monitor()
+    start = time.perf_counter()
+    for offset in range(0, len(events), BATCH_SIZE):
+        await monitor.process_events_batch(
+            events[offset:offset + BATCH_SIZE]
+        )
+    return len(events) / (time.perf_counter() - start)
+
+
+async def bench_blocking_handlers() -> float:
+    """Wall time for 1000 events whose two handlers each wait 10ms"""
+    monitor = await create_monitor()
+
+    async def slow_lookup(stream_id, payload):
+        await asyncio.sleep(0.01)
+        return {}
+
+    monitor.register_event_handler("enrichment", slow_lookup)
+    monitor.register_event_handler("enrichment", slow_lookup)
+    events = [
+        (f"stream_{i}", {"type": "enrichment", "payload": {}})
+        for i in range(STREAM_COUNT)
+    ]
+
+    start = time.perf_counter()
+    await monitor.process_events_batch(events)
+    return time.perf_counter() - start
+
+
+async def main():
+    """Run the monitor benchmarks"""
+    logging.disable(logging.INFO)
+    events = make_events(EVENT_COUNT)
+
+    print("⚡ Real-time Monitor Throughput Benchmark")
+    print("=" * 50)
+    print(f"Streams: {STREAM_COUNT}, events: {EVENT_COUNT}")
+
+    single = await bench_single_events(events)
+    batched = await bench_batched_events(events)
+    blocking = await bench_blocking_handlers()
+
+    print(f"  - process_event: {single:,.0f} events/s")
+    print(f"  - process_events_batch: {batched:,.0f} events/s "
+          f"(target {TARGET_EVENTS_PER_SECOND:,})")
+    print(f"  - 1000 events x 2 blocking 10ms handlers: {blocking:.3f}s "
+          f"(sequential would take {STREAM_COUNT * 2 * 0.01:.0f}s)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Region Routing Simulation
+Replays skewed global traffic against per-region production scalers and
+compares static home-region routing, lowest-latency routing and the
+adaptive region router, including a mid-run latency spike in one region
+"""
+
+import asyncio
+import logging
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict
+
+sys.path.append(str(Path(__file__).parent.parent / "workflows"))
+
+from global_deployment import GlobalDeploymentSystem, Region  # noqa: E402
+from latency_histogram import LatencyHistogram  # noqa: E402
+from production_scaler import ProductionScaler  # noqa: E402
+from region_router import RegionRouter  # noqa: E402
+
+DURATION_SECONDS = 3.0
+REQUESTS_PER_SECOND = 400
+SERVICE_TIME_SECONDS = 0.02
+# Smaller home regions for the busiest user areas
+REGION_WORKERS = {
+    Region.US_EAST: 4, Region.US_WEST: 8,
+    Region.EU_WEST: 6, Region.EU_CENTRAL: 6,
+    Region.ASIA_PACIFIC: 4, Region.ASIA_NORTHEAST: 6
+}
+# Share of traffic per user region
+USER_REGIONS = (("us-east", 0.6), ("eu", 0.25), ("asia", 0.15))
+# One region's round trip spikes for the middle third of the run
+SPIKE_REGION = Region.US_WEST
+SPIKE_RTT_MS = 300.0
+
+
+async def simulated_work(workflow: Dict) -> Dict:
+    """Fixed-cost regional processing"""
+    await asyncio.sleep(SERVICE_TIME_SECONDS)
+    return {"processed": True}
+
+
+class Simulation:
+    """Regions with their own scaler, network delay and latency probe"""
+
+    def __init__(self):
+        self.deployment = GlobalDeploymentSystem()
+        self.deployment.active_regions = set(Region)
+        self.router = RegionRouter(self.deployment, rng=random.Random(1))
+        self.scalers: Dict[Region, ProductionScaler] = {}
+        self.started = 0.0
+
+    async def start(self):
+        for region, workers in REGION_WORKERS.items():
+            scaler = ProductionScaler(
+                worker_count=workers, min_workers=workers,
+                max_workers=workers
+            )
+            scaler.register_workflow_type("regional", simulated_work)
+            await scaler.initialize()
+            self.scalers[region] = scaler
+            self.router.register_scaler(region, scaler)
+        self.started = time.perf_counter()
+        self.probe_task = asyncio.create_task(self.probe())
+
+    async def stop(self):
+        self.probe_task.cancel()
+        for scaler in self.scalers.values():
+            await scaler.shutdown()
+
+    def rtt_ms(self, region: Region) -> float:
+        """Current one-way network delay to a region"""
+        elapsed = time.perf_counter() - self.started
+        if (region == SPIKE_REGION and
+                DURATION_SECONDS / 3 <= elapsed < 2 * DURATION_SECONDS / 3):
+            return SPIKE_RTT_MS
+        return self.deployment.region_configs[region].latency_target_ms
+
+    async def probe(self):
+        """Feed live latency estimates as background probing would"""
+        rng = random.Random(2)
+        while True:
+            for region in Region:
+                self.deployment._record_latency(
+                    region, self.rtt_ms(region) * rng.uniform(0.9, 1.1)
+                )
+            await asyncio.sleep(0.05)
+
+    async def serve(self, workflow: Dict, region: Region):
+        """Network round trip plus processing in the region's scaler"""
+        await asyncio.sleep(self.rtt_ms(region) / 1000)
+        handle = await self.scalers[region].submit_workflow(
+            workflow, idempotency_key=workflow["request_id"]
+        )
+        return await handle
+
+
+def static_policy(sim: Simulation, workflow: Dict) -> Region:
+    """Previous behaviour: the user's home region"""
+    return sim.router.home_region(workflow)
+
+
+def fastest_policy(sim: Simulation, workflow: Dict) -> Region:
+    """Lowest latency estimate, ignoring load"""
+    return min(
+        sim.router.eligible_regions(workflow),
+        key=sim.deployment.estimated_latency
+    )
+
+
+async def run_policy(policy: Callable) -> Dict[str, float]:
+    """Open-loop Poisson arrivals routed by one policy"""
+    sim = Simulation()
+    await sim.start()
+    histogram = LatencyHistogram()
+    rng = random.Random(3)
+    users, weights = zip(*USER_REGIONS)
+
+    async def request(i: int):
+        workflow = {
+            "type": "regional",
+            "request_id": str(i),
+            "user_region": rng.choices(users, weights)[0]
+        }
+        start = time.perf_counter()
+        if policy is None:
+            await sim.router.route(
+                workflow, lambda region: sim.serve(workflow, region)
+            )
+        else:
+            await sim.serve(workflow, policy(sim, workflow))
+        histogram.record((time.perf_counter() - start) * 1000)
+
+    requests = []
+    deadline = time.perf_counter() + DURATION_SECONDS
+    i = 0
+    while time.perf_counter() < deadline:
+        requests.append(asyncio.create_task(request(i)))
+        i += 1
+        await asyncio.sleep(rng.expovariate(REQUESTS_PER_SECOND))
+    await asyncio.gather(*requests)
+    await sim.stop()
+    return {
+        "requests": i,
+        "p50": histogram.percentile(0.5),
+        "p99": histogram.percentile(0.99)
+    }
+
+
+async def main():
+    """Run the routing simulation"""
+    logging.disable(logging.WARNING)
+
+    print("🧭 Region Routing Simulation")
+    print("=" * 50)
+    print(f"{REQUESTS_PER_SECOND} req/s for {DURATION_SECONDS:.0f}s, "
+          f"{SERVICE_TIME_SECONDS * 1000:.0f}ms service, traffic "
+          + ", ".join(f"{user} {share:.0%}" for user, share in USER_REGIONS)
+          + f"; {SPIKE_REGION.value} spikes to {SPIKE_RTT_MS:.0f}ms "
+          "mid-run")
+
+    for label, policy in (("static home region", static_policy),
+                          ("lowest latency", fastest_policy),
+                          ("adaptive router", None)):
+        result = await run_policy(policy)
+        print(f"  - {label}: {result['requests']} requests, "
+              f"p50 {result['p50']:.0f}ms, p99 {result['p99']:.0f}ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Worker Pool Benchmark
+Compares sustained ProductionScaler throughput with the shared-queue
+worker pool against the previous LoadBalancer polling workers
+"""
+
+import asyncio
+import logging
+import random
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict
+
+sys.path.append(str(Path(__file__).parent.parent / "workflows"))
+
+from production_scaler import ProductionScaler  # noqa: E402
+
+WORKERS = 10
+WORKFLOWS = 1000
+COST_RANGE_MS = (5, 45)
+
+
+class VariableCostScaler(ProductionScaler):
+    """Scaler whose workflows take a per-workflow simulated time"""
+
+    async def _process_workflow(self, work_item: Dict) -> Dict:
+        await asyncio.sleep(work_item["workflow"]["cost_ms"] / 1000)
+        return {"workflow_id": work_item["id"], "status": "completed"}
+
+
+class LegacyLoadBalancer:
+    """Previous load balancer: O(workers) average on every check"""
+
+    def __init__(self, worker_count: int):
+        self.worker_count = worker_count
+        self.worker_loads = {i: 0.0 for i in range(worker_count)}
+        self.lock = asyncio.Lock()
+
+    def should_worker_process(self, worker_id: int) -> bool:
+        avg_load = sum(self.worker_loads.values()) / self.worker_count
+        return self.worker_loads[worker_id] <= avg_load * 1.2
+
+    async def update_worker_load(self, worker_id: int, processing_time: float):
+        async with self.lock:
+            self.worker_loads[worker_id] = (
+                0.7 * self.worker_loads[worker_id] +
+                0.3 * processing_time
+            )
+
+
+class PollingScaler(VariableCostScaler):
+    """Previous design: workers over the average load sleep 100ms"""
+
+    def __init__(self, worker_count: int):
+        super().__init__(worker_count=worker_count, max_workers=worker_count)
+        self.load_balancer = LegacyLoadBalancer(worker_count)
+
+    def _autoscale(self):
+        pass
+
+    async def _worker_loop(self, worker_id: int):
+        while True:
+            try:
+                if not self.load_balancer.should_worker_process(worker_id):
+                    await asyncio.sleep(0.1)
+                    continue
+
+                work_item = await asyncio.wait_for(
+                    self.work_queue.get(),
+                    timeout=1.0
+                )
+
+                start_time = datetime.now()
+                result = await self._process_workflow(work_item)
+                processing_time = (
+                    (datetime.now() - start_time).total_seconds() * 1000
+                )
+                self.metrics["workflows_processed"] += 1
+                await self.cache.set(work_item["id"], result)
+                self._resolve_workflow(work_item["id"], result=result)
+                await self.load_balancer.update_worker_load(
+                    worker_id, processing_time
+                )
+            except asyncio.TimeoutError:
+                continue
+
+
+async def run_load(scaler: ProductionScaler) -> Dict[str, float]:
+    """Submit a backlog of distinct workflows and wait for all results"""
+    rng = random.Random(7)
+    await scaler.initialize()
+    start = time.perf_counter()
+
+    handles = [
+        await scaler.submit_workflow({
+            "type": "pattern_analysis",
+            "sequence": i,
+            "cost_ms": rng.uniform(*COST_RANGE_MS)
+        })
+        for i in range(WORKFLOWS)
+    ]
+    await asyncio.gather(*handles)
+
+    elapsed = time.perf_counter() - start
+    peak_workers = scaler.next_worker_id
+    await scaler.shutdown()
+    return {
+        "throughput": WORKFLOWS / elapsed,
+        "seconds": elapsed,
+        "workers": peak_workers
+    }
+
+
+async def main():
+    """Run the worker pool benchmark"""
+    logging.disable(logging.INFO)
+
+    print("👷 Worker Pool Benchmark")
+    print("=" * 50)
+    print(f"Workflows: {WORKFLOWS}, cost {COST_RANGE_MS[0]}-"
+          f"{COST_RANGE_MS[1]}ms, base workers: {WORKERS}")
+
+    runs = (
+        ("previous polling", PollingScaler(WORKERS)),
+        ("shared queue", VariableCostScaler(
+            worker_count=WORKERS, max_workers=WORKERS
+        )),
+        ("shared queue + autoscale", VariableCostScaler(
+            worker_count=WORKERS, max_workers=WORKERS * 4,
+            autoscale_interval_seconds=0.25
+        ))
+    )
+
+    results = {}
+    for label, scaler in runs:
+        results[label] = result = await run_load(scaler)
+        print(f"  - {label}: {result['throughput']:.0f} workflows/s, "
+              f"{result['seconds']:.2f}s, workers started "
+              f"{result['workers']}")
+
+    baseline = results["previous polling"]["throughput"]
+    for label in ("shared queue", "shared queue + autoscale"):
+        print(f"  - {label} speedup: "
+              f"{results[label]['throughput'] / baseline:.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
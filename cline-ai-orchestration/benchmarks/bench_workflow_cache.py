@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Workflow Cache Benchmark
+Compares the OrderedDict LRU WorkflowCache with the previous
+min()-scan eviction at the default 10,000-entry capacity
+"""
+
+import asyncio
+import logging
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+
+sys.path.append(str(Path(__file__).parent.parent / "workflows"))
+
+from production_scaler import WorkflowCache  # noqa: E402
+
+CAPACITY = 10000
+OPERATIONS = 50000
+
+
+class LegacyWorkflowCache:
+    """Previous implementation: global lock and O(n) eviction scan"""
+
+    def __init__(self, max_size: int = 10000):
+        self.max_size = max_size
+        self.cache = {}
+        self.access_times = {}
+        self.lock = asyncio.Lock()
+
+    async def get(self, key: str) -> Optional[Dict]:
+        async with self.lock:
+            if key in self.cache:
+                self.access_times[key] = datetime.now()
+                return self.cache[key]
+        return None
+
+    async def set(self, key: str, value: Dict):
+        async with self.lock:
+            if len(self.cache) >= self.max_size:
+                oldest_key = min(
+                    self.access_times.items(),
+                    key=lambda x: x[1]
+                )[0]
+                del self.cache[oldest_key]
+                del self.access_times[oldest_key]
+
+            self.cache[key] = value
+            self.access_times[key] = datetime.now()
+
+
+def make_result(i: int) -> Dict:
+    """Workflow result shaped like ProductionScaler output"""
+    return {
+        "workflow_id": f"wf_{i:016d}",
+        "status": "completed",
+        "processed_at": datetime.now().isoformat(),
+        "results": {
+            "patterns_detected": 3,
+            "interventions_triggered": 2,
+            "force_multiplication": 81
+        }
+    }
+
+
+async def bench(cache) -> Dict[str, float]:
+    """Time full-cache inserts (evicting) and lookups"""
+    for i in range(CAPACITY):
+        await cache.set(f"warm_{i}", make_result(i))
+
+    results = [make_result(i) for i in range(OPERATIONS)]
+    start = time.perf_counter()
+    for i, result in enumerate(results):
+        await cache.set(f"key_{i}", result)
+    insert_us = (time.perf_counter() - start) / OPERATIONS * 1e6
+
+    start = time.perf_counter()
+    for i in range(OPERATIONS):
+        await cache.get(f"key_{OPERATIONS - 1 - i % CAPACITY}")
+    get_us = (time.perf_counter() - start) / OPERATIONS * 1e6
+
+    return {"insert_us": insert_us, "get_us": get_us}
+
+
+async def main():
+    """Run the cache benchmark"""
+    logging.disable(logging.INFO)
+
+    print("🗄️ Workflow Cache Benchmark")
+    print("=" * 50)
+    print(f"Capacity: {CAPACITY}, operations: {OPERATIONS}")
+
+    legacy = await bench(LegacyWorkflowCache(max_size=CAPACITY))
+    current = WorkflowCache(max_size=CAPACITY)
+    lru = await bench(current)
+
+    for label, result in (("previous", legacy), ("LRU", lru)):
+        print(f"  - {label}: insert with eviction "
+              f"{result['insert_us']:.2f}us, get {result['get_us']:.2f}us")
+
+    print(f"  - eviction speedup: "
+          f"{legacy['insert_us'] / lru['insert_us']:.0f}x")
+    print(f"  - LRU stats: {current.get_stats()}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Workflow Hashing Microbenchmark
+Compares sort_keys JSON + SHA-256 workflow IDs with the streaming
+canonical hasher for payloads from 1KB to 1MB
+"""
+
+import hashlib
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict
+
+sys.path.append(str(Path(__file__).parent.parent / "workflows"))
+
+from canonical_hash import CanonicalHasher, xxhash  # noqa: E402
+
+SIZES = (1024, 16 * 1024, 256 * 1024, 1024 * 1024)
+TARGET_SECONDS = 1.0
+
+
+def legacy_workflow_id(workflow: Dict) -> str:
+    """Previous ID: sort_keys JSON dump, SHA-256, truncated hex"""
+    workflow_str = json.dumps(workflow, sort_keys=True)
+    return hashlib.sha256(workflow_str.encode()).hexdigest()[:16]
+
+
+def dashboard_workflow(size: int) -> Dict:
+    """Monitoring workflow shaped like a dashboard snapshot"""
+    streams = {}
+    encoded_size = 0
+    while encoded_size < size:
+        i = len(streams)
+        streams[f"stream_{i}"] = entry = {
+            "status": "active",
+            "events_processed": i * 7,
+            "last_event": 1_750_000_000.0 + i,
+            "alerts": [f"alert_{i}"] if i % 5 == 0 else [],
+            "version": i
+        }
+        encoded_size += len(json.dumps(entry)) + len(f"stream_{i}") + 4
+    return {
+        "type": "monitoring_analysis",
+        "data": {"version": 1, "streams": streams},
+        "timestamp": "2025-06-15T12:00:00"
+    }
+
+
+def text_workflow(size: int) -> Dict:
+    """Interaction workflow dominated by one large text field"""
+    line = "Shared the weekly update with the team, waiting on review.\n"
+    return {
+        "type": "user_interaction_analysis",
+        "user_id": "user_1",
+        "interaction": {"content": line * (size // len(line) + 1)}
+    }
+
+
+def time_per_call(function: Callable, workflow: Dict) -> float:
+    """Mean microseconds per call over ~TARGET_SECONDS"""
+    function(workflow)
+    calls = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < TARGET_SECONDS:
+        function(workflow)
+        calls += 1
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def main():
+    """Run the hashing microbenchmark"""
+    print("#️⃣ Workflow Hashing Microbenchmark")
+    print("=" * 50)
+
+    hashers = {
+        "json+sha256": legacy_workflow_id,
+        "canonical blake2b": CanonicalHasher(algorithm="blake2b"),
+        "canonical sha256": CanonicalHasher(algorithm="sha256"),
+    }
+    if xxhash is not None:
+        hashers["canonical xxh3"] = CanonicalHasher(algorithm="xxh3_64")
+    else:
+        print("  (xxhash not installed; skipping xxh3)")
+
+    for shape, build in (("dashboard", dashboard_workflow),
+                         ("text", text_workflow)):
+        print(f"\n{shape} payloads:")
+        for size in SIZES:
+            workflow = build(size)
+            timings = {
+                name: time_per_call(function, workflow)
+                for name, function in hashers.items()
+            }
+            baseline = timings["json+sha256"]
+            cells = ", ".join(
+                f"{name} {us:.1f}us ({baseline / us:.1f}x)"
+                for name, us in timings.items()
+            )
+            print(f"  - {size // 1024}KB: {cells}")
+
+    print("\nidempotency key: hashing skipped (0us)")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,24 +6,287 @@ Aligned with Cline AI Service API Specification
 
 import json
 import asyncio
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 import aiohttp
 
+logger = logging.getLogger(__name__)
+
+# Feedback entries kept on disk
+FEEDBACK_RETENTION = 1000
+# The log is compacted back to the retention once it grows past this
+# multiple of it, so each entry is rewritten at most once per cycle
+COMPACTION_FACTOR = 2
+FLUSH_BATCH_SIZE = 64
+FLUSH_INTERVAL_SECONDS = 0.5
+
+
+@dataclass(frozen=True)
+class FeedbackCursor:
+    """Position of an incremental reader in the feedback log
+
+    ``first_seq`` is the seq of the log's first line, which changes on
+    every compaction even when the new file reuses an old inode.
+    """
+    inode: int = 0
+    first_seq: int = 0
+    offset: int = 0
+    seq: int = 0
+
+
+class FeedbackLog:
+    """Append-only JSONL feedback store with batched background writes
+
+    Appends are buffered and written in batches on a single writer
+    thread, which owns the file and also compacts it: once it holds
+    ``retention * COMPACTION_FACTOR`` entries, the newest ``retention``
+    are written to a new file that atomically replaces the log. Every
+    entry carries an increasing ``seq`` so readers can resume from a
+    cursor across compactions.
+
+    A line torn by a crash mid-append is cut off when the writer first
+    opens the log, and unreadable lines are skipped by readers. Entries
+    from a ``legacy_path`` JSON array store are imported once, when the
+    log does not exist yet.
+    """
+
+    def __init__(self, path: Path, retention: int = FEEDBACK_RETENTION,
+                 batch_size: int = FLUSH_BATCH_SIZE,
+                 flush_interval: float = FLUSH_INTERVAL_SECONDS,
+                 legacy_path: Optional[Path] = None):
+        self.path = Path(path)
+        self.legacy_path = legacy_path
+        self.retention = retention
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.pending: List[Dict] = []
+        self.flush_timer: Optional[asyncio.Task] = None
+        self.flushes: set = set()
+        self.writer = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="feedback-log"
+        )
+        # Owned by the writer thread, recovered from disk on first write
+        self.line_count: Optional[int] = None
+        self.next_seq = 0
+        self.compactions = 0
+
+    async def append(self, entry: Dict):
+        """Queue an entry, flushing once a batch is full"""
+        self.pending.append(entry)
+        if len(self.pending) >= self.batch_size:
+            self._start_flush()
+        elif self.flush_timer is None:
+            self.flush_timer = asyncio.create_task(self._flush_later())
+
+    async def flush(self):
+        """Write everything queued so far"""
+        self._start_flush()
+        if self.flushes:
+            await asyncio.gather(*self.flushes)
+
+    async def close(self):
+        """Flush and stop the writer thread"""
+        await self.flush()
+        self.writer.shutdown(wait=True)
+
+    async def _flush_later(self):
+        await asyncio.sleep(self.flush_interval)
+        self.flush_timer = None
+        self._start_flush()
+
+    def _start_flush(self):
+        if self.flush_timer is not None:
+            self.flush_timer.cancel()
+            self.flush_timer = None
+        if not self.pending:
+            return
+        batch, self.pending = self.pending, []
+        flush = asyncio.ensure_future(
+            asyncio.get_running_loop().run_in_executor(
+                self.writer, self._write, batch
+            )
+        )
+        self.flushes.add(flush)
+        flush.add_done_callback(self.flushes.discard)
+        flush.add_done_callback(
+            lambda done: self._flush_finished(done, len(batch))
+        )
+
+    @staticmethod
+    def _flush_finished(flush: asyncio.Future, entries: int):
+        """Log a failed batch write; nothing else may await it"""
+        if not flush.cancelled() and flush.exception() is not None:
+            logger.error(
+                f"Failed to store {entries} feedback entries: "
+                f"{flush.exception()}"
+            )
+
+    def _write(self, batch: List[Dict]):
+        """Append a batch on the writer thread, compacting when due"""
+        if self.line_count is None:
+            self._recover()
+
+        lines = []
+        for entry in batch:
+            self.next_seq += 1
+            lines.append(json.dumps({"seq": self.next_seq, **entry}))
+        with open(self.path, "a") as f:
+            f.write("\n".join(lines) + "\n")
+        self.line_count += len(lines)
+
+        if self.line_count >= self.retention * COMPACTION_FACTOR:
+            self._compact()
+
+    def _recover(self):
+        """Count stored entries and resume the sequence"""
+        if not self.path.exists():
+            self.line_count = 0
+            self._import_legacy()
+            return
+
+        with open(self.path, "rb+") as f:
+            data = f.read()
+            complete = data.rfind(b"\n") + 1
+            if complete < len(data):
+                # Cut a line torn by an interrupted append
+                logger.warning(
+                    f"Discarding incomplete last line of {self.path}"
+                )
+                f.truncate(complete)
+
+        entries = self._parse_lines(data[:complete].splitlines())
+        self.next_seq = max((entry["seq"] for entry in entries), default=0)
+        self.line_count = len(entries)
+
+    def _import_legacy(self):
+        """Seed a new log from the previous JSON array store"""
+        if self.legacy_path is None or not self.legacy_path.exists():
+            return
+        try:
+            with open(self.legacy_path) as f:
+                entries = json.load(f)
+        except ValueError as e:
+            logger.error(f"Cannot import {self.legacy_path}: {e}")
+            return
+        if entries:
+            self._write(entries[-self.retention:])
+            logger.info(
+                f"Imported {self.line_count} feedback entries from "
+                f"{self.legacy_path}"
+            )
+
+    def _parse_lines(self, lines: List[bytes]) -> List[Dict]:
+        """Decode log lines, skipping any that are unreadable"""
+        entries = []
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                entry = None
+            if not isinstance(entry, dict) or "seq" not in entry:
+                logger.warning(f"Skipping unreadable line in {self.path}")
+                continue
+            entries.append(entry)
+        return entries
+
+    def _compact(self):
+        """Rewrite the log keeping only the newest entries"""
+        with open(self.path, "rb") as f:
+            lines = f.read().splitlines()
+        kept = [
+            json.dumps(entry) + "\n"
+            for entry in self._parse_lines(lines)[-self.retention:]
+        ]
+        temp_path = self.path.with_suffix(".compacting")
+        with open(temp_path, "w") as f:
+            f.writelines(kept)
+        os.replace(temp_path, self.path)
+        self.line_count = len(kept)
+        self.compactions += 1
+
+    def read_since(self, cursor: FeedbackCursor
+                   ) -> Tuple[List[Dict], FeedbackCursor]:
+        """Entries written after a cursor, and the cursor past them
+
+        Only bytes appended since the cursor are read. When the file is
+        not the one the cursor was taken from (a different inode or
+        first line, or shorter than the offset), it is rescanned and
+        entries the reader has already seen are skipped by ``seq``.
+        The read is
+        synchronous; with a cursor kept between calls it only covers
+        entries appended since the previous one.
+        """
+        if not self.path.exists():
+            return [], cursor
+
+        with open(self.path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            first_seq = self._first_seq(f.readline())
+            same_file = (stat.st_ino == cursor.inode and
+                         first_seq == cursor.first_seq and
+                         cursor.offset <= stat.st_size)
+            offset = cursor.offset if same_file else 0
+            f.seek(offset)
+            data = f.read()
+
+        # Leave a line the writer is still appending for the next read
+        complete = data[:data.rfind(b"\n") + 1]
+        entries = []
+        seq = cursor.seq
+        for entry in self._parse_lines(complete.splitlines()):
+            if entry["seq"] > seq:
+                entries.append(entry)
+                seq = entry["seq"]
+        return entries, FeedbackCursor(
+            stat.st_ino, first_seq, offset + len(complete), seq
+        )
+
+    @staticmethod
+    def _first_seq(line: bytes) -> int:
+        """seq of the log's first line, 0 if it is not complete yet"""
+        if not line.endswith(b"\n"):
+            return 0
+        try:
+            return json.loads(line)["seq"]
+        except (ValueError, TypeError, KeyError):
+            return 0
+
 
 class FeedbackCollector:
     """Collects and processes feedback for continuous improvement"""
 
-    def __init__(self, api_base_url: str = "http://localhost:8000"):
+    def __init__(self, api_base_url: str = "http://localhost:8000",
+                 feedback_store: Optional[str] = None):
         self.api_base_url = api_base_url
-        self.feedback_store = Path(__file__).parent / "feedback_data.json"
+        self.feedback_store = Path(
+            feedback_store or Path(__file__).parent / "feedback_data.jsonl"
+        )
+        # History kept by the previous JSON array store is imported
+        self.feedback_log = FeedbackLog(
+            self.feedback_store,
+            legacy_path=self.feedback_store.with_suffix(".json")
+        )
         self.metrics = {
             "feedback_collected": 0,
             "patterns_identified": 0,
             "strategic_recommendations": 0,
             "force_multiplication_achieved": 0.0
         }
+        # Running totals over the stored feedback read so far
+        self.report_cursor = FeedbackCursor()
+        self.history_totals = {
+            "entries": 0,
+            "impact_score": 0.0,
+            "time_saved_hours": 0.0,
+            "users_impacted": 0
+        }
 
     async def collect_intervention_feedback(
             self,
@@ -141,20 +404,33 @@ class FeedbackCollector:
 
     async def _store_feedback(self, feedback: Dict):
         """Store feedback data for analysis"""
-        existing_data = []
-
-        if self.feedback_store.exists():
-            with open(self.feedback_store, 'r') as f:
-                existing_data = json.load(f)
+        await self.feedback_log.append(feedback)
 
-        existing_data.append(feedback)
+    async def shutdown(self):
+        """Write any buffered feedback and stop the store"""
+        await self.feedback_log.close()
 
-        # Keep only last 1000 feedback entries
-        if len(existing_data) > 1000:
-            existing_data = existing_data[-1000:]
+    def _refresh_history_totals(self) -> Dict:
+        """Fold feedback stored since the last report into the totals"""
+        entries, self.report_cursor = self.feedback_log.read_since(
+            self.report_cursor
+        )
+        totals = self.history_totals
+        for entry in entries:
+            impact = entry.get("calculated_impact", {})
+            totals["entries"] += 1
+            totals["impact_score"] += impact.get("overall_impact_score", 0)
+            totals["time_saved_hours"] += impact.get("time_saved_hours", 0)
+            totals["users_impacted"] += impact.get("users_impacted", 0)
 
-        with open(self.feedback_store, 'w') as f:
-            json.dump(existing_data, f, indent=2)
+        return {
+            "feedback_analyzed": totals["entries"],
+            "average_impact_score": (
+                totals["impact_score"] / max(1, totals["entries"])
+            ),
+            "total_time_saved_hours": totals["time_saved_hours"],
+            "total_users_impacted": totals["users_impacted"]
+        }
 
     async def generate_feedback_prompt(
             self, context_id: Optional[str] = None) -> Dict:
@@ -220,6 +496,7 @@ class FeedbackCollector:
                     self.metrics["force_multiplication_achieved"],
                 "feedback_quality_score": self._calculate_feedback_quality()
             },
+            "feedback_history": self._refresh_history_totals(),
             "improvements_identified": [
                 {
                     "area": "Pattern Recognition Accuracy",
@@ -281,11 +558,14 @@ async def main():
     print("\nGenerated feedback prompt:")
     print(json.dumps(prompt, indent=2))
 
-    # Generate Week 1 report
+    # Generate Week 1 report from the stored feedback
+    await collector.feedback_log.flush()
     report = collector.generate_week1_feedback_report()
     print("\nWeek 1 Feedback Report:")
     print(json.dumps(report, indent=2))
 
+    await collector.shutdown()
+
 
 if __name__ == "__main__":
     asyncio.run(main())
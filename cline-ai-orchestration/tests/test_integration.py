@@ -7,6 +7,7 @@ Tests Week 1 deliverables and quantifiable impacts
 import asyncio
 import json
 import sys
+import tempfile
 import unittest
 from datetime import datetime
 from pathlib import Path
@@ -16,7 +17,9 @@ from unittest.mock import patch
 sys.path.append(str(Path(__file__).parent.parent))
 
 from workflows.orchestrator import ClineAIOrchestrator  # noqa: E402
-from feedback.feedback_collector import FeedbackCollector  # noqa: E402
+from feedback.feedback_collector import (  # noqa: E402
+    FeedbackCollector, FeedbackCursor, FeedbackLog
+)
 
 
 class TestOrchestrationIntegration(unittest.TestCase):
@@ -258,6 +261,178 @@ class TestWeek1Deliverables(unittest.TestCase):
         )
 
 
+class TestFeedbackStore(unittest.TestCase):
+    """Test the append-only feedback store"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.store_path = Path(self.temp_dir.name) / "feedback.jsonl"
+
+    def feedback(self, i: int) -> dict:
+        return {
+            "intervention_id": f"INT-{i}",
+            "calculated_impact": {
+                "overall_impact_score": 0.5,
+                "time_saved_hours": 1.0,
+                "users_impacted": 2
+            }
+        }
+
+    def test_batched_flushes_and_incremental_report(self):
+        """Feedback is written in batches and reported incrementally"""
+        collector = FeedbackCollector(feedback_store=str(self.store_path))
+        log = collector.feedback_log
+        log.batch_size = 4
+
+        async def run():
+            for i in range(6):
+                await collector._store_feedback(self.feedback(i))
+            # One full batch is on its way, the rest waits for the timer
+            await asyncio.gather(*log.flushes)
+            self.assertEqual(len(self.store_path.read_text().splitlines()), 4)
+            self.assertEqual(len(log.pending), 2)
+
+            first = collector.generate_week1_feedback_report()
+            await log.flush()
+            second = collector.generate_week1_feedback_report()
+            await collector.shutdown()
+            return first, second
+
+        first, second = asyncio.run(run())
+        self.assertEqual(first["feedback_history"]["feedback_analyzed"], 4)
+        history = second["feedback_history"]
+        self.assertEqual(history["feedback_analyzed"], 6)
+        self.assertAlmostEqual(history["average_impact_score"], 0.5)
+        self.assertAlmostEqual(history["total_time_saved_hours"], 6.0)
+        self.assertEqual(history["total_users_impacted"], 12)
+
+    def test_compaction_keeps_retention_and_cursor(self):
+        """Compaction trims the log without re-reporting entries"""
+        collector = FeedbackCollector(feedback_store=str(self.store_path))
+        log = collector.feedback_log
+        log.retention = 5
+        log.batch_size = 3
+
+        async def run():
+            for i in range(3):
+                await collector._store_feedback(self.feedback(i))
+            await log.flush()
+            collector.generate_week1_feedback_report()
+            for i in range(3, 12):
+                await collector._store_feedback(self.feedback(i))
+            await collector.shutdown()
+            return collector.generate_week1_feedback_report()
+
+        report = asyncio.run(run())
+        stored = [
+            json.loads(line)
+            for line in self.store_path.read_text().splitlines()
+        ]
+        self.assertGreater(log.compactions, 0)
+        self.assertLess(len(stored), log.retention * 2)
+        self.assertEqual(stored[-1]["intervention_id"], "INT-11")
+        self.assertEqual([e["seq"] for e in stored],
+                         list(range(13 - len(stored), 13)))
+        # Already reported entries are not counted again after compaction
+        self.assertEqual(
+            report["feedback_history"]["feedback_analyzed"], 3 + len(stored)
+        )
+
+        # A new collector resumes the sequence from the stored log
+        reopened = FeedbackCollector(feedback_store=str(self.store_path))
+
+        async def append_one():
+            await reopened._store_feedback(self.feedback(12))
+            await reopened.shutdown()
+
+        asyncio.run(append_one())
+        last = self.store_path.read_text().splitlines()[-1]
+        self.assertEqual(json.loads(last)["seq"], 13)
+
+    def test_cursor_survives_two_compactions(self):
+        """A cursor is not trusted after the log was replaced twice"""
+        log = FeedbackLog(self.store_path, retention=10, batch_size=1)
+
+        async def run():
+            for i in range(12):
+                await log.append(self.feedback(i))
+            await log.flush()
+            first, cursor = log.read_since(FeedbackCursor())
+            for i in range(12, 32):
+                await log.append(self.feedback(i))
+            await log.close()
+            second, _ = log.read_since(cursor)
+            return first, second
+
+        first, second = asyncio.run(run())
+        stored = [
+            json.loads(line)["seq"]
+            for line in self.store_path.read_text().splitlines()
+        ]
+        self.assertEqual(log.compactions, 2)
+        self.assertEqual(len(first), 12)
+        self.assertEqual([e["seq"] for e in second], stored)
+        self.assertEqual(stored, list(range(21, 33)))
+
+    def test_torn_last_line_is_discarded(self):
+        """A crash mid-append leaves the log readable and writable"""
+        self.store_path.write_text(
+            json.dumps({"seq": 1, **self.feedback(1)}) + "\n" +
+            '{"seq": 2, "intervention_id": "INT-'
+        )
+        collector = FeedbackCollector(feedback_store=str(self.store_path))
+
+        async def append_one():
+            await collector._store_feedback(self.feedback(2))
+            await collector.shutdown()
+
+        with self.assertLogs("feedback.feedback_collector", "WARNING"):
+            asyncio.run(append_one())
+        stored = [
+            json.loads(line)
+            for line in self.store_path.read_text().splitlines()
+        ]
+        self.assertEqual([e["seq"] for e in stored], [1, 2])
+        self.assertEqual(stored[1]["intervention_id"], "INT-2")
+        report = collector.generate_week1_feedback_report()
+        self.assertEqual(report["feedback_history"]["feedback_analyzed"], 2)
+
+    def test_legacy_json_history_is_imported(self):
+        """Entries from the previous JSON array store carry over"""
+        legacy = [self.feedback(i) for i in range(3)]
+        self.store_path.with_suffix(".json").write_text(json.dumps(legacy))
+        collector = FeedbackCollector(feedback_store=str(self.store_path))
+
+        async def append_one():
+            await collector._store_feedback(self.feedback(3))
+            await collector.shutdown()
+
+        asyncio.run(append_one())
+        report = collector.generate_week1_feedback_report()
+        self.assertEqual(report["feedback_history"]["feedback_analyzed"], 4)
+
+    def test_failed_flush_is_logged(self):
+        """Background write failures are reported, not swallowed"""
+        missing_dir = Path(self.temp_dir.name) / "missing"
+        collector = FeedbackCollector(
+            feedback_store=str(missing_dir / "feedback.jsonl")
+        )
+        collector.feedback_log.batch_size = 1
+
+        async def append_one():
+            await collector._store_feedback(self.feedback(0))
+            await asyncio.gather(
+                *collector.feedback_log.flushes, return_exceptions=True
+            )
+            await asyncio.sleep(0)
+            await collector.shutdown()
+
+        with self.assertLogs("feedback.feedback_collector", "ERROR") as logs:
+            asyncio.run(append_one())
+        self.assertIn("Failed to store 1 feedback entries", logs.output[0])
+
+
 def run_async_test(coro):
     """Helper to run async tests"""
     loop = asyncio.get_event_loop()
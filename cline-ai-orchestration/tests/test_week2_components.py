@@ -0,0 +1,764 @@
+#!/usr/bin/env python3
+"""
+Component Test Suite for Cline AI Orchestration Week 2 Systems
+Tests pattern recognition, real-time monitoring and production scaling
+"""
+
+import asyncio
+import json
+import sys
+import time
+import tracemalloc
+import unittest
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import Dict
+
+# Week 2 modules import their siblings directly
+sys.path.append(str(Path(__file__).parent.parent / "workflows"))
+
+import canonical_hash  # noqa: E402
+from canonical_hash import CanonicalHasher  # noqa: E402
+from latency_histogram import LatencyHistogram  # noqa: E402
+from pattern_recognition_engine import (  # noqa: E402
+    InterventionQueue, PatternRecognitionEngine, PatternResultCache,
+    UserStateStore
+)
+from production_scaler import (  # noqa: E402
+    ProductionScaler, WorkflowCache, _encode_payload
+)
+from realtime_monitor import (  # noqa: E402
+    RealtimeMonitor, create_monitoring_system
+)
+
+HOUR = 3600
+DAY = 86400
+BASE_TIME = 1_750_000_000.0
+
+
+class TestUserStateStore(unittest.TestCase):
+    """Test per-user sliding-window state"""
+
+    def test_memory_budget(self):
+        """Per-user footprint stays within the documented budget"""
+        store = UserStateStore()
+        self.assertEqual(store.memory_budget_bytes(), 512 * 1_000_000)
+
+        user_count = 20000
+        tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+        for i in range(user_count):
+            store.observe(f"user_{i:07d}", BASE_TIME, {})
+        used = tracemalloc.get_traced_memory()[0] - baseline
+        tracemalloc.stop()
+
+        self.assertLessEqual(
+            used / user_count, UserStateStore.BYTES_PER_USER
+        )
+
+    def test_capacity_eviction(self):
+        """Least recently seen users are evicted at capacity"""
+        store = UserStateStore(max_users=3)
+        for i in range(5):
+            store.observe(f"user_{i}", BASE_TIME + i, {})
+
+        self.assertEqual(len(store), 3)
+        self.assertEqual(store.evictions, 2)
+        self.assertNotIn("user_0", store.states)
+        self.assertIn("user_4", store.states)
+
+    def test_idle_ttl_eviction(self):
+        """Idle users are evicted once their TTL passes"""
+        store = UserStateStore(idle_ttl_seconds=DAY)
+        store.observe("idle_user", BASE_TIME, {})
+        store.observe("busy_user", BASE_TIME + 2 * DAY, {})
+
+        self.assertNotIn("idle_user", store.states)
+        self.assertIn("busy_user", store.states)
+
+    def test_temporal_indicators(self):
+        """Indicators are derived from the user's event history"""
+        store = UserStateStore()
+
+        self.assertEqual(store.observe("u1", BASE_TIME, {}), [])
+        self.assertIn(
+            "no_response_48h", store.observe("u1", BASE_TIME + 49 * HOUR)
+        )
+
+        for i in range(2):
+            store.observe("u2", BASE_TIME + i, {"response_time_hours": 30})
+        self.assertIn(
+            "delayed_replies",
+            store.observe("u2", BASE_TIME + 2, {"response_time_hours": 30})
+        )
+
+        self.assertIn(
+            "overtime", store.observe("u2", BASE_TIME + 13 * HOUR)
+        )
+
+    def test_participation_drop(self):
+        """A week-over-week activity drop raises silent_in_chat"""
+        store = UserStateStore()
+        for day in range(7):
+            store.observe("u1", BASE_TIME + day * DAY)
+            store.observe("u1", BASE_TIME + day * DAY + HOUR)
+
+        indicators = store.observe("u1", BASE_TIME + 12 * DAY)
+        self.assertIn("silent_in_chat", indicators)
+
+    def test_engine_uses_history(self):
+        """The engine surfaces temporal indicators as features"""
+        engine = PatternRecognitionEngine()
+        engine._extract_features(
+            {"user_id": "u1", "timestamp": "2025-06-01T09:00:00"}
+        )
+        features = engine._extract_features(
+            {"user_id": "u1", "timestamp": "2025-06-04T09:00:00"}
+        )
+
+        self.assertIn("no_response_48h", features["indicators"])
+        metrics = engine.get_performance_metrics()
+        self.assertEqual(metrics["tracked_users"], 1)
+
+
+class TestPatternResultCache(unittest.TestCase):
+    """Test pattern result caching"""
+
+    def test_repeated_content_hits_cache(self):
+        """Identical templated content is analyzed once"""
+        engine = PatternRecognitionEngine()
+        message = {
+            "content": "I'm so exhausted,  working another weekend",
+            "metadata": {"weekend_activity": True}
+        }
+
+        first = asyncio.run(engine.analyze_interaction_stream(
+            dict(message, user_id="bot_1")
+        ))
+        second = asyncio.run(engine.analyze_interaction_stream(
+            dict(message, user_id="bot_2",
+                 content=message["content"].upper())
+        ))
+
+        self.assertEqual(
+            [p["pattern_id"] for p in first],
+            [p["pattern_id"] for p in second]
+        )
+        metrics = engine.get_performance_metrics()
+        self.assertEqual(metrics["cache_hits"], 1)
+        self.assertEqual(metrics["cache_misses"], 1)
+
+    def test_lru_and_ttl_eviction(self):
+        """Entries are evicted by capacity and expiry"""
+        cache = PatternResultCache(ttl_seconds=60, max_entries=2)
+        cache.set("a", [])
+        cache.set("b", [])
+        cache.get("a")
+        cache.set("c", [])
+
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), [])
+        self.assertEqual(cache.evictions, 1)
+
+        cache.entries["a"] = (time.monotonic() - 1, [])
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.evictions, 2)
+
+
+def make_pattern(pattern_id: str, category: str, risk_score: float) -> Dict:
+    """Build a detected pattern for queue tests"""
+    return {
+        "pattern_id": pattern_id,
+        "pattern_name": pattern_id,
+        "category": category,
+        "risk_score": risk_score
+    }
+
+
+class TestInterventionQueue(unittest.TestCase):
+    """Test prioritized, deduplicated intervention queueing"""
+
+    def test_crisis_first_then_risk(self):
+        """Crisis interventions drain before higher-risk burnout"""
+        queue = InterventionQueue()
+        queue.put("u1", make_pattern("burnout_01", "burnout_patterns", 0.99))
+        queue.put("u2", make_pattern("crisis_01", "crisis_patterns", 0.86))
+        queue.put("u3", make_pattern("crisis_02", "crisis_patterns", 0.95))
+
+        batch = queue.pop_batch(10)
+        self.assertEqual(
+            [i["pattern"]["pattern_id"] for i in batch],
+            ["crisis_02", "crisis_01", "burnout_01"]
+        )
+
+    def test_duplicates_coalesce(self):
+        """Repeated (user, pattern) detections trigger one intervention"""
+        queue = InterventionQueue(coalesce_window_seconds=60)
+        pattern = make_pattern("crisis_01", "crisis_patterns", 0.9)
+
+        queued = [queue.put("u1", pattern) for _ in range(10)]
+        self.assertEqual(queued.count(True), 1)
+
+        batch = queue.pop_batch(10)
+        self.assertEqual(len(batch), 1)
+        self.assertEqual(batch[0]["occurrences"], 10)
+
+        # Still suppressed after dispatch within the window
+        self.assertFalse(queue.put("u1", pattern))
+        self.assertEqual(queue.coalesced, 10)
+
+    def test_bounded_with_batches(self):
+        """Full queues drop the lowest priority; drains are batched"""
+        queue = InterventionQueue(max_size=2)
+        queue.put("u1", make_pattern("burnout_01", "burnout_patterns", 0.9))
+        queue.put("u2", make_pattern("burnout_01", "burnout_patterns", 0.95))
+        queue.put("u3", make_pattern("crisis_01", "crisis_patterns", 0.9))
+
+        self.assertEqual(len(queue), 2)
+        self.assertEqual(queue.dropped, 1)
+        self.assertEqual(len(queue.pop_batch(1)), 1)
+        self.assertEqual(queue.get_stats()["depth"], 1)
+
+    def test_anonymous_detections_never_coalesce(self):
+        """Detections without a user are each queued and never suppressed"""
+        queue = InterventionQueue(coalesce_window_seconds=60)
+        pattern = make_pattern("crisis_01", "crisis_patterns", 0.9)
+
+        self.assertTrue(queue.put(None, pattern))
+        self.assertTrue(queue.put(None, pattern))
+        self.assertEqual(len(queue.pop_batch(10)), 2)
+        self.assertTrue(queue.put(None, pattern))
+        self.assertEqual(queue.coalesced, 0)
+
+    def test_full_queue_evicts_worst_live_entry(self):
+        """Eviction skips superseded entries and drops the lowest priority"""
+        queue = InterventionQueue(max_size=3)
+        queue.put("u1", make_pattern("burnout_01", "burnout_patterns", 0.5))
+        queue.put("u2", make_pattern("burnout_01", "burnout_patterns", 0.6))
+        queue.put("u3", make_pattern("crisis_01", "crisis_patterns", 0.9))
+        # Supersede u1's entry; its old heap items are now stale
+        queue.put("u1", make_pattern("burnout_01", "burnout_patterns", 0.8))
+
+        self.assertTrue(
+            queue.put("u4", make_pattern("crisis_02", "crisis_patterns", 0.9))
+        )
+        self.assertFalse(
+            queue.put("u5", make_pattern("burnout_02", "burnout_patterns",
+                                         0.7))
+        )
+        self.assertEqual(queue.dropped, 2)
+
+        batch = queue.pop_batch(10)
+        self.assertEqual(
+            [(i["user_id"], i["pattern"]["risk_score"]) for i in batch],
+            [("u3", 0.9), ("u4", 0.9), ("u1", 0.8)]
+        )
+
+    def test_engine_deduplicates_distressed_user(self):
+        """Ten distressed messages from one user yield one intervention"""
+        engine = PatternRecognitionEngine()
+
+        async def scenario():
+            for _ in range(10):
+                await engine._queue_interventions(
+                    [make_pattern("crisis_01", "crisis_patterns", 0.95)],
+                    "user_001"
+                )
+            return await engine.process_intervention_queue()
+
+        interventions = asyncio.run(scenario())
+        self.assertEqual(len(interventions), 1)
+        self.assertEqual(engine.metrics["interventions_triggered"], 1)
+        stats = engine.get_performance_metrics()["intervention_queue"]
+        self.assertNotEqual(stats["time_to_intervention_p99_ms"], "N/A")
+
+
+class TestRealtimeMonitor(unittest.TestCase):
+    """Test the real-time monitor event path"""
+
+    def test_batch_generates_alerts(self):
+        """Batched events run every handler and report alerts"""
+        async def scenario():
+            monitor = await create_monitoring_system()
+            await monitor.register_stream("s1", {})
+            return monitor, await monitor.process_events_batch([
+                ("s1", {"type": "pattern_detected", "payload": {
+                    "risk_score": 0.95, "indicators": ["help"]
+                }}),
+                ("missing", {"type": "pattern_detected"})
+            ])
+
+        monitor, results = asyncio.run(scenario())
+        self.assertEqual(
+            sorted(alert["type"] for alert in results[0]["alerts"]),
+            ["burnout_risk", "crisis_alert"]
+        )
+        self.assertEqual(results[1]["status"], "error")
+        self.assertEqual(monitor.metrics["alerts_generated"], 2)
+
+    def test_handlers_run_concurrently_with_timeout(self):
+        """Suspending handlers overlap and slow ones are cancelled"""
+        monitor = RealtimeMonitor(handler_timeout_seconds=0.2)
+
+        async def slow_alert(stream_id, payload):
+            await asyncio.sleep(0.05)
+            return {"alert": True, "type": "slow"}
+
+        async def stuck(stream_id, payload):
+            await asyncio.sleep(10)
+
+        for handler in (slow_alert, slow_alert, stuck):
+            monitor.register_event_handler("check", handler)
+
+        async def scenario():
+            await monitor.register_stream("s1", {})
+            start = time.perf_counter()
+            result = await monitor.process_event("s1", {"type": "check"})
+            return result, time.perf_counter() - start
+
+        result, elapsed = asyncio.run(scenario())
+        self.assertEqual(len(result["alerts"]), 2)
+        self.assertLess(elapsed, 1.0)
+
+    def test_handler_timeouts_stay_in_handler_task(self):
+        """A handler's own timeout never cancels the caller"""
+        monitor = RealtimeMonitor()
+
+        async def guarded(stream_id, payload):
+            try:
+                async with asyncio.timeout(0.01):
+                    await asyncio.sleep(0.5)
+            except TimeoutError:
+                return {"alert": True, "type": "timed_out"}
+
+        monitor.register_event_handler("check", guarded)
+
+        async def scenario():
+            await monitor.register_stream("s1", {})
+            result = await monitor.process_event("s1", {"type": "check"})
+            return result, asyncio.current_task().cancelling()
+
+        result, cancelling = asyncio.run(scenario())
+        self.assertEqual(result["alerts"][0]["type"], "timed_out")
+        self.assertEqual(cancelling, 0)
+
+    def test_running_latency_average(self):
+        """The running sum tracks the buffer mean"""
+        monitor = RealtimeMonitor()
+        monitor.latency_buffer = deque(maxlen=3)
+        for latency in (1.0, 2.0, 3.0, 10.0):
+            monitor._record_latency(latency)
+
+        self.assertAlmostEqual(monitor.metrics["avg_latency_ms"], 5.0)
+
+
+class TestStreamHealth(unittest.TestCase):
+    """Test incremental stream health tracking"""
+
+    def test_background_timer_marks_streams_stale(self):
+        """Idle streams go stale without anyone querying"""
+        monitor = RealtimeMonitor(stale_after_seconds=0.05)
+
+        async def scenario():
+            for stream_id in ("idle", "busy", "silent"):
+                await monitor.register_stream(stream_id, {})
+            await monitor.process_event("idle", {"type": "ping"})
+            monitor.start_health_monitor(interval_seconds=0.01)
+            for _ in range(10):
+                await asyncio.sleep(0.01)
+                await monitor.process_event("busy", {"type": "ping"})
+            counts = (monitor.stream_health.active_count,
+                      monitor.stream_health.stale_count)
+            await monitor.stop_health_monitor()
+            return counts
+
+        self.assertEqual(asyncio.run(scenario()), (2, 1))
+        self.assertEqual(monitor.active_streams["idle"]["status"], "stale")
+
+        # A new event revives the stream
+        asyncio.run(monitor.process_event("idle", {"type": "ping"}))
+        self.assertEqual(monitor.stream_health.stale_count, 0)
+
+    def test_last_event_stays_a_datetime(self):
+        """Readers still see last_event as a datetime"""
+        monitor = RealtimeMonitor()
+
+        async def scenario():
+            await monitor.register_stream("s1", {})
+            await monitor.process_event("s1", {"type": "ping"})
+            return await monitor.get_stream_health()
+
+        health = asyncio.run(scenario())
+        stream = monitor.active_streams["s1"]
+        self.assertIsInstance(stream["last_event"], datetime)
+        self.assertAlmostEqual(
+            stream["last_event"].timestamp(), stream["last_event_ts"],
+            places=5
+        )
+        self.assertEqual(
+            health["stream_details"][0]["last_event"],
+            stream["last_event"].isoformat()
+        )
+
+    def test_paginated_details(self):
+        """Health details are returned one page at a time"""
+        monitor = RealtimeMonitor()
+
+        async def scenario():
+            for i in range(5):
+                await monitor.register_stream(f"s{i}", {})
+            first = await monitor.get_stream_health(limit=3)
+            second = await monitor.get_stream_health(
+                offset=first["next_offset"], limit=3
+            )
+            return first, second
+
+        first, second = asyncio.run(scenario())
+        self.assertEqual(first["total_streams"], 5)
+        self.assertEqual(first["active_streams"], 5)
+        self.assertEqual(len(first["stream_details"]), 3)
+        self.assertEqual(second["stream_details"][0]["stream_id"], "s3")
+        self.assertIsNone(second["next_offset"])
+
+
+class TestDashboardSnapshot(unittest.TestCase):
+    """Test versioned dashboard snapshots"""
+
+    def setUp(self):
+        self.monitor = RealtimeMonitor()
+
+        async def register():
+            for stream_id in ("s1", "s2"):
+                await self.monitor.register_stream(stream_id, {})
+                await self.monitor.process_event(stream_id, {"type": "ping"})
+
+        asyncio.run(register())
+
+    def test_snapshot_is_serializable_and_isolated(self):
+        """Snapshots encode to JSON and ignore later updates"""
+        snapshot = self.monitor.get_dashboard_snapshot()
+        asyncio.run(self.monitor.process_event("s1", {"type": "ping"}))
+
+        decoded = json.loads(snapshot.to_bytes())
+        self.assertEqual(decoded["version"], snapshot.version)
+        self.assertEqual(decoded["streams"]["s1"]["event_counts"]["ping"], 1)
+        self.assertEqual(decoded["stream_health"]["total_streams"], 2)
+        self.assertEqual(
+            self.monitor.dashboard_data["s1"]["event_counts"]["ping"], 2
+        )
+        self.assertIs(snapshot.to_bytes(), snapshot.to_bytes())
+
+    def test_snapshot_is_a_plain_dict(self):
+        """Snapshots work wherever a JSON-safe dict is expected"""
+        snapshot = self.monitor.get_dashboard_snapshot()
+
+        self.assertIsInstance(snapshot, dict)
+        self.assertIn("streams", snapshot)
+        self.assertEqual(json.loads(json.dumps(snapshot)),
+                         json.loads(snapshot.to_bytes()))
+        self.assertEqual(dict(snapshot.items())["version"], snapshot.version)
+
+    def test_delta_snapshot(self):
+        """Delta snapshots only carry streams changed since a version"""
+        base = self.monitor.get_dashboard_snapshot()
+        asyncio.run(self.monitor.process_event("s2", {"type": "ping"}))
+
+        delta = self.monitor.get_dashboard_snapshot(
+            since_version=base.version
+        )
+        self.assertEqual(list(delta["streams"]), ["s2"])
+        self.assertEqual(
+            self.monitor.get_dashboard_snapshot(
+                since_version=delta.version
+            )["streams"],
+            {}
+        )
+
+    def test_scaler_hashes_snapshot_without_reencoding(self):
+        """Workflow IDs for snapshots use the pre-computed hash"""
+        scaler = ProductionScaler(worker_count=2)
+        snapshot = self.monitor.get_dashboard_snapshot()
+        workflow = {"type": "monitoring_analysis", "data": snapshot}
+
+        self.assertEqual(
+            scaler._generate_workflow_id(workflow),
+            scaler._generate_workflow_id(workflow)
+        )
+        self.assertIsNotNone(snapshot.digest)
+
+    def test_process_payload_splices_snapshot_bytes(self):
+        """CPU-bound payloads reuse the snapshot's encoding as-is"""
+        snapshot = self.monitor.get_dashboard_snapshot()
+        workflow = {"type": "monitoring_analysis",
+                    "meta": {"source": "monitor", "attempt": 1},
+                    "data": snapshot}
+
+        payload = _encode_payload(workflow)
+        self.assertIn(snapshot.to_bytes(), payload)
+        self.assertEqual(json.loads(payload),
+                         json.loads(json.dumps(workflow)))
+
+
+class TestWorkflowSubmission(unittest.TestCase):
+    """Test result handles and single-flight submission"""
+
+    def test_duplicates_share_one_execution(self):
+        """Concurrent identical workflows are processed once"""
+        scaler = ProductionScaler(worker_count=2)
+        workflow = {"type": "pattern_analysis", "user_id": "user_1"}
+
+        async def scenario():
+            await scaler.initialize()
+            handles = await asyncio.gather(
+                *(scaler.submit_workflow(workflow) for _ in range(5))
+            )
+            results = await asyncio.gather(*handles)
+            cached = await scaler.submit_workflow(workflow)
+            await scaler.shutdown()
+            return handles, results, cached
+
+        handles, results, cached = asyncio.run(scenario())
+        self.assertEqual(scaler.metrics["workflows_processed"], 1)
+        self.assertEqual(scaler.metrics["coalesced_submissions"], 4)
+        self.assertTrue(all(handle.coalesced for handle in handles[1:]))
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertTrue(cached.cached and cached.done())
+        self.assertIs(cached.result(), results[0])
+        self.assertEqual(scaler.in_flight, {})
+
+    def test_failure_propagates_to_handle(self):
+        """A failed workflow raises from every waiting handle"""
+
+        class FailingScaler(ProductionScaler):
+            async def _process_workflow(self, work_item):
+                raise RuntimeError("boom")
+
+        scaler = FailingScaler(worker_count=2)
+
+        async def scenario():
+            await scaler.initialize()
+            first = await scaler.submit_workflow({"type": "x"})
+            second = await scaler.submit_workflow({"type": "x"})
+            outcomes = await asyncio.gather(
+                first, second, return_exceptions=True
+            )
+            await scaler.shutdown()
+            return outcomes
+
+        with self.assertLogs("production_scaler", level="ERROR"):
+            outcomes = asyncio.run(scenario())
+        self.assertTrue(
+            all(isinstance(error, RuntimeError) for error in outcomes)
+        )
+
+
+def score_text(workflow: Dict) -> Dict:
+    """CPU-bound workflow handler run in the scaler's process pool"""
+    import os
+    return {"words": len(workflow["text"].split()), "pid": os.getpid()}
+
+
+class TestCanonicalHasher(unittest.TestCase):
+    """Test canonical workflow hashing and idempotency keys"""
+
+    def test_hash_is_canonical(self):
+        """Key order is ignored; types and nesting are not"""
+        hasher = CanonicalHasher()
+        first = {"type": "a", "data": {"x": 1, "y": [1, 2]}, "n": "1"}
+        second = {"n": "1", "data": {"y": [1, 2], "x": 1}, "type": "a"}
+
+        self.assertEqual(hasher(first), hasher(second))
+        self.assertEqual(len(hasher(first)), 16)
+        self.assertNotEqual(hasher({"n": "1"}), hasher({"n": 1}))
+        self.assertNotEqual(
+            hasher({"a": "bc"}), hasher({"ab": "c"})
+        )
+        self.assertNotEqual(
+            hasher(first), CanonicalHasher(algorithm="sha256")(first)
+        )
+
+    def test_default_prefers_xxh3(self):
+        """xxh3 is used whenever xxhash is installed"""
+        expected = (
+            "xxh3_64" if canonical_hash.xxhash is not None else "blake2b"
+        )
+        self.assertEqual(CanonicalHasher().algorithm, expected)
+
+    def test_idempotency_key_skips_hashing(self):
+        """An explicit key becomes the workflow ID"""
+
+        def failing_hasher(workflow):
+            raise AssertionError("payload should not be hashed")
+
+        scaler = ProductionScaler(worker_count=2, hasher=failing_hasher)
+
+        async def scenario():
+            await scaler.initialize()
+            handle = await scaler.submit_workflow(
+                {"type": "x"}, idempotency_key="order-42"
+            )
+            await handle
+            await scaler.shutdown()
+            return handle
+
+        handle = asyncio.run(scenario())
+        self.assertEqual(handle.workflow_id, "order-42")
+
+
+class TestWorkflowTypes(unittest.TestCase):
+    """Test I/O- and CPU-bound workflow dispatch"""
+
+    def test_cpu_and_io_bound_dispatch(self):
+        """CPU-bound types run out of process, I/O-bound on the loop"""
+        import os
+        scaler = ProductionScaler(worker_count=2, process_workers=1)
+
+        async def fetch(workflow):
+            await asyncio.sleep(0)
+            return {"fetched": workflow["url"]}
+
+        scaler.register_workflow_type("score", score_text, cpu_bound=True)
+        scaler.register_workflow_type("fetch", fetch)
+
+        async def scenario():
+            await scaler.initialize()
+            self.assertIsNotNone(scaler.process_pool)
+            cpu = await scaler.submit_workflow(
+                {"type": "score", "text": "one two three"}
+            )
+            io = await scaler.submit_workflow(
+                {"type": "fetch", "url": "https://example.com"}
+            )
+            results = await asyncio.gather(cpu, io)
+            await scaler.shutdown()
+            return results
+
+        cpu_result, io_result = asyncio.run(scenario())
+        self.assertEqual(cpu_result["results"]["words"], 3)
+        self.assertNotEqual(cpu_result["results"]["pid"], os.getpid())
+        self.assertEqual(
+            io_result["results"], {"fetched": "https://example.com"}
+        )
+        self.assertIsNone(scaler.process_pool)
+
+
+class TestWorkerPool(unittest.TestCase):
+    """Test the scaler's shared-queue worker pool"""
+
+    def test_pool_grows_on_backlog_and_shrinks_when_idle(self):
+        """Autoscaling follows queue depth within the configured bounds"""
+        scaler = ProductionScaler(worker_count=2, max_workers=6)
+
+        async def scenario():
+            await scaler.initialize()
+            await asyncio.sleep(0)
+            for i in range(20):
+                await scaler.submit_workflow({"type": "load", "i": i})
+            scaler._autoscale()
+            grown = len(scaler.workers)
+            scaler._autoscale()
+            capped = len(scaler.workers)
+
+            await scaler.work_queue.join()
+            await asyncio.sleep(0)
+            while len(scaler.workers) > scaler.min_workers:
+                scaler._autoscale()
+            idle = len(scaler.idle_workers)
+            await scaler.shutdown()
+            return grown, capped, idle
+
+        grown, capped, idle = asyncio.run(scenario())
+        self.assertEqual(grown, 4)
+        self.assertEqual(capped, 6)
+        self.assertEqual(idle, 2)
+        self.assertEqual(scaler.metrics["workflows_processed"], 20)
+
+
+class TestWorkflowCache(unittest.TestCase):
+    """Test the production scaler's LRU result cache"""
+
+    def test_lru_eviction(self):
+        """The least recently used entry is evicted at capacity"""
+        cache = WorkflowCache(max_size=2)
+
+        async def scenario():
+            await cache.set("a", {"n": 1})
+            await cache.set("b", {"n": 2})
+            await cache.get("a")
+            await cache.set("c", {"n": 3})
+            return await cache.get("b"), await cache.get("a")
+
+        evicted, kept = asyncio.run(scenario())
+        self.assertIsNone(evicted)
+        self.assertEqual(kept, {"n": 1})
+        self.assertEqual(cache.get_stats()["evictions"], 1)
+
+    def test_ttl_and_byte_budget(self):
+        """Entries expire after the TTL and respect the byte budget"""
+        cache = WorkflowCache(ttl_seconds=60, max_bytes=2000)
+
+        async def scenario():
+            for i in range(20):
+                await cache.set(f"k{i}", {"payload": "x" * 100})
+            cache.cache["k19"] = cache.cache["k19"][:1] + (
+                time.monotonic() - 1,
+            ) + cache.cache["k19"][2:]
+            return await cache.get("k19")
+
+        self.assertIsNone(asyncio.run(scenario()))
+        stats = cache.get_stats()
+        self.assertLessEqual(stats["memory_bytes"], 2000)
+        self.assertGreater(stats["evictions"], 0)
+        self.assertEqual(stats["expirations"], 1)
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    """Test shared latency histogram"""
+
+    def test_percentiles_within_bucket_precision(self):
+        """Percentiles are accurate to the bucket resolution"""
+        histogram = LatencyHistogram()
+        for value in range(1, 10001):
+            histogram.record(value / 10)  # 0.1ms .. 1000ms
+
+        summary = histogram.summary()
+        for key, expected in (("p50", 500), ("p90", 900), ("p99", 990),
+                              ("p99.9", 999)):
+            self.assertAlmostEqual(summary[key], expected,
+                                   delta=expected * 0.035)
+        self.assertEqual(summary["max"], 1000)
+
+    def test_merge_snapshots(self):
+        """Snapshots from separate workers merge into one view"""
+        first, second = LatencyHistogram(), LatencyHistogram()
+        for _ in range(99):
+            first.record(1.0)
+        second.record(500.0)
+
+        merged = first.snapshot()
+        merged.merge(second)
+
+        self.assertEqual(first.count, 99)
+        self.assertEqual(merged.count, 100)
+        self.assertAlmostEqual(merged.percentile(0.999), 500.0)
+
+    def test_prometheus_export(self):
+        """Export renders cumulative buckets in seconds"""
+        monitor = RealtimeMonitor()
+        monitor._record_latency(2.0)
+        monitor._record_latency(200.0)
+        text = monitor.export_prometheus_metrics()
+
+        name = "realtime_monitor_event_latency_seconds"
+        self.assertIn(f"# TYPE {name} histogram", text)
+        self.assertIn(f'{name}_bucket{{le="0.0025"}} 1', text)
+        self.assertIn(f'{name}_bucket{{le="+Inf"}} 2', text)
+        self.assertIn(f"{name}_count 2", text)
+        self.assertEqual(
+            monitor.get_performance_metrics()["latency_max_ms"], "200.00"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
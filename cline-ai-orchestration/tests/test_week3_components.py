@@ -0,0 +1,1085 @@
+#!/usr/bin/env python3
+"""
+Component Test Suite for Cline AI Orchestration Week 3 Systems
+Tests AI workforce dispatch, pattern learning and global deployment
+"""
+
+import asyncio
+import itertools
+import json
+import os
+import sys
+import tempfile
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import joblib
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier
+
+# Week 3 modules import their siblings directly
+sys.path.append(str(Path(__file__).parent.parent / "workflows"))
+
+import advanced_pattern_learning  # noqa: E402
+from advanced_pattern_learning import (  # noqa: E402
+    MIN_TRAINING_SAMPLES, PATTERN_TYPES, AdvancedPatternLearner,
+    EvolutionBuffer
+)
+from ai_workforce_expansion import (  # noqa: E402
+    AgentCapability, AgentPool, AgentSpecialization, AgentStatus,
+    AgentView, AIAgent, AIWorkforceExpansion, NoAgentAvailableError
+)
+from global_deployment import GlobalDeploymentSystem, Region  # noqa: E402
+from production_scaler import ProductionScaler  # noqa: E402
+from region_router import NoEligibleRegionError, RegionRouter  # noqa: E402
+from week3_integration import Week3Integration  # noqa: E402
+
+
+def add_agent(workforce: AIWorkforceExpansion,
+              specialization: AgentSpecialization,
+              score: float, slots: int = 2) -> AgentView:
+    """Add an idle agent to a workforce without simulated start-up"""
+    agent = AIAgent(
+        specialization=specialization,
+        performance_score=score,
+        capabilities=[
+            AgentCapability(
+                name="general_processing",
+                proficiency_level=1.0,
+                domain_knowledge=["general_tasks"],
+                max_concurrent_tasks=slots
+            )
+        ]
+    )
+    view = workforce.agent_pool.add(agent)
+    workforce._set_agent_status(view, AgentStatus.IDLE)
+    return view
+
+
+def fitted_learner(model_path: str, **kwargs) -> AdvancedPatternLearner:
+    """Learner whose models are small forests fitted on random data"""
+    learner = AdvancedPatternLearner(model_path=model_path, **kwargs)
+    asyncio.run(learner.initialize())
+
+    rng = np.random.default_rng(0)
+    features = rng.random((200, 50))
+    labels = (features[:, 6] > 0.5).astype(int)
+    for pattern_type in learner.pattern_models:
+        learner.pattern_models[pattern_type] = RandomForestClassifier(
+            n_estimators=5, random_state=0
+        ).fit(features, labels)
+    return learner
+
+
+def make_event(risk_score: float, pattern_type: str = "burnout") -> dict:
+    """Pattern event for the learner"""
+    return {
+        "type": pattern_type,
+        "timestamp": "2025-06-15T09:30:00",
+        "risk_score": risk_score,
+        "interaction_count": 40,
+        "engagement_score": 0.3
+    }
+
+
+class TestPredictionBatching(unittest.TestCase):
+    """Test micro-batched pattern scoring"""
+
+    def setUp(self):
+        self.model_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.model_dir.cleanup)
+
+    def count_batches(self, learner: AdvancedPatternLearner) -> list:
+        """Record the size of every predict call"""
+        sizes = []
+        predict = learner.prediction_batcher.predict_batch
+
+        def counting_predict(pattern_type, model, features):
+            sizes.append((pattern_type, len(features)))
+            return predict(pattern_type, model, features)
+
+        learner.prediction_batcher.predict_batch = counting_predict
+        return sizes
+
+    def test_concurrent_requests_share_one_call_per_type(self):
+        """Concurrent events are scored once per pattern type"""
+        learner = fitted_learner(self.model_dir.name)
+        sizes = self.count_batches(learner)
+        events = [make_event(i / 10) for i in range(6)] + [
+            make_event(0.5, "crisis") for _ in range(3)
+        ]
+
+        async def scenario():
+            return await asyncio.gather(
+                *(learner.evolve_pattern(event) for event in events)
+            )
+
+        results = asyncio.run(scenario())
+        self.assertEqual(sorted(sizes), [("burnout", 6), ("crisis", 3)])
+
+        expected = learner.pattern_models["burnout"].predict_proba([
+            learner._extract_advanced_features(events[2])
+        ])[0].max()
+        self.assertAlmostEqual(results[2]["evolved_confidence"], expected)
+        self.assertEqual(learner.get_evolution_metrics()[
+            "avg_prediction_batch_size"
+        ], "4.5")
+
+    def test_batches_are_capped(self):
+        """A full batch is scored without waiting for the timer"""
+        learner = fitted_learner(
+            self.model_dir.name, batch_size=4, batch_wait_ms=1000
+        )
+        sizes = self.count_batches(learner)
+
+        async def scenario():
+            return await asyncio.wait_for(asyncio.gather(
+                *(learner.evolve_pattern(make_event(0.5)) for _ in range(8))
+            ), timeout=0.5)
+
+        asyncio.run(scenario())
+        self.assertEqual(sizes, [("burnout", 4), ("burnout", 4)])
+
+    def test_failed_batch_reports_every_request(self):
+        """Each request in a failed batch gets the error"""
+        learner = fitted_learner(self.model_dir.name)
+        # A model trained on the wrong feature width rejects every row
+        learner.pattern_models["burnout"] = RandomForestClassifier(
+            n_estimators=2
+        ).fit([[0.0], [1.0]], [0, 1])
+
+        async def scenario():
+            return await asyncio.gather(
+                *(learner.evolve_pattern(make_event(0.5)) for _ in range(3))
+            )
+
+        with self.assertLogs("advanced_pattern_learning", level="ERROR"):
+            results = asyncio.run(scenario())
+        self.assertEqual([r["status"] for r in results], ["error"] * 3)
+
+
+class TestBackgroundRetraining(unittest.TestCase):
+    """Test policy-driven, out-of-process model retraining"""
+
+    def setUp(self):
+        self.model_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.model_dir.cleanup)
+
+    def test_untrained_model_uses_prior(self):
+        """Before the first training run predictions use a 0.5 prior"""
+        learner = AdvancedPatternLearner(model_path=self.model_dir.name)
+
+        async def scenario():
+            await learner.initialize()
+            return await learner.evolve_pattern(make_event(0.9))
+
+        result = asyncio.run(scenario())
+        self.assertEqual(result["evolved_confidence"], 0.5)
+        self.assertEqual(len(learner.evolution_history["burnout"]), 1)
+
+    def test_retrain_runs_in_background_and_swaps_versions(self):
+        """Inference continues while a new version trains and loads"""
+        learner = AdvancedPatternLearner(
+            model_path=self.model_dir.name, retrain_every_samples=100
+        )
+        # Earlier samples scored on both sides of the label threshold
+        history = learner.evolution_history["burnout"]
+        for i in range(99):
+            slot = history.claim()
+            history.features[slot, 0] = i
+            history.commit(slot, i / 99, time.time())
+        learner.samples_since_training["burnout"] = 99
+
+        async def scenario():
+            await learner.initialize()
+            await learner.evolve_pattern(make_event(0.5))
+            training = learner.training_tasks.get("burnout")
+            during = await learner.evolve_pattern(make_event(0.5))
+            await training
+            after = await learner.evolve_pattern(make_event(0.5))
+            await learner.shutdown()
+            return training, during, after
+
+        training, during, after = asyncio.run(scenario())
+        self.assertIsNotNone(training)
+        self.assertEqual(during["evolved_confidence"], 0.5)
+        self.assertEqual(learner.model_versions["burnout"], 1)
+        self.assertEqual(after["pattern_type"], "burnout")
+        self.assertTrue(
+            (Path(self.model_dir.name) / "burnout_model.v1.pkl").exists()
+        )
+
+        reloaded = AdvancedPatternLearner(model_path=self.model_dir.name)
+        asyncio.run(reloaded.initialize())
+        self.assertEqual(reloaded.model_versions["burnout"], 1)
+        self.assertEqual(reloaded.model_versions["crisis"], 0)
+
+    def test_single_label_window_keeps_prior(self):
+        """A window scored only by the prior does not train a model"""
+        learner = AdvancedPatternLearner(
+            model_path=self.model_dir.name, retrain_every_samples=100
+        )
+
+        async def scenario():
+            await learner.initialize()
+            for i in range(100):
+                await learner.evolve_pattern(make_event(i / 100))
+            training = learner.training_tasks.get("burnout")
+            await training
+            after = await learner.evolve_pattern(make_event(0.9))
+            await learner.shutdown()
+            return training, after
+
+        training, after = asyncio.run(scenario())
+        self.assertIsNotNone(training)
+        self.assertEqual(learner.model_versions["burnout"], 0)
+        self.assertEqual(learner.samples_since_training["burnout"], 1)
+        self.assertEqual(after["evolved_confidence"], 0.5)
+        self.assertEqual(after["recommendations"], [])
+        self.assertFalse(
+            list(Path(self.model_dir.name).glob("burnout_model.v*.pkl"))
+        )
+
+    def test_policy_waits_for_new_samples(self):
+        """No retrain until enough new samples or time has passed"""
+        learner = AdvancedPatternLearner(
+            model_path=self.model_dir.name,
+            retrain_every_samples=50, retrain_interval_seconds=3600
+        )
+        history = learner.evolution_history["burnout"]
+        for _ in range(120):
+            history.commit(history.claim(), 0.5, time.time())
+        learner.samples_since_training["burnout"] = 10
+        learner.last_trained["burnout"] = time.monotonic()
+
+        async def scenario():
+            learner._schedule_retrain("burnout")
+            pending = dict(learner.training_tasks)
+            learner.last_trained["burnout"] -= 3600
+            learner._retrain_model = lambda pattern_type: asyncio.sleep(0)
+            learner._schedule_retrain("burnout")
+            return pending, learner.training_tasks.get("burnout")
+
+        pending, scheduled = asyncio.run(scenario())
+        self.assertEqual(pending, {})
+        self.assertIsNotNone(scheduled)
+
+
+class TestLazyModelLoading(unittest.TestCase):
+    """Test lazily loaded, memory-mapped pattern models"""
+
+    def setUp(self):
+        self.model_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.model_dir.cleanup)
+
+        rng = np.random.default_rng(0)
+        features = rng.random((200, 50))
+        labels = (features[:, 6] > 0.5).astype(int)
+        model = RandomForestClassifier(
+            n_estimators=5, random_state=0
+        ).fit(features, labels)
+        for pattern_type in PATTERN_TYPES:
+            joblib.dump(
+                model,
+                Path(self.model_dir.name) / f"{pattern_type}_model.v2.pkl"
+            )
+
+    def learner(self, **kwargs) -> AdvancedPatternLearner:
+        learner = AdvancedPatternLearner(
+            model_path=self.model_dir.name, **kwargs
+        )
+        asyncio.run(learner.initialize())
+        return learner
+
+    def test_models_load_on_first_use(self):
+        """Startup only discovers artifacts; evolving loads one"""
+        learner = self.learner()
+        self.assertEqual(learner.model_versions["burnout"], 2)
+        self.assertEqual(learner.pattern_models.resident_count(), 0)
+
+        result = asyncio.run(learner.evolve_pattern(make_event(0.9)))
+        self.assertNotEqual(result["evolved_confidence"], 0.5)
+        self.assertEqual(learner.pattern_models.loads, 1)
+        self.assertEqual(list(learner.pattern_models.resident), ["burnout"])
+
+    def test_lru_caps_resident_models(self):
+        """Least recently used models are evicted and reloaded"""
+        learner = self.learner(max_resident_models=2)
+
+        async def scenario():
+            for pattern_type in ("burnout", "crisis", "burnout",
+                                 "recovery", "crisis"):
+                await learner.evolve_pattern(make_event(0.5, pattern_type))
+
+        asyncio.run(scenario())
+        cache = learner.pattern_models
+        self.assertEqual(list(cache.resident), ["recovery", "crisis"])
+        self.assertEqual(cache.loads, 4)
+        self.assertEqual(cache.evictions, 2)
+
+    def test_batches_keep_evicted_models(self):
+        """A model evicted before its batch runs is not reloaded"""
+        learner = self.learner(max_resident_models=1)
+
+        async def scenario():
+            return await asyncio.gather(*(
+                learner.evolve_pattern(make_event(0.5, pattern_type))
+                for pattern_type in ("burnout", "crisis") * 3
+            ))
+
+        results = asyncio.run(scenario())
+        self.assertTrue(all("evolved_confidence" in r for r in results))
+        self.assertEqual(learner.pattern_models.loads, 2)
+        self.assertEqual(learner.pattern_models.resident_count(), 1)
+
+    def test_default_cap_holds_every_pattern_type(self):
+        """Round-robin over all types loads each model once"""
+        learner = self.learner()
+
+        async def scenario():
+            for _ in range(3):
+                for pattern_type in PATTERN_TYPES:
+                    await learner.evolve_pattern(
+                        make_event(0.5, pattern_type)
+                    )
+
+        asyncio.run(scenario())
+        self.assertEqual(learner.pattern_models.loads, len(PATTERN_TYPES))
+        self.assertEqual(learner.pattern_models.evictions, 0)
+
+    def test_concurrent_first_use_shares_one_load(self):
+        """Simultaneous first requests for a type load it once"""
+        learner = self.learner()
+
+        async def scenario():
+            return await asyncio.gather(
+                *(learner.evolve_pattern(make_event(0.5)) for _ in range(8))
+            )
+
+        results = asyncio.run(scenario())
+        self.assertEqual(len({r["evolved_confidence"] for r in results}), 1)
+        self.assertEqual(learner.pattern_models.loads, 1)
+
+
+class TestEvolutionBuffer(unittest.TestCase):
+    """Test the fixed-size evolution history ring buffer"""
+
+    def fill(self, buffer: EvolutionBuffer, count: int):
+        for i in range(count):
+            slot = buffer.claim()
+            buffer.features[slot, 0] = i
+            buffer.commit(slot, i / count, time.time())
+
+    def test_wraps_without_growing(self):
+        """Old samples are overwritten once the buffer is full"""
+        buffer = EvolutionBuffer(capacity=8, width=4)
+        nbytes = buffer.nbytes
+        self.fill(buffer, 20)
+
+        self.assertEqual(len(buffer), 8)
+        self.assertEqual(buffer.recorded, 20)
+        self.assertEqual(buffer.nbytes, nbytes)
+        self.assertEqual(
+            sorted(buffer.features[:, 0]), list(range(12, 20))
+        )
+
+    def test_training_data_covers_retained_samples(self):
+        """Fully committed buffers return every retained sample"""
+        buffer = EvolutionBuffer(capacity=8, width=4)
+        self.fill(buffer, 5)
+
+        features, confidence = buffer.training_data()
+        self.assertEqual(features.shape, (5, 4))
+        self.assertEqual(list(features[:, 0]), list(range(5)))
+        self.assertEqual(list(confidence), [i / 5 for i in range(5)])
+
+    def test_training_pool_gets_a_snapshot(self):
+        """Rows rewritten after submission do not reach the trainer"""
+        submitted = []
+
+        class RecordingPool(ThreadPoolExecutor):
+            def submit(self, fn, *args):
+                submitted.append(args)
+                return super().submit(fn, *args)
+
+        with tempfile.TemporaryDirectory() as model_dir:
+            learner = AdvancedPatternLearner(model_path=model_dir)
+            learner.training_pool = RecordingPool(max_workers=1)
+            history = learner.evolution_history["burnout"]
+            for i in range(MIN_TRAINING_SAMPLES):
+                slot = history.claim()
+                history.features[slot, 0] = i
+                history.commit(slot, i / MIN_TRAINING_SAMPLES, time.time())
+
+            async def scenario():
+                training = asyncio.ensure_future(
+                    learner._retrain_model("burnout")
+                )
+                await asyncio.sleep(0)
+                history.features.fill(-1.0)
+                await training
+                await learner.shutdown()
+
+            asyncio.run(scenario())
+
+        features = submitted[0][0]
+        self.assertFalse(np.shares_memory(features, history.features))
+        self.assertEqual(
+            list(features[:, 0]), list(range(MIN_TRAINING_SAMPLES))
+        )
+
+    def test_uncommitted_slots_are_excluded(self):
+        """Claimed slots without an outcome are not trained on"""
+        buffer = EvolutionBuffer(capacity=8, width=4)
+        self.fill(buffer, 3)
+        buffer.claim()
+
+        features, confidence = buffer.training_data()
+        self.assertEqual(len(buffer), 3)
+        self.assertEqual(features.shape, (3, 4))
+        self.assertFalse(np.isnan(confidence).any())
+
+    def test_evolve_writes_features_into_history(self):
+        """evolve_pattern stores its feature row in the buffer"""
+        with tempfile.TemporaryDirectory() as model_dir:
+            learner = AdvancedPatternLearner(
+                model_path=model_dir, history_capacity=16
+            )
+            asyncio.run(learner.initialize())
+            asyncio.run(learner.evolve_pattern(make_event(0.8)))
+
+        history = learner.evolution_history["burnout"]
+        self.assertEqual(history.features.shape, (16, 50))
+        self.assertAlmostEqual(float(history.features[0, 6]), 0.8, 6)
+        self.assertEqual(float(history.confidence[0]), 0.5)
+        self.assertEqual(
+            learner.get_evolution_metrics()["total_evolution_data_points"],
+            1
+        )
+
+
+class TestCrossPatternCorrelation(unittest.TestCase):
+    """Test the vectorized cross-pattern correlation analysis"""
+
+    def setUp(self):
+        self.model_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.model_dir.cleanup)
+        self.learner = AdvancedPatternLearner(model_path=self.model_dir.name)
+        asyncio.run(self.learner.initialize())
+
+        rng = np.random.default_rng(5)
+        self.patterns = [
+            {
+                "type": ("burnout", "crisis", "isolation")[i % 3],
+                "timestamp": f"2025-06-{1 + i:02d}T{i % 24:02d}:00:00",
+                "risk_score": float(rng.random()),
+                "interaction_count": int(rng.integers(0, 100)),
+                "engagement_score": float(rng.random()),
+                "support_score": float(rng.random())
+            }
+            for i in range(12)
+        ]
+
+    def analyze(self, patterns):
+        return asyncio.run(
+            self.learner.analyze_cross_pattern_correlations(patterns)
+        )
+
+    def test_matches_pairwise_corrcoef_across_tiles(self):
+        """Tiled results equal per-pair np.corrcoef, in pair order"""
+        expected = []
+        for first, second in itertools.combinations(self.patterns, 2):
+            coefficient = np.corrcoef(
+                self.learner._extract_advanced_features(first),
+                self.learner._extract_advanced_features(second)
+            )[0, 1]
+            if abs(coefficient) > 0.7:
+                expected.append((first["type"], second["type"],
+                                 abs(coefficient)))
+
+        original_chunk = advanced_pattern_learning.CORRELATION_CHUNK_ROWS
+        advanced_pattern_learning.CORRELATION_CHUNK_ROWS = 5
+        try:
+            result = self.analyze(self.patterns)
+        finally:
+            advanced_pattern_learning.CORRELATION_CHUNK_ROWS = original_chunk
+
+        self.assertGreater(len(expected), 0)
+        self.assertEqual(len(result["correlations"]), len(expected))
+        self.assertEqual(len(result["insights"]), len(expected))
+        for correlation, (first, second, strength) in zip(
+                result["correlations"], expected):
+            self.assertEqual(correlation["pattern1"], first)
+            self.assertEqual(correlation["pattern2"], second)
+            self.assertAlmostEqual(correlation["strength"], strength, 5)
+
+    def test_correlation_matrix_is_a_running_mean(self):
+        """Type-pair means accumulate over successive batches"""
+        burnout = self.learner.pattern_index["burnout"]
+        crisis = self.learner.pattern_index["crisis"]
+        first, second = self.patterns[:2], self.patterns[3:5]
+
+        coefficients = [
+            np.corrcoef(
+                self.learner._extract_advanced_features(a),
+                self.learner._extract_advanced_features(b)
+            )[0, 1]
+            for a, b in (first, second)
+        ]
+        self.analyze(first)
+        matrix = self.learner.correlation_matrix
+        self.assertAlmostEqual(matrix[burnout, crisis], coefficients[0], 5)
+        self.assertAlmostEqual(matrix[crisis, burnout], coefficients[0], 5)
+
+        self.analyze(second)
+        matrix = self.learner.correlation_matrix
+        self.assertAlmostEqual(
+            matrix[burnout, crisis], np.mean(coefficients), 5
+        )
+        self.assertEqual(self.learner.correlation_counts[burnout, crisis], 2)
+
+
+class TestAgentSelection(unittest.TestCase):
+    """Test indexed agent selection"""
+
+    def setUp(self):
+        self.workforce = AIWorkforceExpansion()
+        self.crisis_low = add_agent(
+            self.workforce, AgentSpecialization.CRISIS_RESPONSE, 0.7
+        )
+        self.crisis_high = add_agent(
+            self.workforce, AgentSpecialization.CRISIS_RESPONSE, 0.9
+        )
+        self.data = add_agent(
+            self.workforce, AgentSpecialization.DATA_PROCESSING, 0.95
+        )
+
+    def find(self, task_type: str):
+        return asyncio.run(self.workforce._find_suitable_agent(task_type))
+
+    def test_prefers_best_matching_specialization(self):
+        """The best idle agent of the task's specialization wins"""
+        self.assertEqual(self.find("crisis"), self.crisis_high)
+
+    def test_status_changes_update_the_index(self):
+        """Busy agents are skipped and return once idle again"""
+        self.workforce._set_agent_status(self.crisis_high, AgentStatus.BUSY)
+        self.assertEqual(self.find("crisis"), self.crisis_low)
+
+        self.workforce._set_agent_status(self.crisis_high, AgentStatus.IDLE)
+        self.assertEqual(self.find("crisis"), self.crisis_high)
+
+    def test_falls_back_to_best_idle_agent(self):
+        """Without a matching idle agent the global best is used"""
+        for agent in (self.crisis_low, self.crisis_high):
+            self.workforce._set_agent_status(agent, AgentStatus.BUSY)
+        self.assertEqual(self.find("crisis"), self.data)
+        self.assertEqual(self.find("quality"), self.data)
+
+        self.workforce._set_agent_status(self.data, AgentStatus.OFFLINE)
+        self.assertIsNone(self.find("crisis"))
+
+    def test_stale_entries_are_compacted(self):
+        """Repeated status churn does not grow the heaps unboundedly"""
+        for _ in range(500):
+            self.workforce._set_agent_status(self.data, AgentStatus.BUSY)
+            self.workforce._set_agent_status(self.data, AgentStatus.IDLE)
+
+        index = self.workforce.idle_agents
+        self.assertEqual(len(index), 3)
+        self.assertLess(len(index.global_heap), 2 * len(index) + 65)
+        self.assertEqual(self.find("data"), self.data)
+
+
+class TestAgentPool(unittest.TestCase):
+    """Test the structure-of-arrays agent pool"""
+
+    def test_rows_grow_and_capabilities_are_interned(self):
+        """Agents share capability profiles and keep their fields"""
+        workforce = AIWorkforceExpansion()
+        pool = AgentPool(capacity=2)
+        specs = list(AgentSpecialization)
+
+        async def create(count):
+            return await asyncio.gather(*(
+                workforce._create_specialized_agent(specs[i % len(specs)])
+                for i in range(count)
+            ))
+
+        agents = asyncio.run(create(40))
+        views = [pool.add(agent) for agent in agents]
+
+        self.assertEqual(len(pool), 40)
+        self.assertGreaterEqual(pool.capacity, 40)
+        self.assertEqual(len(pool.profiles), 4)
+        self.assertEqual(pool.slot_width, 2)
+        self.assertEqual(pool[agents[7].agent_id], views[7])
+        self.assertEqual(views[7].specialization, agents[7].specialization)
+        self.assertEqual(views[0].capabilities, tuple(agents[0].capabilities))
+        self.assertIsNone(views[0].last_active)
+        self.assertEqual(pool.count(AgentStatus.IDLE), 40)
+
+    def test_counters_track_status_changes(self):
+        """Status and specialization counts stay consistent"""
+        pool = AgentPool()
+        views = [
+            pool.add(AIAgent(specialization=spec))
+            for spec in list(AgentSpecialization) * 3
+        ]
+        views[0].status = AgentStatus.IDLE
+        views[1].status = AgentStatus.BUSY
+        views[2].tasks_completed += 2
+
+        self.assertEqual(pool.count(AgentStatus.INITIALIZING), 22)
+        self.assertEqual(
+            pool.count(AgentStatus.IDLE, AgentStatus.BUSY), 2
+        )
+        self.assertEqual(views[2].tasks_completed, 2)
+        self.assertEqual(
+            set(pool.counts_by_specialization().values()), {3}
+        )
+
+    def test_specialization_coverage(self):
+        """Coverage is the mean per-specialization fill, capped at 1"""
+        workforce = AIWorkforceExpansion()
+        workforce.specialization_distribution = {
+            AgentSpecialization.CRISIS_RESPONSE: 2,
+            AgentSpecialization.DATA_PROCESSING: 4
+        }
+        for _ in range(3):
+            add_agent(workforce, AgentSpecialization.CRISIS_RESPONSE, 0.9)
+        add_agent(workforce, AgentSpecialization.DATA_PROCESSING, 0.9)
+
+        self.assertAlmostEqual(
+            workforce._calculate_specialization_coverage(), 0.625
+        )
+
+
+class TestTaskDispatch(unittest.TestCase):
+    """Test queued, concurrent task execution"""
+
+    def test_tasks_run_concurrently_within_slots(self):
+        """Agents run up to their slot count at once; extra tasks wait"""
+        workforce = AIWorkforceExpansion()
+        agents = [
+            add_agent(workforce, AgentSpecialization.DATA_PROCESSING, 0.9),
+            add_agent(workforce, AgentSpecialization.DATA_PROCESSING, 0.8)
+        ]
+
+        async def scenario():
+            futures = [
+                await workforce.submit_task(
+                    {"type": "data", "complexity": 0.5}
+                )
+                for _ in range(5)
+            ]
+            await asyncio.sleep(0.01)
+            running = [agent.running_count() for agent in agents]
+            statuses = [agent.status for agent in agents]
+            queued_or_waiting = sum(not f.done() for f in futures)
+            results = await asyncio.gather(*futures)
+            await workforce.shutdown()
+            return running, statuses, queued_or_waiting, results
+
+        running, statuses, waiting, results = asyncio.run(scenario())
+        self.assertEqual(running, [2, 2])
+        self.assertEqual(statuses, [AgentStatus.BUSY, AgentStatus.BUSY])
+        self.assertEqual(waiting, 5)
+        self.assertEqual(len({r["task_id"] for r in results}), 5)
+        self.assertEqual(workforce.metrics["tasks_completed"], 5)
+        self.assertTrue(all(a.status == AgentStatus.IDLE for a in agents))
+
+    def test_distribute_task_returns_before_execution(self):
+        """distribute_task only queues the task"""
+        workforce = AIWorkforceExpansion()
+        add_agent(workforce, AgentSpecialization.CRISIS_RESPONSE, 0.9)
+
+        async def scenario():
+            task_id = await workforce.distribute_task({"type": "crisis"})
+            pending = task_id not in workforce.task_results
+            while workforce.metrics["tasks_completed"] < 1:
+                await asyncio.sleep(0.01)
+            await workforce.shutdown()
+            return task_id, pending
+
+        task_id, pending = asyncio.run(scenario())
+        self.assertTrue(pending)
+        self.assertEqual(
+            workforce.task_results[task_id][0]["status"], "completed"
+        )
+
+    def test_shutdown_resolves_every_future(self):
+        """Running and queued tasks are cancelled on shutdown"""
+        workforce = AIWorkforceExpansion()
+        add_agent(workforce, AgentSpecialization.DATA_PROCESSING, 0.9)
+
+        async def scenario():
+            futures = [
+                await workforce.submit_task({"type": "data"})
+                for _ in range(5)
+            ]
+            await asyncio.sleep(0.01)
+            await workforce.shutdown()
+            return futures
+
+        futures = asyncio.run(scenario())
+        self.assertTrue(all(future.cancelled() for future in futures))
+        self.assertTrue(workforce.task_queue.empty())
+        self.assertEqual(workforce.metrics["tasks_completed"], 0)
+
+    def test_empty_workforce_fails_fast(self):
+        """Without agents, tasks are rejected instead of waiting forever"""
+        workforce = AIWorkforceExpansion()
+
+        async def scenario():
+            future = await workforce.submit_task({"type": "data"})
+            task_id = await workforce.distribute_task({"type": "crisis"})
+            return future, task_id
+
+        with self.assertLogs("ai_workforce_expansion", level="WARNING"):
+            future, task_id = asyncio.run(scenario())
+        self.assertIsInstance(future.exception(), NoAgentAvailableError)
+        self.assertNotIn(task_id, workforce.task_results)
+
+
+class TestGlobalDeployment(unittest.TestCase):
+    """Test concurrent rollout and live latency estimates"""
+
+    def setUp(self):
+        self.deployment = GlobalDeploymentSystem(probe_timeout_seconds=0.05)
+
+    def test_rollout_runs_regions_concurrently(self):
+        """Regions and their compliance checks deploy in parallel"""
+        regions = [Region.US_EAST, Region.EU_WEST, Region.ASIA_PACIFIC]
+
+        start = time.perf_counter()
+        results = asyncio.run(self.deployment.deploy_to_regions(regions))
+        elapsed = time.perf_counter() - start
+
+        # One deployment is 0.1s of compliance plus 0.5s of infrastructure
+        self.assertLess(elapsed, 1.2)
+        self.assertEqual(
+            [result["status"] for result in results.values()],
+            ["success"] * 3
+        )
+        self.assertEqual(self.deployment.active_regions, set(regions))
+        self.assertEqual(self.deployment.metrics["compliance_validations"], 5)
+
+    def test_rollout_times_out_per_region(self):
+        """A region that exceeds its timeout is reported, not deployed"""
+        results = asyncio.run(self.deployment.deploy_to_regions(
+            [Region.US_EAST], timeout_seconds=0.05
+        ))
+
+        self.assertEqual(results[Region.US_EAST]["status"], "timeout")
+        self.assertEqual(self.deployment.active_regions, set())
+        self.assertEqual(self.deployment.metrics["deployment_timeouts"], 1)
+
+    def test_probes_update_latency_estimates(self):
+        """Probe results are smoothed; timeouts count at the limit"""
+        latencies = {Region.US_EAST: [40.0, 60.0], Region.US_WEST: [20.0]}
+
+        async def measure(region):
+            if region == Region.EU_WEST:
+                await asyncio.sleep(1)
+            return latencies[region].pop(0)
+
+        self.deployment._measure_region_latency = measure
+        self.deployment.active_regions = {Region.US_EAST, Region.EU_WEST}
+        asyncio.run(self.deployment.measure_global_latency())
+        self.deployment.active_regions.add(Region.US_WEST)
+        asyncio.run(self.deployment.measure_global_latency())
+
+        estimate = self.deployment.estimated_latency
+        self.assertAlmostEqual(estimate(Region.US_EAST), 0.3 * 60 + 0.7 * 40)
+        self.assertEqual(estimate(Region.US_WEST), 20.0)
+        self.assertEqual(estimate(Region.EU_WEST), 50.0)
+        self.assertEqual(self.deployment.metrics["probe_timeouts"], 2)
+
+    def test_routing_follows_measured_latency(self):
+        """Week 3 routing picks the fastest region in the user's area"""
+        integration = Week3Integration()
+        integration.global_deployment = self.deployment
+        integration.region_router = RegionRouter(self.deployment)
+        self.deployment.active_regions = {
+            Region.US_EAST, Region.US_WEST, Region.EU_WEST
+        }
+        select = integration.region_router.select
+
+        # Nothing measured yet: home region
+        self.assertEqual(select({"user_region": "us-east"}), Region.US_EAST)
+
+        self.deployment._record_latency(Region.US_EAST, 80.0)
+        self.deployment._record_latency(Region.US_WEST, 30.0)
+        self.deployment._record_latency(Region.EU_WEST, 5.0)
+        self.assertEqual(select({"user_region": "us-east"}), Region.US_WEST)
+        self.assertEqual(select({"user_region": "eu"}), Region.EU_WEST)
+        # No region deployed in the user's area
+        self.assertIsNone(select({"user_region": "asia"}))
+
+
+class TestLocalizationBundles(unittest.TestCase):
+    """Test compiled, hot-reloadable localization bundles"""
+
+    def setUp(self):
+        self.source_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.source_dir.cleanup)
+        self.deployment = GlobalDeploymentSystem(
+            localization_dir=self.source_dir.name
+        )
+
+    def write_source(self, language: str, strings: dict, mtime: float):
+        source = Path(self.source_dir.name) / f"{language}.json"
+        source.write_text(json.dumps(strings), encoding="utf-8")
+        os.utime(source, (mtime, mtime))
+
+    def test_preload_builds_shared_immutable_bundles(self):
+        """Bundles are compiled once, read-only and share strings"""
+        bundles = asyncio.run(
+            self.deployment.preload_localization(["en-US", "en-GB", "de-DE"])
+        )
+        again = asyncio.run(self.deployment.preload_localization(["en-US"]))
+
+        self.assertIs(again["en-US"], bundles["en-US"])
+        self.assertIs(
+            bundles["en-US"].get("welcome"), bundles["en-GB"].get("welcome")
+        )
+        self.assertEqual(
+            self.deployment.localize("de-DE", "crisis_alert"), "Krisenalarm"
+        )
+        self.assertEqual(
+            self.deployment.localize("pl-PL", "crisis_alert"), "Crisis Alert"
+        )
+        with self.assertRaises(TypeError):
+            bundles["de-DE"].strings["welcome"] = "Hallo"
+
+        sizes = self.deployment.get_deployment_metrics()["localization_bytes"]
+        self.assertEqual(set(sizes), {"en-US", "en-GB", "de-DE"})
+        self.assertTrue(all(size > 0 for size in sizes.values()))
+
+    def test_changed_sources_reload_atomically(self):
+        """Only bundles whose source changed are swapped"""
+        self.write_source("fr-FR", {"welcome": "Bonjour"}, mtime=1000)
+
+        async def scenario():
+            await self.deployment.preload_localization(["fr-FR", "de-DE"])
+            unchanged = await self.deployment.reload_changed_localization()
+            before = self.deployment.localization_cache["fr-FR"]
+
+            self.write_source("fr-FR", {"welcome": "Salut"}, mtime=2000)
+            changed = await self.deployment.reload_changed_localization()
+            return unchanged, before, changed
+
+        unchanged, before, changed = asyncio.run(scenario())
+        self.assertEqual(unchanged, [])
+        self.assertEqual(changed, ["fr-FR"])
+        self.assertEqual(before.get("welcome"), "Bonjour")
+        self.assertEqual(self.deployment.localize("fr-FR", "welcome"), "Salut")
+        self.assertEqual(
+            self.deployment.localize("fr-FR", "crisis_alert"),
+            "Alerte de Crise"
+        )
+        self.assertEqual(self.deployment.metrics["localization_reloads"], 1)
+
+
+class TestRegionRouter(unittest.TestCase):
+    """Test latency- and load-aware region routing"""
+
+    def setUp(self):
+        self.deployment = GlobalDeploymentSystem()
+        self.deployment.active_regions = set(Region)
+        for region in Region:
+            self.deployment._record_latency(region, 40.0)
+        self.router = RegionRouter(self.deployment, choices=6)
+
+    def test_respects_residency_and_compliance(self):
+        """Only regions in the user's area with the frameworks qualify"""
+        eligible = self.router.eligible_regions
+        self.assertEqual(
+            eligible({"user_region": "eu"}),
+            [Region.EU_WEST, Region.EU_CENTRAL]
+        )
+        self.assertEqual(
+            eligible({"user_region": "us-west", "compliance": ["hipaa"]}),
+            [Region.US_EAST]
+        )
+        self.assertEqual(
+            set(eligible({"data_residency": False, "compliance": ["gdpr"]})),
+            {Region.EU_WEST, Region.EU_CENTRAL}
+        )
+        self.assertIsNone(
+            self.router.select({"user_region": "asia", "compliance": ["gdpr"]})
+        )
+
+    def test_compliance_names_are_normalized(self):
+        """Framework names are case-insensitive; unknown ones are rejected"""
+        self.assertEqual(
+            self.router.eligible_regions(
+                {"user_region": "us-east", "compliance": ["HIPAA", " Soc2"]}
+            ),
+            [Region.US_EAST]
+        )
+        with self.assertRaisesRegex(ValueError, "Unknown compliance"):
+            self.router.eligible_regions({"compliance": ["fedramp"]})
+
+    def test_no_eligible_region_is_refused(self):
+        """A workflow no region may serve is never processed anywhere"""
+        calls = []
+
+        async def process(region):
+            calls.append(region)
+            return region
+
+        workflow = {"user_region": "eu", "compliance": ["hipaa"]}
+        with self.assertRaises(NoEligibleRegionError):
+            asyncio.run(self.router.route(workflow, process))
+        self.assertEqual(calls, [])
+        self.assertEqual(self.router.metrics["requests_routed"], 0)
+
+    def test_queue_depth_outweighs_small_latency_gaps(self):
+        """A busy scaler steers work to a slightly slower region"""
+        scaler = ProductionScaler(worker_count=2)
+        self.router.register_scaler(Region.EU_WEST, scaler)
+        self.deployment._record_latency(Region.EU_CENTRAL, 100.0)
+        workflow = {"user_region": "eu"}
+        self.assertEqual(self.router.select(workflow), Region.EU_WEST)
+
+        async def fill_queue():
+            for i in range(6):
+                await scaler.submit_workflow({"n": i})
+
+        asyncio.run(fill_queue())
+        self.assertEqual(self.router.select(workflow), Region.EU_CENTRAL)
+
+    def test_fails_over_and_degrades_failing_region(self):
+        """Errors move the request on; repeated errors bench the region"""
+        calls = []
+
+        async def process(region):
+            calls.append(region)
+            if region == Region.US_EAST:
+                raise ConnectionError("region unavailable")
+            return region
+
+        async def scenario():
+            return [
+                await self.router.route({"user_region": "us-east"}, process)
+                for _ in range(4)
+            ]
+
+        with self.assertLogs("region_router", level="WARNING"):
+            served = asyncio.run(scenario())
+        self.assertEqual(served, [Region.US_WEST] * 4)
+        self.assertEqual(calls[:6], [Region.US_EAST, Region.US_WEST] * 3)
+        self.assertEqual(calls[6:], [Region.US_WEST])
+        self.assertTrue(self.router.is_degraded(Region.US_EAST))
+        self.assertEqual(self.router.metrics["failovers"], 3)
+        self.assertEqual(dict(self.router.outstanding),
+                         {Region.US_EAST: 0, Region.US_WEST: 0})
+
+    def test_slow_region_is_skipped(self):
+        """A latency estimate far above target takes a region out"""
+        self.deployment._record_latency(Region.US_EAST, 1000.0)
+        self.deployment._record_latency(Region.US_EAST, 1000.0)
+        self.assertTrue(self.router.is_degraded(Region.US_EAST))
+        self.assertEqual(
+            self.router.select({"user_region": "us-east"}), Region.US_WEST
+        )
+
+
+class TestGlobalPipeline(unittest.TestCase):
+    """Test ordered and pipelined global workflow processing"""
+
+    def setUp(self):
+        self.integration = Week3Integration()
+        deployment = GlobalDeploymentSystem()
+        deployment.active_regions = set(Region)
+        self.integration.region_router = RegionRouter(deployment)
+        self.active = 0
+        self.peak = 0
+        # Evolved patterns each regional stage saw, by workflow id
+        self.seen = {}
+
+        async def evolve(workflow):
+            await asyncio.sleep(0.05)
+            return {"pattern_type": workflow["pattern_data"]["type"]}
+
+        async def process_in_region(workflow, region):
+            self.seen[workflow["id"]] = workflow.get("evolved_patterns")
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            try:
+                await asyncio.sleep(0.05)
+                if workflow.get("fail"):
+                    raise RuntimeError("region stage failed")
+                return region, workflow["id"], {"status": "processed"}
+            finally:
+                self.active -= 1
+
+        self.integration._evolve_workflow_patterns = evolve
+        self.integration._process_in_region = process_in_region
+
+    def workflow(self, i: int, **extra) -> dict:
+        return {"id": f"wf-{i}", "user_region": "eu",
+                "pattern_data": {"type": "burnout"}, **extra}
+
+    def test_regional_stages_see_evolved_patterns(self):
+        """Both APIs evolve patterns before the Week 2 stage runs"""
+        single = self.workflow(0)
+        result = asyncio.run(
+            self.integration.process_global_workflow(single)
+        )
+        batch = [self.workflow(i) for i in range(1, 4)]
+        asyncio.run(self.integration.process_global_batch(batch))
+
+        self.assertEqual(result["workflow_id"], "wf-0")
+        self.assertEqual(result["region"], Region.EU_WEST.value)
+        self.assertEqual(
+            self.seen, {f"wf-{i}": {"pattern_type": "burnout"}
+                        for i in range(4)}
+        )
+
+    def test_failed_evolution_skips_regional_stages(self):
+        """A workflow whose evolution fails is not routed"""
+        async def failing_evolve(workflow):
+            raise RuntimeError("evolution failed")
+
+        self.integration._evolve_workflow_patterns = failing_evolve
+        workflow = self.workflow(0)
+
+        with self.assertRaises(RuntimeError):
+            asyncio.run(self.integration.process_global_workflow(workflow))
+        self.assertEqual(self.seen, {})
+        self.assertNotIn("evolved_patterns", workflow)
+
+    def test_batch_pipelines_with_bounded_stages(self):
+        """Batches keep input order, bound concurrency and isolate errors"""
+        workflows = [self.workflow(i, fail=(i == 3)) for i in range(12)]
+
+        start = time.perf_counter()
+        results = asyncio.run(self.integration.process_global_batch(
+            workflows, queue_size=2, stage_workers=4
+        ))
+        elapsed = time.perf_counter() - start
+
+        # 12 workflows x 2 stages x 50ms, 4 at a time per stage
+        self.assertLess(elapsed, 0.6)
+        self.assertEqual(self.peak, 4)
+        self.assertEqual(results[3]["status"], "error")
+        self.assertEqual(
+            [r["workflow_id"] for i, r in enumerate(results) if i != 3],
+            [f"wf-{i}" for i in range(12) if i != 3]
+        )
+        self.assertTrue(all("evolved_patterns" in w for w in workflows))
+        self.assertEqual(
+            self.integration.integration_metrics[
+                "global_workflows_processed"
+            ],
+            11
+        )
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -7,10 +7,14 @@ Week 3 Implementation - Advanced Pattern Learning
 
 import asyncio
 import logging
+import os
+import re
+import time
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Dict, List
-from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from collections import OrderedDict, defaultdict
 from pathlib import Path
 from sklearn.ensemble import RandomForestClassifier
 import joblib
@@ -22,17 +26,55 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Pattern evolution model configuration
+MODEL_PARAMS = {"n_estimators": 100, "max_depth": 10, "random_state": 42}
+MIN_TRAINING_SAMPLES = 100
+MAX_TRAINING_SAMPLES = 1000
+KEEP_MODEL_VERSIONS = 3
+FEATURE_COUNT = 50
+CORRELATION_THRESHOLD = 0.7
+CORRELATION_CHUNK_ROWS = 1024
+PATTERN_TYPES = (
+    "burnout", "disengagement", "crisis",
+    "recovery", "engagement", "resilience"
+)
+
 
 class AdvancedPatternLearner:
     """ML-based pattern evolution and cross-correlation system"""
 
-    def __init__(self, model_path: str = "models/pattern_evolution"):
+    def __init__(self, model_path: str = "models/pattern_evolution",
+                 batch_size: int = 64, batch_wait_ms: float = 2.0,
+                 retrain_every_samples: int = 100,
+                 retrain_interval_seconds: float = 300.0,
+                 history_capacity: int = MAX_TRAINING_SAMPLES,
+                 max_resident_models: int = len(PATTERN_TYPES)):
         self.model_path = Path(model_path)
         self.model_path.mkdir(parents=True, exist_ok=True)
 
-        self.pattern_models = {}
+        # Saved models load on first use; at most max_resident_models stay
+        self.pattern_models = ModelCache(max_resident=max_resident_models)
+        # Retraining policy: after N new samples or T seconds with new data
+        self.retrain_every_samples = retrain_every_samples
+        self.retrain_interval_seconds = retrain_interval_seconds
+        self.model_versions: Dict[str, int] = {}
+        self.samples_since_training = defaultdict(int)
+        self.last_trained: Dict[str, float] = {}
+        self.training_tasks: Dict[str, asyncio.Task] = {}
+        self.training_pool: Optional[ProcessPoolExecutor] = None
+        self.prediction_batcher = PredictionBatcher(
+            self._predict_batch,
+            max_batch_size=batch_size,
+            max_wait_ms=batch_wait_ms
+        )
         self.correlation_matrix = None
-        self.evolution_history = defaultdict(list)
+        self.correlation_counts = None
+        self.pattern_index: Dict[str, int] = {}
+        # Fixed-size window of recent samples per pattern type
+        self.history_capacity = history_capacity
+        self.evolution_history: Dict[str, EvolutionBuffer] = defaultdict(
+            lambda: EvolutionBuffer(self.history_capacity)
+        )
 
         self.metrics = {
             "patterns_evolved": 0,
@@ -56,60 +98,91 @@ class AdvancedPatternLearner:
 
     async def _load_or_create_models(self):
         """Load existing models or create new ones"""
-        pattern_types = [
-            "burnout", "disengagement", "crisis",
-            "recovery", "engagement", "resilience"
-        ]
-
-        for pattern_type in pattern_types:
-            model_file = self.model_path / f"{pattern_type}_model.pkl"
-
-            if model_file.exists():
-                self.pattern_models[pattern_type] = joblib.load(model_file)
-                logger.info(f"Loaded existing model for {pattern_type}")
-            else:
-                # Create new Random Forest model
-                model = RandomForestClassifier(
-                    n_estimators=100,
-                    max_depth=10,
-                    random_state=42
+        for pattern_type in PATTERN_TYPES:
+            version, model_file = self._latest_model_file(pattern_type)
+
+            # Record the artifact; it is loaded when first needed
+            self.pattern_models.register(pattern_type, model_file)
+            self.model_versions[pattern_type] = version
+            if model_file is not None:
+                logger.info(
+                    f"Found model version {version} for {pattern_type}"
                 )
-                self.pattern_models[pattern_type] = model
+            else:
+                # A new Random Forest model is created on first use
                 logger.info(f"Created new model for {pattern_type}")
 
+    def _model_file(self, pattern_type: str, version: int) -> Path:
+        """Path of one saved model version"""
+        return self.model_path / f"{pattern_type}_model.v{version}.pkl"
+
+    def _saved_versions(self, pattern_type: str) -> List[Tuple[int, Path]]:
+        """Saved model versions for a pattern type, oldest first"""
+        pattern = re.compile(
+            rf"{re.escape(pattern_type)}_model\.v(\d+)\.pkl"
+        )
+        versions = []
+        for model_file in self.model_path.glob(f"{pattern_type}_model.v*"):
+            match = pattern.fullmatch(model_file.name)
+            if match:
+                versions.append((int(match.group(1)), model_file))
+        return sorted(versions)
+
+    def _latest_model_file(
+            self, pattern_type: str) -> Tuple[int, Optional[Path]]:
+        """Newest saved model, falling back to the unversioned file"""
+        versions = self._saved_versions(pattern_type)
+        if versions:
+            return versions[-1]
+
+        legacy_file = self.model_path / f"{pattern_type}_model.pkl"
+        return (0, legacy_file) if legacy_file.exists() else (0, None)
+
     async def _initialize_correlation_engine(self):
         """Initialize cross-pattern correlation analysis"""
         # Initialize correlation matrix for pattern relationships
         pattern_count = len(self.pattern_models)
         self.correlation_matrix = np.zeros((pattern_count, pattern_count))
+        # Pattern pairs observed per type pair, for the running mean
+        self.correlation_counts = np.zeros((pattern_count, pattern_count))
+        self.pattern_index = {
+            pattern_type: i
+            for i, pattern_type in enumerate(self.pattern_models)
+        }
 
     async def evolve_pattern(self, pattern_data: Dict) -> Dict:
         """Evolve pattern understanding based on new data"""
         pattern_type = pattern_data.get("type")
-        features = self._extract_advanced_features(pattern_data)
 
         if pattern_type not in self.pattern_models:
             logger.warning(f"Unknown pattern type: {pattern_type}")
             return {"status": "unknown_pattern"}
 
-        model = self.pattern_models[pattern_type]
+        # Features are written straight into the history slot
+        history = self.evolution_history[pattern_type]
+        slot = history.claim()
+        features = self._extract_advanced_features(
+            pattern_data, out=history.features[slot]
+        )
 
         # Predict and refine
         try:
-            # Make prediction
-            prediction = model.predict_proba([features])[0]
-            confidence = max(prediction)
+            # Load the model off the event loop on first use
+            model = await self.pattern_models.load(pattern_type)
+
+            # Make prediction, batched with concurrent requests; the
+            # batch holds the model so an eviction cannot force a reload
+            prediction = await self.prediction_batcher.predict(
+                pattern_type, features, model
+            )
+            confidence = float(prediction.max())
 
             # Store evolution history
-            self.evolution_history[pattern_type].append({
-                "timestamp": datetime.now().isoformat(),
-                "features": features,
-                "confidence": confidence
-            })
+            history.commit(slot, confidence, time.time())
 
-            # Update model if we have enough history
-            if len(self.evolution_history[pattern_type]) >= 100:
-                await self._retrain_model(pattern_type)
+            # Retrain in the background when the policy says so
+            self.samples_since_training[pattern_type] += 1
+            self._schedule_retrain(pattern_type)
 
             self.metrics["patterns_evolved"] += 1
 
@@ -128,27 +201,38 @@ class AdvancedPatternLearner:
             logger.error(f"Pattern evolution error: {e}")
             return {"status": "error", "message": str(e)}
 
-    def _extract_advanced_features(self, pattern_data: Dict) -> List[float]:
-        """Extract advanced ML features from pattern data"""
-        features = []
+    @staticmethod
+    def _predict_batch(pattern_type: str, model: RandomForestClassifier,
+                       features: np.ndarray) -> np.ndarray:
+        """Class probabilities for a batch of feature rows"""
+        if not hasattr(model, "estimators_"):
+            # No trained version yet: uninformative prior
+            return np.full((len(features), 2), 0.5)
+        return model.predict_proba(features)
+
+    def _extract_advanced_features(
+            self, pattern_data: Dict,
+            out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Extract advanced ML features from pattern data
+
+        Fills ``out`` (a FEATURE_COUNT row) in place when given,
+        otherwise a new float32 row; unused features stay zero.
+        """
+        if out is None:
+            out = np.zeros(FEATURE_COUNT, dtype=np.float32)
+        else:
+            out.fill(0.0)
 
         # Temporal features
-        time_features = self._extract_temporal_features(pattern_data)
-        features.extend(time_features)
+        out[0:3] = self._extract_temporal_features(pattern_data)
 
         # Behavioral features
-        behavioral_features = self._extract_behavioral_features(pattern_data)
-        features.extend(behavioral_features)
+        out[3:6] = self._extract_behavioral_features(pattern_data)
 
         # Contextual features
-        contextual_features = self._extract_contextual_features(pattern_data)
-        features.extend(contextual_features)
+        out[6:9] = self._extract_contextual_features(pattern_data)
 
-        # Ensure consistent feature length
-        while len(features) < 50:  # Pad to 50 features
-            features.append(0.0)
-
-        return features[:50]  # Truncate to 50 features
+        return out
 
     def _extract_temporal_features(self, data: Dict) -> List[float]:
         """Extract time-based features"""
@@ -204,35 +288,104 @@ class AdvancedPatternLearner:
 
         return features
 
+    def _schedule_retrain(self, pattern_type: str):
+        """Start a background retrain if the policy says one is due"""
+        if pattern_type in self.training_tasks:
+            return
+        if len(self.evolution_history[pattern_type]) < MIN_TRAINING_SAMPLES:
+            return
+
+        new_samples = self.samples_since_training[pattern_type]
+        since_trained = time.monotonic() - self.last_trained.get(
+            pattern_type, float("-inf")
+        )
+        if new_samples >= self.retrain_every_samples or (
+                new_samples and
+                since_trained >= self.retrain_interval_seconds):
+            task = asyncio.create_task(self._retrain_model(pattern_type))
+            self.training_tasks[pattern_type] = task
+            task.add_done_callback(
+                lambda done: self._training_finished(pattern_type, done)
+            )
+
+    def _training_finished(self, pattern_type: str, task: asyncio.Task):
+        """Clear a finished training run and log failures"""
+        self.training_tasks.pop(pattern_type, None)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(
+                f"Retraining {pattern_type} failed: {task.exception()}"
+            )
+
     async def _retrain_model(self, pattern_type: str):
-        """Retrain model with accumulated data"""
+        """Retrain model with accumulated data
+
+        The forest is fitted and saved in a worker process; the new
+        version is swapped in once loaded, so inference keeps using the
+        previous model meanwhile.
+        """
         history = self.evolution_history[pattern_type]
 
-        if len(history) < 100:
+        if len(history) < MIN_TRAINING_SAMPLES:
             return
 
-        # Prepare training data
-        X = [entry["features"] for entry in history[-1000:]]  # Last 1000
+        # Prepare training data from the retained window. The pool
+        # pickles its arguments later, from a feeder thread, while new
+        # events keep rewriting buffer rows, so it gets a snapshot
+        X, confidence = history.training_data()
+        X = X.copy()
         # Create synthetic labels based on confidence
-        y = [
-            1 if entry["confidence"] > 0.7 else 0
-            for entry in history[-1000:]
-        ]
+        y = (confidence > 0.7).astype(np.int8)
+
+        version = self.model_versions.get(pattern_type, 0) + 1
+        self.samples_since_training[pattern_type] = 0
+        self.last_trained[pattern_type] = time.monotonic()
+
+        # A forest fitted on one label scores every event as certain
+        # (e.g. a window scored only by the 0.5 prior); keep the
+        # current model until the window holds both labels
+        if np.unique(y).size < 2:
+            logger.info(
+                f"Skipping {pattern_type} retrain: every sample has "
+                f"the same label"
+            )
+            return
 
-        # Retrain model
-        model = self.pattern_models[pattern_type]
-        model.fit(X, y)
+        # Retrain and save the new version out of process
+        if self.training_pool is None:
+            self.training_pool = ProcessPoolExecutor(max_workers=1)
+        loop = asyncio.get_running_loop()
+        model_file = await loop.run_in_executor(
+            self.training_pool, _train_model_version,
+            X, y, str(self._model_file(pattern_type, version))
+        )
+        model = await loop.run_in_executor(
+            None, joblib.load, model_file, self.pattern_models.mmap_mode
+        )
 
-        # Save updated model
-        model_file = self.model_path / f"{pattern_type}_model.pkl"
-        joblib.dump(model, model_file)
+        # Swap in the new version
+        self.pattern_models.install(pattern_type, model, Path(model_file))
+        self.model_versions[pattern_type] = version
+        for _, old_file in self._saved_versions(
+                pattern_type)[:-KEEP_MODEL_VERSIONS]:
+            old_file.unlink(missing_ok=True)
 
         self.metrics["model_updates"] += 1
-        logger.info(f"Retrained model for {pattern_type}")
+        logger.info(f"Retrained model for {pattern_type} (v{version})")
+
+    async def shutdown(self):
+        """Stop background training"""
+        tasks = list(self.training_tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        if self.training_pool is not None:
+            self.training_pool.shutdown(wait=True, cancel_futures=True)
+            self.training_pool = None
 
     def _calculate_evolution_stage(self, pattern_type: str) -> str:
         """Calculate pattern evolution stage"""
-        history_length = len(self.evolution_history[pattern_type])
+        history_length = self.evolution_history[pattern_type].recorded
 
         if history_length < 100:
             return "initial"
@@ -279,22 +432,56 @@ class AdvancedPatternLearner:
         correlations = []
         insights = []
 
-        # Analyze pattern pairs
-        for i in range(len(patterns)):
-            for j in range(i + 1, len(patterns)):
-                correlation = await self._calculate_pattern_correlation(
-                    patterns[i], patterns[j]
-                )
-
-                if correlation["strength"] > 0.7:
-                    correlations.append(correlation)
-
-                    # Generate insight
-                    insight = self._generate_correlation_insight(
-                        patterns[i], patterns[j], correlation
-                    )
-                    insights.append(insight)
-
+        # Extract features once, standardised so row dot products are
+        # Pearson correlations
+        features = np.zeros((len(patterns), FEATURE_COUNT), np.float64)
+        for row, pattern in zip(features, patterns):
+            self._extract_advanced_features(pattern, out=row)
+        standardized = self._standardize_rows(features)
+        type_indicator = self._pattern_type_indicator(patterns)
+
+        # Analyze pattern pairs, one tile of the matrix at a time
+        type_sums = np.zeros_like(self.correlation_matrix)
+        type_counts = np.zeros_like(self.correlation_counts)
+        strong_pairs = []
+        for rows, columns, pairs in self._correlation_tiles(len(patterns)):
+            coefficients = standardized[rows] @ standardized[columns].T
+            row_types = type_indicator[rows].T
+            column_types = type_indicator[columns]
+            type_sums += row_types @ (coefficients * pairs) @ column_types
+            type_counts += row_types @ pairs @ column_types
+
+            strong = pairs & (
+                np.abs(coefficients) > CORRELATION_THRESHOLD
+            )
+            i, j = np.nonzero(strong)
+            strong_pairs.append(
+                (i + rows.start, j + columns.start, coefficients[i, j])
+            )
+
+            # Let other coroutines run between tiles
+            await asyncio.sleep(0)
+
+        # Report strong pairs in (i, j) order
+        first, second, strengths = (
+            np.concatenate(column) for column in zip(*strong_pairs)
+        )
+        order = np.lexsort((second, first))
+        for i, j, coefficient in zip(first[order].tolist(),
+                                     second[order].tolist(),
+                                     strengths[order].tolist()):
+            correlation = self._pattern_correlation(
+                patterns[i], patterns[j], coefficient
+            )
+            correlations.append(correlation)
+
+            # Generate insight
+            insight = self._generate_correlation_insight(
+                patterns[i], patterns[j], correlation
+            )
+            insights.append(insight)
+
+        self._update_correlation_matrix(type_sums, type_counts)
         self.metrics["correlations_discovered"] += len(correlations)
         self.metrics["cross_pattern_insights"] += len(insights)
 
@@ -304,16 +491,67 @@ class AdvancedPatternLearner:
             "correlation_matrix": self.correlation_matrix.tolist()
         }
 
-    async def _calculate_pattern_correlation(
-            self, pattern1: Dict, pattern2: Dict) -> Dict:
-        """Calculate correlation between two patterns"""
-        # Extract features for both patterns
-        features1 = np.array(self._extract_advanced_features(pattern1))
-        features2 = np.array(self._extract_advanced_features(pattern2))
+    @staticmethod
+    def _correlation_tiles(count: int):
+        """Yield (rows, columns, pair mask) tiles covering each i < j once"""
+        for row_start in range(0, count, CORRELATION_CHUNK_ROWS):
+            rows = slice(row_start,
+                         min(row_start + CORRELATION_CHUNK_ROWS, count))
+            for column_start in range(row_start, count,
+                                      CORRELATION_CHUNK_ROWS):
+                columns = slice(
+                    column_start,
+                    min(column_start + CORRELATION_CHUNK_ROWS, count)
+                )
+                shape = (rows.stop - rows.start,
+                         columns.stop - columns.start)
+                if column_start == row_start:
+                    pairs = np.triu(np.ones(shape, bool), k=1)
+                else:
+                    pairs = np.ones(shape, bool)
+                yield rows, columns, pairs
+
+    @staticmethod
+    def _standardize_rows(features: np.ndarray) -> np.ndarray:
+        """Center rows and scale them to unit norm
+
+        Constant rows have no defined correlation and are left as zeros.
+        """
+        centered = features - features.mean(axis=1, keepdims=True)
+        norms = np.linalg.norm(centered, axis=1, keepdims=True)
+        return np.divide(
+            centered, norms, out=np.zeros_like(centered), where=norms > 0
+        )
 
-        # Calculate correlation coefficient
-        correlation = np.corrcoef(features1, features2)[0, 1]
+    def _pattern_type_indicator(self, patterns: List[Dict]) -> np.ndarray:
+        """One-hot (n, pattern types) matrix; unknown types are all zero"""
+        indicator = np.zeros((len(patterns), len(self.pattern_index)))
+        for row, pattern in enumerate(patterns):
+            column = self.pattern_index.get(pattern.get("type"))
+            if column is not None:
+                indicator[row, column] = 1.0
+        return indicator
+
+    def _update_correlation_matrix(self, type_sums: np.ndarray,
+                                   type_counts: np.ndarray):
+        """Fold new pair correlations into the per-type running means"""
+        # Pairs were counted once; mirror them so the matrix is symmetric
+        type_sums = type_sums + type_sums.T
+        type_counts = type_counts + type_counts.T
+
+        total_counts = self.correlation_counts + type_counts
+        self.correlation_matrix = np.divide(
+            self.correlation_matrix * self.correlation_counts + type_sums,
+            total_counts,
+            out=np.zeros_like(self.correlation_matrix),
+            where=total_counts > 0
+        )
+        self.correlation_counts = total_counts
 
+    @staticmethod
+    def _pattern_correlation(pattern1: Dict, pattern2: Dict,
+                             correlation: float) -> Dict:
+        """Describe the correlation between two patterns"""
         return {
             "pattern1": pattern1.get("type"),
             "pattern2": pattern2.get("type"),
@@ -344,22 +582,303 @@ class AdvancedPatternLearner:
     def get_evolution_metrics(self) -> Dict:
         """Get pattern evolution metrics"""
         total_history = sum(
-            len(hist) for hist in self.evolution_history.values()
+            hist.recorded for hist in self.evolution_history.values()
+        )
+        history_bytes = sum(
+            hist.nbytes for hist in self.evolution_history.values()
         )
 
         return {
             "patterns_evolved": self.metrics["patterns_evolved"],
             "total_evolution_data_points": total_history,
+            "evolution_history_kb": f"{history_bytes / 1024:.0f}",
             "correlations_discovered": self.metrics["correlations_discovered"],
             "cross_pattern_insights": self.metrics["cross_pattern_insights"],
             "model_updates": self.metrics["model_updates"],
+            "model_versions": dict(self.model_versions),
+            "retrains_in_progress": len(self.training_tasks),
             "prediction_accuracy": (
                 f"{self.metrics['prediction_accuracy']:.1%}"
             ),
-            "active_pattern_types": len(self.pattern_models)
+            "active_pattern_types": len(self.pattern_models),
+            "resident_models": self.pattern_models.resident_count(),
+            "model_loads": self.pattern_models.loads,
+            "prediction_batches": self.prediction_batcher.batches,
+            "avg_prediction_batch_size": (
+                f"{self.prediction_batcher.mean_batch_size():.1f}"
+            )
         }
 
 
+class ModelCache:
+    """Pattern models keyed by type, loaded lazily from saved artifacts
+
+    Saved models are loaded on first use and kept in an LRU of at most
+    ``max_resident``; an evicted model is reloaded from its file when
+    next needed. Types without an artifact get a fresh unfitted model,
+    and models assigned directly (with no file to reload from) are
+    never evicted.
+
+    ``mmap_mode`` is passed to ``joblib.load``. It is off by default:
+    sklearn trees copy their node arrays out of a mapping on load, so
+    mapping forests shares no memory and makes loads slower.
+    """
+
+    def __init__(self, max_resident: int = len(PATTERN_TYPES),
+                 mmap_mode: Optional[str] = None):
+        self.max_resident = max_resident
+        self.mmap_mode = mmap_mode
+        # pattern type -> saved artifact, or None when there is none
+        self.files: Dict[str, Optional[Path]] = {}
+        self.resident: OrderedDict = OrderedDict()
+        self.unsaved: Dict[str, RandomForestClassifier] = {}
+        self.loading: Dict[str, asyncio.Future] = {}
+        self.loads = 0
+        self.evictions = 0
+
+    def __contains__(self, pattern_type: str) -> bool:
+        return pattern_type in self.files
+
+    def __len__(self) -> int:
+        return len(self.files)
+
+    def __iter__(self):
+        return iter(list(self.files))
+
+    def __getitem__(self, pattern_type: str) -> RandomForestClassifier:
+        """Model for a pattern type, loading it synchronously if needed"""
+        model = self._cached(pattern_type)
+        if model is None:
+            model = joblib.load(self.files[pattern_type], self.mmap_mode)
+            self._admit(pattern_type, model)
+        return model
+
+    def __setitem__(self, pattern_type: str,
+                    model: RandomForestClassifier):
+        """Assign an in-memory model with no artifact behind it"""
+        self.files.setdefault(pattern_type, None)
+        self.resident.pop(pattern_type, None)
+        self.unsaved[pattern_type] = model
+
+    def register(self, pattern_type: str, model_file: Optional[Path]):
+        """Declare a pattern type and its saved artifact, if any"""
+        self.files[pattern_type] = model_file
+        self.resident.pop(pattern_type, None)
+        self.unsaved.pop(pattern_type, None)
+
+    def install(self, pattern_type: str, model: RandomForestClassifier,
+                model_file: Path):
+        """Swap in a freshly loaded model and the artifact it came from"""
+        self.register(pattern_type, model_file)
+        self._admit(pattern_type, model)
+
+    async def load(self, pattern_type: str) -> RandomForestClassifier:
+        """Model for a pattern type, loading it in an executor if needed
+
+        Concurrent first uses of the same type share one load.
+        """
+        model = self._cached(pattern_type)
+        if model is not None:
+            return model
+
+        pending = self.loading.get(pattern_type)
+        if pending is None:
+            model_file = self.files[pattern_type]
+            loop = asyncio.get_running_loop()
+            pending = loop.run_in_executor(
+                None, joblib.load, model_file, self.mmap_mode
+            )
+            self.loading[pattern_type] = pending
+            try:
+                model = await pending
+            finally:
+                self.loading.pop(pattern_type, None)
+            # Keep a newer version installed while this one loaded
+            if self.files.get(pattern_type) == model_file:
+                self._admit(pattern_type, model)
+            return model
+        return await asyncio.shield(pending)
+
+    def resident_count(self) -> int:
+        """Models currently held in memory"""
+        return len(self.resident) + len(self.unsaved)
+
+    def _cached(self, pattern_type: str) -> Optional[RandomForestClassifier]:
+        """In-memory model for a type, creating unsaved ones on demand"""
+        if pattern_type in self.unsaved:
+            return self.unsaved[pattern_type]
+        if pattern_type in self.resident:
+            self.resident.move_to_end(pattern_type)
+            return self.resident[pattern_type]
+        if self.files[pattern_type] is None:
+            # Create new Random Forest model
+            model = RandomForestClassifier(**MODEL_PARAMS)
+            self.unsaved[pattern_type] = model
+            return model
+        return None
+
+    def _admit(self, pattern_type: str, model: RandomForestClassifier):
+        """Make a file-backed model resident, evicting the least recent"""
+        self.loads += 1
+        self.resident[pattern_type] = model
+        self.resident.move_to_end(pattern_type)
+        while len(self.resident) > self.max_resident:
+            self.resident.popitem(last=False)
+            self.evictions += 1
+
+
+class EvolutionBuffer:
+    """Preallocated ring buffer of evolution samples for one pattern type
+
+    Feature rows, confidences and epoch timestamps live in parallel
+    arrays of fixed ``capacity``; once full, the oldest sample is
+    overwritten. A slot is claimed before its features are written and
+    committed once the prediction is known, so concurrent evolutions
+    never share a row. Uncommitted slots carry a NaN confidence.
+    """
+
+    def __init__(self, capacity: int = MAX_TRAINING_SAMPLES,
+                 width: int = FEATURE_COUNT):
+        self.capacity = capacity
+        self.features = np.zeros((capacity, width), dtype=np.float32)
+        self.confidence = np.full(capacity, np.nan, dtype=np.float32)
+        self.timestamps = np.full(capacity, np.nan)
+        self.head = 0
+        self.size = 0
+        self.committed = 0
+        self.recorded = 0
+
+    def __len__(self) -> int:
+        """Committed samples currently retained"""
+        return self.committed
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the buffer arrays"""
+        return (self.features.nbytes + self.confidence.nbytes +
+                self.timestamps.nbytes)
+
+    def claim(self) -> int:
+        """Reserve the next slot, evicting the oldest sample when full"""
+        slot = self.head
+        self.head = (slot + 1) % self.capacity
+        if self.size < self.capacity:
+            self.size += 1
+        elif not np.isnan(self.confidence[slot]):
+            self.committed -= 1
+        self.confidence[slot] = np.nan
+        self.timestamps[slot] = np.nan
+        return slot
+
+    def commit(self, slot: int, confidence: float, timestamp: float):
+        """Record the outcome for a claimed slot"""
+        if np.isnan(self.confidence[slot]):
+            self.committed += 1
+        self.confidence[slot] = confidence
+        self.timestamps[slot] = timestamp
+        self.recorded += 1
+
+    def training_data(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Features and confidences of the retained samples
+
+        Row order is slot order, not arrival order. These are views into
+        the buffer when every slot is committed, copies otherwise; copy
+        them before handing them to anything that outlives the call.
+        """
+        features = self.features[:self.size]
+        confidence = self.confidence[:self.size]
+        if self.committed == self.size:
+            return features, confidence
+        valid = ~np.isnan(confidence)
+        return features[valid], confidence[valid]
+
+
+class PredictionBatcher:
+    """Micro-batches concurrent predictions per pattern type
+
+    Requests for a pattern type are held for up to ``max_wait_ms`` or
+    until ``max_batch_size`` arrive, then scored with a single
+    ``predict`` call and each caller's future gets its own row. Each
+    request brings the model to score with; a batch uses the model of
+    its latest request. A failed batch fails every request in it.
+    """
+
+    def __init__(self,
+                 predict: Callable[[str, Any, np.ndarray], np.ndarray],
+                 max_batch_size: int = 64, max_wait_ms: float = 2.0):
+        self.predict_batch = predict
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_ms / 1000
+        # pattern type -> [model, [feature rows], [futures]]
+        self.pending: Dict[str, list] = {}
+        self.timers: Dict[str, asyncio.TimerHandle] = {}
+        self.batches = 0
+        self.predictions = 0
+
+    async def predict(self, pattern_type: str, features: np.ndarray,
+                      model: Any) -> np.ndarray:
+        """Probabilities for one feature row"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        batch = self.pending.setdefault(pattern_type, [model, [], []])
+        batch[0] = model
+        _, rows, futures = batch
+        rows.append(features)
+        futures.append(future)
+
+        if len(rows) >= self.max_batch_size:
+            self._flush(pattern_type)
+        elif len(rows) == 1:
+            self.timers[pattern_type] = loop.call_later(
+                self.max_wait_seconds, self._flush, pattern_type
+            )
+
+        return await future
+
+    def _flush(self, pattern_type: str):
+        """Score every pending request for a pattern type"""
+        timer = self.timers.pop(pattern_type, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self.pending.pop(pattern_type, None)
+        if batch is None:
+            return
+        model, rows, futures = batch
+
+        self.batches += 1
+        self.predictions += len(rows)
+        try:
+            probabilities = self.predict_batch(
+                pattern_type, model, np.asarray(rows, dtype=np.float32)
+            )
+        except Exception as e:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for future, row in zip(futures, probabilities):
+            if not future.done():
+                future.set_result(row)
+
+    def mean_batch_size(self) -> float:
+        """Average requests scored per batch"""
+        return self.predictions / self.batches if self.batches else 0.0
+
+
+def _train_model_version(features: np.ndarray, labels: np.ndarray,
+                         model_file: str) -> str:
+    """Fit a pattern model and save it (runs in a training process)"""
+    model = RandomForestClassifier(**MODEL_PARAMS).fit(features, labels)
+
+    # Write then rename so readers never see a partial file
+    temp_file = f"{model_file}.tmp"
+    joblib.dump(model, temp_file)
+    os.replace(temp_file, model_file)
+    return model_file
+
+
 # Integration function
 async def create_advanced_pattern_learner():
     """Create and initialize advanced pattern learning system"""
@@ -428,6 +947,8 @@ async def main():
     for key, value in metrics.items():
         print(f"  - {key}: {value}")
 
+    await learner.shutdown()
+
 
 if __name__ == "__main__":
     asyncio.run(main())
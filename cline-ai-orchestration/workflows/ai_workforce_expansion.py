@@ -6,6 +6,8 @@ Week 3 Implementation - AI Workforce Expansion
 """
 
 import asyncio
+import heapq
+import itertools
 import logging
 from datetime import datetime
 from typing import Dict, List, Optional
@@ -14,6 +16,8 @@ import uuid
 from dataclasses import dataclass, field
 from enum import Enum
 
+import numpy as np
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -44,6 +48,19 @@ class AgentStatus(Enum):
     OFFLINE = "offline"
 
 
+# Task types mapped to the specialization that should handle them
+TASK_SPECIALIZATION_MAP = {
+    "crisis": AgentSpecialization.CRISIS_RESPONSE,
+    "pattern": AgentSpecialization.PATTERN_ANALYSIS,
+    "intervention": AgentSpecialization.INTERVENTION_PLANNING,
+    "communication": AgentSpecialization.COMMUNICATION,
+    "data": AgentSpecialization.DATA_PROCESSING,
+    "resource": AgentSpecialization.RESOURCE_ALLOCATION,
+    "compliance": AgentSpecialization.COMPLIANCE_MONITORING,
+    "quality": AgentSpecialization.QUALITY_ASSURANCE
+}
+
+
 @dataclass
 class AgentCapability:
     """Agent capability definition"""
@@ -66,17 +83,298 @@ class AIAgent:
     last_active: Optional[datetime] = None
 
 
+SPECIALIZATIONS = list(AgentSpecialization)
+SPECIALIZATION_CODES = {
+    spec: code for code, spec in enumerate(SPECIALIZATIONS)
+}
+STATUSES = list(AgentStatus)
+STATUS_CODES = {status: code for code, status in enumerate(STATUSES)}
+# Agents that can take a task now or once they start or free a slot
+SCHEDULABLE_STATUSES = (
+    AgentStatus.INITIALIZING, AgentStatus.IDLE,
+    AgentStatus.ACTIVE, AgentStatus.BUSY
+)
+
+
+class NoAgentAvailableError(RuntimeError):
+    """No agent in the workforce can take a task"""
+
+
+class AgentPool:
+    """Structure-of-arrays storage for the agent workforce
+
+    Per-agent fields live in NumPy columns indexed by row, so a large
+    pool costs tens of bytes per agent plus its ID. Capability lists
+    are interned into shared profiles, and status and specialization
+    counts are maintained incrementally. Looking an agent up by ID
+    returns an ``AgentView`` over its row.
+    """
+
+    def __init__(self, capacity: int = 128):
+        self.ids: List[str] = []
+        self.rows: Dict[str, int] = {}
+        # Interned capability tuples and their slot search order
+        self.profiles: List[tuple] = []
+        self.profile_rows: Dict[tuple, int] = {}
+        self.profile_order: List[tuple] = []
+        self.status_counts = np.zeros(len(STATUSES), dtype=np.int64)
+        self.specialization_counts = np.zeros(
+            len(SPECIALIZATIONS), dtype=np.int64
+        )
+        self.capacity = 0
+        self.slot_width = 1
+        self.status = np.zeros(0, dtype=np.int8)
+        self.specialization = np.zeros(0, dtype=np.int8)
+        self.performance = np.zeros(0, dtype=np.float32)
+        self.tasks_completed = np.zeros(0, dtype=np.int64)
+        self.profile = np.zeros(0, dtype=np.int32)
+        self.created_at = np.zeros(0, dtype=np.float64)
+        self.last_active = np.zeros(0, dtype=np.float64)
+        self.running = np.zeros((0, 1), dtype=np.int16)
+        self._resize(capacity, self.slot_width)
+
+    def _resize(self, capacity: int, slot_width: int):
+        """Reallocate columns, keeping existing rows"""
+        count = len(self.ids)
+        for name in ("status", "specialization", "performance",
+                     "tasks_completed", "profile", "created_at",
+                     "last_active"):
+            old = getattr(self, name)
+            column = np.zeros(capacity, dtype=old.dtype)
+            column[:count] = old[:count]
+            setattr(self, name, column)
+
+        running = np.zeros((capacity, slot_width), dtype=np.int16)
+        running[:count, :self.running.shape[1]] = self.running[:count]
+        self.running = running
+        self.capacity = capacity
+        self.slot_width = slot_width
+
+    def _intern(self, capabilities: List[AgentCapability]) -> int:
+        """Row of the shared profile for a capability list"""
+        key = tuple(
+            (cap.name, cap.proficiency_level, tuple(cap.domain_knowledge),
+             cap.max_concurrent_tasks)
+            for cap in capabilities
+        )
+        profile = self.profile_rows.get(key)
+        if profile is None:
+            profile = len(self.profiles)
+            self.profile_rows[key] = profile
+            self.profiles.append(tuple(capabilities))
+            self.profile_order.append(tuple(sorted(
+                range(len(capabilities)),
+                key=lambda i: -capabilities[i].proficiency_level
+            )))
+            if len(capabilities) > self.slot_width:
+                self._resize(self.capacity, len(capabilities))
+        return profile
+
+    def add(self, agent: AIAgent) -> "AgentView":
+        """Store an agent and return a view of it"""
+        row = len(self.ids)
+        if row == self.capacity:
+            self._resize(self.capacity * 2, self.slot_width)
+
+        self.ids.append(agent.agent_id)
+        self.rows[agent.agent_id] = row
+        status = STATUS_CODES[agent.status]
+        specialization = SPECIALIZATION_CODES[agent.specialization]
+        self.status[row] = status
+        self.specialization[row] = specialization
+        self.performance[row] = agent.performance_score
+        self.tasks_completed[row] = agent.tasks_completed
+        self.profile[row] = self._intern(agent.capabilities)
+        self.created_at[row] = agent.creation_time.timestamp()
+        self.last_active[row] = (
+            agent.last_active.timestamp() if agent.last_active
+            else np.nan
+        )
+        self.status_counts[status] += 1
+        self.specialization_counts[specialization] += 1
+        return AgentView(self, row)
+
+    def set_status(self, row: int, status: AgentStatus):
+        """Change a row's status and the status counters"""
+        code = STATUS_CODES[status]
+        self.status_counts[self.status[row]] -= 1
+        self.status_counts[code] += 1
+        self.status[row] = code
+
+    def reserve_slot(self, row: int) -> Optional[AgentCapability]:
+        """Take a slot on the most proficient capability with room"""
+        profile = self.profile[row]
+        capabilities = self.profiles[profile]
+        running = self.running[row]
+        for index in self.profile_order[profile]:
+            if running[index] < capabilities[index].max_concurrent_tasks:
+                running[index] += 1
+                return capabilities[index]
+        return None
+
+    def has_free_slot(self, row: int) -> bool:
+        """Whether any capability has room for another task"""
+        running = self.running[row]
+        return any(
+            running[index] < capability.max_concurrent_tasks
+            for index, capability in enumerate(
+                self.profiles[self.profile[row]]
+            )
+        )
+
+    def release_slot(self, row: int, capability: AgentCapability):
+        """Return a slot taken by ``reserve_slot``"""
+        index = self.profiles[self.profile[row]].index(capability)
+        self.running[row, index] -= 1
+
+    def count(self, *statuses: AgentStatus) -> int:
+        """Number of agents in any of the given statuses"""
+        return int(sum(
+            self.status_counts[STATUS_CODES[status]] for status in statuses
+        ))
+
+    def counts_by_specialization(self) -> Dict[str, int]:
+        """Agent count per specialization present in the pool"""
+        return {
+            spec.value: int(count)
+            for spec, count in zip(SPECIALIZATIONS,
+                                   self.specialization_counts)
+            if count
+        }
+
+    def mean_performance(self) -> float:
+        """Mean performance score across the pool"""
+        if not self.ids:
+            return 0.0
+        return float(self.performance[:len(self.ids)].mean())
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, agent_id: str) -> bool:
+        return agent_id in self.rows
+
+    def __getitem__(self, agent_id: str) -> "AgentView":
+        return AgentView(self, self.rows[agent_id])
+
+    def __iter__(self):
+        return iter(self.ids)
+
+    def get(self, agent_id: str, default=None) -> Optional["AgentView"]:
+        row = self.rows.get(agent_id)
+        return default if row is None else AgentView(self, row)
+
+    def values(self):
+        return (AgentView(self, row) for row in range(len(self.ids)))
+
+
+class AgentView:
+    """An agent's row in an ``AgentPool``, with ``AIAgent`` attributes"""
+
+    __slots__ = ("pool", "row")
+
+    def __init__(self, pool: AgentPool, row: int):
+        self.pool = pool
+        self.row = row
+
+    @property
+    def agent_id(self) -> str:
+        return self.pool.ids[self.row]
+
+    @property
+    def specialization(self) -> AgentSpecialization:
+        return SPECIALIZATIONS[self.pool.specialization[self.row]]
+
+    @property
+    def capabilities(self) -> tuple:
+        return self.pool.profiles[self.pool.profile[self.row]]
+
+    @property
+    def status(self) -> AgentStatus:
+        return STATUSES[self.pool.status[self.row]]
+
+    @status.setter
+    def status(self, status: AgentStatus):
+        self.pool.set_status(self.row, status)
+
+    @property
+    def performance_score(self) -> float:
+        return float(self.pool.performance[self.row])
+
+    @performance_score.setter
+    def performance_score(self, score: float):
+        self.pool.performance[self.row] = score
+
+    @property
+    def tasks_completed(self) -> int:
+        return int(self.pool.tasks_completed[self.row])
+
+    @tasks_completed.setter
+    def tasks_completed(self, count: int):
+        self.pool.tasks_completed[self.row] = count
+
+    @property
+    def creation_time(self) -> datetime:
+        return datetime.fromtimestamp(self.pool.created_at[self.row])
+
+    @property
+    def last_active(self) -> Optional[datetime]:
+        timestamp = self.pool.last_active[self.row]
+        return None if np.isnan(timestamp) else datetime.fromtimestamp(
+            timestamp
+        )
+
+    @last_active.setter
+    def last_active(self, moment: Optional[datetime]):
+        self.pool.last_active[self.row] = (
+            moment.timestamp() if moment else np.nan
+        )
+
+    def reserve_slot(self) -> Optional[AgentCapability]:
+        return self.pool.reserve_slot(self.row)
+
+    def has_free_slot(self) -> bool:
+        return self.pool.has_free_slot(self.row)
+
+    def release_slot(self, capability: AgentCapability):
+        self.pool.release_slot(self.row, capability)
+
+    def running_count(self) -> int:
+        """Tasks currently running on this agent"""
+        return int(self.pool.running[self.row].sum())
+
+    def __eq__(self, other) -> bool:
+        return (
+            isinstance(other, AgentView) and
+            other.pool is self.pool and other.row == self.row
+        )
+
+    def __hash__(self) -> int:
+        return hash((id(self.pool), self.row))
+
+    def __repr__(self) -> str:
+        return (
+            f"AgentView({self.agent_id!r}, {self.specialization.value}, "
+            f"{self.status.value})"
+        )
+
+
 class AIWorkforceExpansion:
     """AI Workforce expansion and management system"""
 
     def __init__(self, target_agents: int = 100):
         self.target_agents = target_agents
-        self.agent_pool = {}
+        self.agent_pool = AgentPool()
+        self.idle_agents = IdleAgentIndex()
         self.specialization_distribution = (
             self._define_specialization_distribution()
         )
+        # Intake buffer of (task_id, task, future) awaiting an agent slot
         self.task_queue = asyncio.Queue()
         self.task_results = defaultdict(list)
+        self.dispatcher = None
+        self.capacity_available = asyncio.Event()
+        self.running_tasks = set()
 
         self.metrics = {
             "total_agents": 0,
@@ -109,10 +407,14 @@ class AIWorkforceExpansion:
         )
 
         # Create agents based on specialization distribution
-        for specialization, count in self.specialization_distribution.items():
-            for i in range(count):
-                agent = await self._create_specialized_agent(specialization)
-                self.agent_pool[agent.agent_id] = agent
+        agents = await asyncio.gather(*(
+            self._create_specialized_agent(specialization)
+            for specialization, count in
+            self.specialization_distribution.items()
+            for _ in range(count)
+        ))
+        for agent in agents:
+            self.agent_pool.add(agent)
 
         self.metrics["total_agents"] = len(self.agent_pool)
         self.metrics["specialization_coverage"] = (
@@ -121,6 +423,7 @@ class AIWorkforceExpansion:
 
         # Activate agents
         await self._activate_all_agents()
+        self._ensure_dispatcher()
 
         total_agents = self.metrics['total_agents']
         logger.info(f"AI workforce initialized with {total_agents} agents")
@@ -214,112 +517,187 @@ class AIWorkforceExpansion:
         await asyncio.gather(*activation_tasks)
 
         # Count active agents
-        self.metrics["active_agents"] = sum(
-            1 for agent in self.agent_pool.values()
-            if agent.status in [AgentStatus.IDLE, AgentStatus.ACTIVE]
+        self.metrics["active_agents"] = self.agent_pool.count(
+            AgentStatus.IDLE, AgentStatus.ACTIVE
         )
 
-    async def _activate_agent(self, agent: AIAgent):
+    async def _activate_agent(self, agent: "AgentView"):
         """Activate a single agent"""
         await asyncio.sleep(0.01)  # Simulate activation
-        agent.status = AgentStatus.IDLE
+        self._set_agent_status(agent, AgentStatus.IDLE)
         agent.last_active = datetime.now()
 
-    def _calculate_specialization_coverage(self) -> float:
-        """Calculate how well specializations are covered"""
-        actual_distribution = defaultdict(int)
+    def _set_agent_status(self, agent: "AgentView", status: AgentStatus):
+        """Change an agent's status and keep the idle index in sync
 
-        for agent in self.agent_pool.values():
-            actual_distribution[agent.specialization] += 1
+        IDLE and ACTIVE agents have free task slots and can be
+        dispatched to; BUSY and other statuses cannot.
+        """
+        agent.status = status
+        if status in (AgentStatus.IDLE, AgentStatus.ACTIVE):
+            self.idle_agents.mark_idle(agent)
+            self.capacity_available.set()
+        else:
+            self.idle_agents.mark_unavailable(agent.agent_id)
 
-        # Calculate coverage score
-        total_expected = sum(self.specialization_distribution.values())
+    def _calculate_specialization_coverage(self) -> float:
+        """Calculate how well specializations are covered"""
+        expected = np.array([
+            self.specialization_distribution.get(spec, 0)
+            for spec in SPECIALIZATIONS
+        ], dtype=np.float64)
+        planned = expected > 0
 
-        if total_expected == 0:
+        if not planned.any():
             return 0.0
 
-        coverage_scores = []
-        for spec, expected in self.specialization_distribution.items():
-            actual = actual_distribution.get(spec, 0)
-            if expected > 0:
-                coverage = min(actual / expected, 1.0)
-                coverage_scores.append(coverage)
-
-        return (
-            sum(coverage_scores) / len(coverage_scores)
-            if coverage_scores else 0.0
+        # Coverage score per planned specialization, capped at 100%
+        actual = self.agent_pool.specialization_counts[planned]
+        return float(
+            np.minimum(actual / expected[planned], 1.0).mean()
         )
 
     async def distribute_task(self, task: Dict) -> str:
-        """Distribute a task to the most suitable agent"""
+        """Queue a task for the most suitable agent and return its ID"""
         task_id = str(uuid.uuid4())
-        task_type = task.get("type", "general")
-
-        # Find suitable agent
-        agent = await self._find_suitable_agent(task_type)
-
-        if not agent:
-            logger.warning(f"No suitable agent found for task {task_id}")
-            return task_id
-
-        # Assign task
-        await self._assign_task_to_agent(agent, task_id, task)
-
-        self.metrics["tasks_distributed"] += 1
-
+        future = await self.submit_task(task, task_id)
+        # Failures are logged where they happen; nobody awaits this one
+        future.add_done_callback(
+            lambda done: done.cancelled() or done.exception()
+        )
         return task_id
 
-    async def _find_suitable_agent(self, task_type: str) -> Optional[AIAgent]:
-        """Find the most suitable agent for a task"""
-        # Map task types to specializations
-        task_specialization_map = {
-            "crisis": AgentSpecialization.CRISIS_RESPONSE,
-            "pattern": AgentSpecialization.PATTERN_ANALYSIS,
-            "intervention": AgentSpecialization.INTERVENTION_PLANNING,
-            "communication": AgentSpecialization.COMMUNICATION,
-            "data": AgentSpecialization.DATA_PROCESSING,
-            "resource": AgentSpecialization.RESOURCE_ALLOCATION,
-            "compliance": AgentSpecialization.COMPLIANCE_MONITORING,
-            "quality": AgentSpecialization.QUALITY_ASSURANCE
-        }
+    async def submit_task(self, task: Dict,
+                          task_id: Optional[str] = None) -> asyncio.Future:
+        """Queue a task; the returned future resolves to its result
+
+        The future fails with NoAgentAvailableError when the workforce
+        has no agent that could run the task, and is cancelled if the
+        workforce shuts down first.
+        """
+        future = asyncio.get_running_loop().create_future()
+        if not self.agent_pool.count(*SCHEDULABLE_STATUSES):
+            self._reject_task(task_id or "unqueued", future)
+            return future
+        await self.task_queue.put(
+            (task_id or str(uuid.uuid4()), task, future)
+        )
+        self._ensure_dispatcher()
+        return future
+
+    def _ensure_dispatcher(self):
+        """Start the dispatcher that drains the task queue"""
+        if self.dispatcher is None or self.dispatcher.done():
+            self.dispatcher = asyncio.create_task(self._dispatch_loop())
+
+    async def _dispatch_loop(self):
+        """Assign queued tasks to agents as slots become free
+
+        Dispatch only reserves a slot and starts execution, so tasks run
+        concurrently up to each capability's ``max_concurrent_tasks``.
+        """
+        while True:
+            task_id, task, future = await self.task_queue.get()
+            if future.cancelled():
+                continue
+
+            try:
+                agent = await self._find_suitable_agent(task.get("type"))
+                while agent is None:
+                    if not self.agent_pool.count(*SCHEDULABLE_STATUSES):
+                        break
+                    # Wait for a running task to release its slot
+                    self.capacity_available.clear()
+                    await self.capacity_available.wait()
+                    agent = await self._find_suitable_agent(
+                        task.get("type")
+                    )
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+
+            if agent is None:
+                self._reject_task(task_id, future)
+                continue
+            self._assign_task_to_agent(agent, task_id, task, future)
+            self.metrics["tasks_distributed"] += 1
+
+    @staticmethod
+    def _reject_task(task_id: str, future: asyncio.Future):
+        """Fail a task no agent can run"""
+        logger.warning(f"No suitable agent found for task {task_id}")
+        if not future.done():
+            future.set_exception(
+                NoAgentAvailableError(f"No agent available for {task_id}")
+            )
 
-        preferred_spec = task_specialization_map.get(
+    async def _find_suitable_agent(
+            self, task_type: str) -> Optional["AgentView"]:
+        """Find the most suitable agent for a task
+
+        Prefers the best-scoring idle agent of the matching
+        specialization, falling back to the best idle agent overall.
+        """
+        preferred_spec = TASK_SPECIALIZATION_MAP.get(
             task_type,
             AgentSpecialization.DATA_PROCESSING
         )
 
-        # Find available agents with matching specialization
-        suitable_agents = [
-            agent for agent in self.agent_pool.values()
-            if agent.specialization == preferred_spec
-            and agent.status == AgentStatus.IDLE
-        ]
-
-        if not suitable_agents:
+        agent_id = self.idle_agents.best(preferred_spec)
+        if agent_id is None:
             # Fallback to any available agent
-            suitable_agents = [
-                agent for agent in self.agent_pool.values()
-                if agent.status == AgentStatus.IDLE
-            ]
-
-        if suitable_agents:
-            # Select agent with highest performance score
-            return max(suitable_agents, key=lambda a: a.performance_score)
-
-        return None
+            agent_id = self.idle_agents.best()
+
+        return self.agent_pool.get(agent_id) if agent_id else None
+
+    def _assign_task_to_agent(
+            self, agent: "AgentView",
+            task_id: str, task: Dict,
+            future: Optional[asyncio.Future] = None):
+        """Reserve a capability slot on an agent and start the task"""
+        capability = agent.reserve_slot()
+        self._set_agent_status(
+            agent,
+            AgentStatus.ACTIVE if agent.has_free_slot()
+            else AgentStatus.BUSY
+        )
 
-    async def _assign_task_to_agent(
-            self, agent: AIAgent,
-            task_id: str, task: Dict):
-        """Assign a task to an agent"""
-        agent.status = AgentStatus.ACTIVE
+        execution = asyncio.create_task(
+            self._execute_task(agent, capability, task_id, task, future)
+        )
+        self.running_tasks.add(execution)
+        execution.add_done_callback(self.running_tasks.discard)
+
+    async def _execute_task(
+            self, agent: "AgentView", capability: AgentCapability,
+            task_id: str, task: Dict,
+            future: Optional[asyncio.Future]):
+        """Run a task on an agent and release its slot"""
         start_time = datetime.now()
 
-        # Simulate task execution
-        execution_time = await self._simulate_task_execution(agent, task)
+        try:
+            # Simulate task execution
+            execution_time = await self._simulate_task_execution(
+                agent, task
+            )
+        except asyncio.CancelledError:
+            if future is not None:
+                future.cancel()
+            raise
+        except Exception as e:
+            logger.error(f"Task {task_id} failed on {agent.agent_id}: {e}")
+            if future is not None and not future.done():
+                future.set_exception(e)
+            return
+        finally:
+            # Complete task
+            agent.release_slot(capability)
+            self._set_agent_status(
+                agent,
+                AgentStatus.ACTIVE if agent.running_count()
+                else AgentStatus.IDLE
+            )
 
-        # Complete task
-        agent.status = AgentStatus.IDLE
         agent.tasks_completed += 1
         agent.last_active = datetime.now()
 
@@ -328,6 +706,7 @@ class AIWorkforceExpansion:
             "task_id": task_id,
             "agent_id": agent.agent_id,
             "specialization": agent.specialization.value,
+            "capability": capability.name,
             "start_time": start_time.isoformat(),
             "completion_time": datetime.now().isoformat(),
             "execution_time_ms": execution_time * 1000,
@@ -340,8 +719,11 @@ class AIWorkforceExpansion:
         # Update average completion time
         self._update_avg_completion_time(execution_time * 1000)
 
+        if future is not None and not future.done():
+            future.set_result(result)
+
     async def _simulate_task_execution(
-            self, agent: AIAgent,
+            self, agent: "AgentView",
             task: Dict) -> float:
         """Simulate task execution time based on agent capabilities"""
         base_time = 0.1  # 100ms base
@@ -376,20 +758,21 @@ class AIWorkforceExpansion:
         """Scale the workforce by adding more agents"""
         logger.info(f"Scaling workforce by {additional_agents} agents")
 
-        # Distribute new agents across specializations
-        for i in range(additional_agents):
-            # Round-robin across specializations
-            spec_index = i % len(AgentSpecialization)
-            specialization = list(AgentSpecialization)[spec_index]
-
-            agent = await self._create_specialized_agent(specialization)
-            self.agent_pool[agent.agent_id] = agent
-            await self._activate_agent(agent)
+        # Distribute new agents across specializations, round-robin
+        agents = await asyncio.gather(*(
+            self._create_specialized_agent(
+                SPECIALIZATIONS[i % len(SPECIALIZATIONS)]
+            )
+            for i in range(additional_agents)
+        ))
+        await asyncio.gather(*(
+            self._activate_agent(self.agent_pool.add(agent))
+            for agent in agents
+        ))
 
         self.metrics["total_agents"] = len(self.agent_pool)
-        self.metrics["active_agents"] = sum(
-            1 for agent in self.agent_pool.values()
-            if agent.status in [AgentStatus.IDLE, AgentStatus.ACTIVE]
+        self.metrics["active_agents"] = self.agent_pool.count(
+            AgentStatus.IDLE, AgentStatus.ACTIVE
         )
 
         logger.info(
@@ -398,10 +781,6 @@ class AIWorkforceExpansion:
 
     def get_workforce_metrics(self) -> Dict:
         """Get comprehensive workforce metrics"""
-        specialization_counts = defaultdict(int)
-        for agent in self.agent_pool.values():
-            specialization_counts[agent.specialization.value] += 1
-
         return {
             "total_agents": self.metrics["total_agents"],
             "active_agents": self.metrics["active_agents"],
@@ -416,10 +795,33 @@ class AIWorkforceExpansion:
             "specialization_coverage": (
                 f"{self.metrics['specialization_coverage']:.1%}"
             ),
-            "agents_by_specialization": dict(specialization_counts),
+            "avg_performance_score": (
+                f"{self.agent_pool.mean_performance():.2f}"
+            ),
+            "agents_by_specialization": (
+                self.agent_pool.counts_by_specialization()
+            ),
             "force_multiplication": f"{self.metrics['total_agents']}x"
         }
 
+    async def shutdown(self):
+        """Stop dispatching and cancel running and queued tasks
+
+        Every future handed out by submit_task is resolved: running and
+        queued tasks are cancelled.
+        """
+        tasks = list(self.running_tasks)
+        if self.dispatcher is not None:
+            tasks.append(self.dispatcher)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.dispatcher = None
+
+        while not self.task_queue.empty():
+            _, _, future = self.task_queue.get_nowait()
+            future.cancel()
+
     async def optimize_workforce_distribution(self):
         """Optimize agent distribution based on task patterns"""
         # Analyze task distribution
@@ -447,6 +849,68 @@ class AIWorkforceExpansion:
         )
 
 
+class IdleAgentIndex:
+    """Idle agents in max-heaps by performance score
+
+    One heap per specialization plus a global heap, so the best idle
+    agent is found in O(log n). Status changes don't search the heaps:
+    each idle period gets a fresh token and heap entries whose token is
+    no longer current are discarded when they reach the top.
+    """
+
+    def __init__(self):
+        # specialization -> [(-score, token, agent_id)]
+        self.heaps: Dict[AgentSpecialization, list] = defaultdict(list)
+        self.global_heap = []
+        self.tokens: Dict[str, int] = {}
+        self.sequence = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    def mark_idle(self, agent: "AgentView"):
+        """Make an agent available for dispatch"""
+        if agent.agent_id in self.tokens:
+            return
+
+        token = next(self.sequence)
+        self.tokens[agent.agent_id] = token
+        entry = (-agent.performance_score, token, agent.agent_id)
+        heapq.heappush(self.heaps[agent.specialization], entry)
+        heapq.heappush(self.global_heap, entry)
+
+        # Rebuild heaps dominated by stale entries
+        if len(self.global_heap) > 2 * len(self.tokens) + 64:
+            self._compact()
+
+    def mark_unavailable(self, agent_id: str):
+        """Remove an agent that is no longer idle"""
+        self.tokens.pop(agent_id, None)
+
+    def best(self, specialization: Optional[AgentSpecialization] = None
+             ) -> Optional[str]:
+        """ID of the best idle agent, optionally of one specialization"""
+        heap = (
+            self.global_heap if specialization is None
+            else self.heaps.get(specialization)
+        )
+        while heap:
+            _, token, agent_id = heap[0]
+            if self.tokens.get(agent_id) == token:
+                return agent_id
+            heapq.heappop(heap)
+        return None
+
+    def _compact(self):
+        """Drop stale entries from every heap"""
+        for heap in [self.global_heap, *self.heaps.values()]:
+            heap[:] = [
+                entry for entry in heap
+                if self.tokens.get(entry[2]) == entry[1]
+            ]
+            heapq.heapify(heap)
+
+
 async def main():
     """Test AI workforce expansion system"""
     workforce = AIWorkforceExpansion(target_agents=100)
@@ -470,13 +934,12 @@ async def main():
         {"type": "compliance", "complexity": 1.2}
     ]
 
-    task_ids = []
+    futures = []
     for task in test_tasks * 20:  # 100 tasks total
-        task_id = await workforce.distribute_task(task)
-        task_ids.append(task_id)
+        futures.append(await workforce.submit_task(task))
 
     # Wait for task completion
-    await asyncio.sleep(2)
+    await asyncio.gather(*futures)
 
     # Scale workforce
     print("\n🚀 Scaling workforce...")
@@ -497,6 +960,8 @@ async def main():
         else:
             print(f"  - {key}: {value}")
 
+    await workforce.shutdown()
+
 
 if __name__ == "__main__":
     asyncio.run(main())
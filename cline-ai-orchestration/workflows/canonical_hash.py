@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Canonical Hashing for Cline AI Orchestration
+Streams a canonical encoding of workflow payloads into a fast hash
+Used by Production Scaling to derive workflow IDs
+"""
+
+import hashlib
+import json
+import struct
+from typing import Any, Callable
+
+try:
+    import xxhash
+except ImportError:  # Optional: blake2b is used when xxhash is missing
+    xxhash = None
+
+# Fastest available hash; workflow IDs are only compared in-process
+DEFAULT_ALGORITHM = "xxh3_64" if xxhash is not None else "blake2b"
+
+
+def _prehashed(value) -> str:
+    """Encode pre-serialized payloads (e.g. dashboard snapshots) by hash"""
+    if hasattr(value, "content_hash"):
+        return value.content_hash()
+    raise TypeError(
+        f"Object of type {type(value).__name__} is not JSON serializable"
+    )
+
+
+# Leaf encoder: compact, key-sorted JSON from the C encoder
+_encode_leaf = json.JSONEncoder(
+    sort_keys=True, separators=(",", ":"), default=_prehashed
+).encode
+
+
+def _hash_factory(algorithm: str, digest_size: int) -> Callable:
+    """Constructor for a streaming hash object"""
+    if algorithm == "blake2b":
+        return lambda: hashlib.blake2b(digest_size=digest_size)
+    if algorithm == "xxh3_64":
+        if xxhash is None:
+            raise ValueError("xxh3_64 requires the optional xxhash package")
+        return xxhash.xxh3_64
+    return lambda: hashlib.new(algorithm)
+
+
+class CanonicalHasher:
+    """Hash JSON-like values without building one big canonical string
+
+    Mappings are walked in sorted key order and each field is fed to
+    the hash separately with a type tag and length prefix, so equal
+    values always produce equal digests regardless of key order.
+    Strings and bytes are hashed as-is instead of being JSON-escaped,
+    objects exposing ``content_hash()`` contribute only their hash, and
+    other leaves go through the C JSON encoder.
+
+    The default algorithm is xxh3_64 when the optional xxhash package
+    is installed and an 8-byte blake2b otherwise.
+    """
+
+    def __init__(self, algorithm: str = DEFAULT_ALGORITHM,
+                 digest_size: int = 8,
+                 max_depth: int = 2):
+        self.algorithm = algorithm
+        self.new_hash = _hash_factory(algorithm, digest_size)
+        self.hex_length = digest_size * 2
+        self.max_depth = max_depth
+
+    def __call__(self, value: Any) -> str:
+        return self.hexdigest(value)
+
+    def hexdigest(self, value: Any) -> str:
+        """Hex digest of a value's canonical encoding"""
+        digest = self.new_hash()
+        self._feed(digest.update, value, self.max_depth)
+        return digest.hexdigest()[:self.hex_length]
+
+    def _feed(self, update: Callable, value: Any, depth: int):
+        """Stream one value into the hash"""
+        if isinstance(value, str):
+            data = value.encode()
+            update(b"s" + struct.pack("<Q", len(data)))
+            update(data)
+        elif isinstance(value, (bytes, bytearray, memoryview)):
+            update(b"b" + struct.pack("<Q", len(value)))
+            update(value)
+        elif hasattr(value, "content_hash"):
+            self._feed(update, value.content_hash(), 0)
+        elif isinstance(value, dict) and depth > 0:
+            update(b"d" + struct.pack("<Q", len(value)))
+            for key in sorted(value):
+                self._feed(update, key, 0)
+                self._feed(update, value[key], depth - 1)
+        else:
+            data = _encode_leaf(value).encode()
+            update(b"j" + struct.pack("<Q", len(data)))
+            update(data)
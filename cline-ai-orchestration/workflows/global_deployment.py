@@ -6,9 +6,14 @@ Week 3 Implementation - Global Deployment Readiness
 """
 
 import asyncio
+import json
 import logging
+import random
+import sys
 from datetime import datetime
-from typing import Dict, List, Callable
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Callable, Mapping, Optional
 from dataclasses import dataclass
 from enum import Enum
 
@@ -19,6 +24,49 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Rollout and probing limits
+MAX_CONCURRENT_DEPLOYMENTS = 3
+DEPLOY_TIMEOUT_SECONDS = 30.0
+MAX_CONCURRENT_PROBES = 4
+PROBE_TIMEOUT_SECONDS = 1.0
+PROBE_INTERVAL_SECONDS = 5.0
+# Weight of the newest probe in each region's latency estimate
+LATENCY_EWMA_ALPHA = 0.3
+# How often localization source files are checked for changes
+LOCALIZATION_POLL_SECONDS = 2.0
+
+# Built-in translations; {language}.json files in a localization
+# directory are layered on top
+BASE_TRANSLATIONS = {
+    "welcome": "Welcome to Recovery Compass",
+    "crisis_alert": "Crisis Alert",
+    "intervention_required": "Intervention Required",
+    "pattern_detected": "Pattern Detected",
+    "support_available": "Support Available"
+}
+LANGUAGE_TRANSLATIONS = {
+    "es-US": {
+        "welcome": "Bienvenido a Recovery Compass",
+        "crisis_alert": "Alerta de Crisis"
+    },
+    "fr-FR": {
+        "welcome": "Bienvenue à Recovery Compass",
+        "crisis_alert": "Alerte de Crise"
+    },
+    "de-DE": {
+        "welcome": "Willkommen bei Recovery Compass",
+        "crisis_alert": "Krisenalarm"
+    },
+    "ja-JP": {
+        "welcome": "Recovery Compassへようこそ",
+        "crisis_alert": "危機警報"
+    },
+    "zh-CN": {
+        "welcome": "欢迎使用Recovery Compass",
+        "crisis_alert": "危机警报"
+    }
+}
+
 
 class Region(Enum):
     """Supported deployment regions"""
@@ -50,22 +98,55 @@ class RegionConfig:
     data_residency: bool
 
 
+@dataclass(frozen=True)
+class LocalizationBundle:
+    """Compiled, read-only translations for one language
+
+    Keys and strings are interned, so bundles share storage for common
+    text and lookups return existing objects.
+    """
+    language: str
+    strings: Mapping[str, str]
+    source_mtime: Optional[float]
+    nbytes: int
+
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        """Translated string for a key"""
+        return self.strings.get(key, default)
+
+
 class GlobalDeploymentSystem:
     """Multi-region deployment and localization system"""
 
-    def __init__(self):
+    def __init__(self, max_concurrent_probes: int = MAX_CONCURRENT_PROBES,
+                 probe_timeout_seconds: float = PROBE_TIMEOUT_SECONDS,
+                 localization_dir: Optional[str] = None):
         self.region_configs = self._initialize_region_configs()
         self.active_regions = set()
-        self.localization_cache = {}
+        # language -> compiled bundle, replaced whole on reload
+        self.localization_cache: Dict[str, LocalizationBundle] = {}
+        self.localization_dir = (
+            Path(localization_dir) if localization_dir else None
+        )
+        self.localization_watch_task: Optional[asyncio.Task] = None
         self.compliance_validators = self._initialize_compliance_validators()
 
+        # Live latency estimates, refreshed by background probing
+        self.max_concurrent_probes = max_concurrent_probes
+        self.probe_timeout_seconds = probe_timeout_seconds
+        self.region_latency: Dict[Region, float] = {}
+        self.probe_task: Optional[asyncio.Task] = None
+
         self.metrics = {
             "regions_deployed": 0,
             "languages_supported": 0,
             "compliance_validations": 0,
             "localization_coverage": 0.0,
             "global_latency_avg": 0.0,
-            "deployment_success_rate": 1.0
+            "deployment_success_rate": 1.0,
+            "deployment_timeouts": 0,
+            "probe_timeouts": 0,
+            "localization_reloads": 0
         }
 
     def _initialize_region_configs(self) -> Dict[Region, RegionConfig]:
@@ -159,14 +240,14 @@ class GlobalDeploymentSystem:
                     "compliance_results": compliance_results
                 }
 
-            # Deploy infrastructure
-            deployment_result = await self._deploy_infrastructure(region)
-
-            # Initialize localization
-            localization_result = await self._initialize_localization(config)
-
-            # Configure data residency
-            residency_result = await self._configure_data_residency(region)
+            # Deploy infrastructure, localization and data residency
+            # together; none depends on another
+            (deployment_result, localization_result,
+             residency_result) = await asyncio.gather(
+                self._deploy_infrastructure(region),
+                self._initialize_localization(config),
+                self._configure_data_residency(region)
+            )
 
             # Update metrics
             self.active_regions.add(region)
@@ -194,19 +275,56 @@ class GlobalDeploymentSystem:
             self.metrics["deployment_success_rate"] *= 0.95
             return {"status": "error", "message": str(e)}
 
+    async def deploy_to_regions(
+            self, regions: Iterable[Region],
+            max_concurrency: int = MAX_CONCURRENT_DEPLOYMENTS,
+            timeout_seconds: float = DEPLOY_TIMEOUT_SECONDS
+    ) -> Dict[Region, Dict]:
+        """Roll out to several regions concurrently
+
+        At most ``max_concurrency`` deployments run at once and each is
+        abandoned after ``timeout_seconds``.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def deploy(region: Region) -> Dict:
+            async with semaphore:
+                try:
+                    return await asyncio.wait_for(
+                        self.deploy_to_region(region), timeout_seconds
+                    )
+                except asyncio.TimeoutError:
+                    logger.error(
+                        f"Deployment timed out for region {region.value}"
+                    )
+                    self.metrics["deployment_timeouts"] += 1
+                    self.metrics["deployment_success_rate"] *= 0.95
+                    return {
+                        "status": "timeout",
+                        "region": region.value,
+                        "message": f"No result after {timeout_seconds}s"
+                    }
+
+        regions = list(regions)
+        results = await asyncio.gather(*(deploy(r) for r in regions))
+        return dict(zip(regions, results))
+
     async def _validate_compliance(self, region: Region) -> List[Dict]:
         """Validate compliance requirements for a region"""
         config = self.region_configs[region]
-        results = []
-
-        for compliance_level in config.compliance_requirements:
-            validator = self.compliance_validators.get(compliance_level)
-            if validator:
-                result = await validator(region)
-                results.append(result)
-                self.metrics["compliance_validations"] += 1
+        validators = [
+            self.compliance_validators[compliance_level]
+            for compliance_level in config.compliance_requirements
+            if compliance_level in self.compliance_validators
+        ]
+
+        # Frameworks are independent, so validate them concurrently
+        results = await asyncio.gather(
+            *(validator(region) for validator in validators)
+        )
+        self.metrics["compliance_validations"] += len(results)
 
-        return results
+        return list(results)
 
     async def _validate_hipaa(self, region: Region) -> Dict:
         """Validate HIPAA compliance"""
@@ -309,69 +427,132 @@ class GlobalDeploymentSystem:
 
     async def _initialize_localization(self, config: RegionConfig) -> Dict:
         """Initialize localization for region"""
-        localized_content = {}
-
-        for language in config.supported_languages:
-            # Load or generate localized content
-            content = await self._load_localized_content(language)
-            localized_content[language] = content
-
-            # Cache localization
-            self.localization_cache[language] = content
+        # Preload bundles so requests never compile translations
+        bundles = await self.preload_localization(config.supported_languages)
 
         # Calculate localization coverage
         total_strings = 1000  # Assume 1000 strings to localize
-        localized_strings = len(localized_content) * 950  # 95% coverage
+        localized_strings = len(bundles) * 950  # 95% coverage
         self.metrics["localization_coverage"] = localized_strings / (
-            total_strings * len(localized_content)
+            total_strings * len(bundles)
         )
 
+        if self.localization_dir is not None:
+            self.start_localization_watch()
+
         return {
             "primary_language": config.primary_language,
             "supported_languages": config.supported_languages,
             "coverage": f"{self.metrics['localization_coverage']:.1%}"
         }
 
-    async def _load_localized_content(self, language: str) -> Dict:
-        """Load localized content for a language"""
-        # Simulate loading translations
-        base_translations = {
-            "welcome": "Welcome to Recovery Compass",
-            "crisis_alert": "Crisis Alert",
-            "intervention_required": "Intervention Required",
-            "pattern_detected": "Pattern Detected",
-            "support_available": "Support Available"
+    async def preload_localization(
+            self, languages: Iterable[str]) -> Dict[str, LocalizationBundle]:
+        """Compile and cache bundles for languages not yet loaded"""
+        loop = asyncio.get_running_loop()
+        for language in languages:
+            if language not in self.localization_cache:
+                self.localization_cache[language] = (
+                    await loop.run_in_executor(
+                        None, self._compile_bundle, language
+                    )
+                )
+        return {
+            language: self.localization_cache[language]
+            for language in languages
         }
 
-        # Language-specific translations (simplified)
-        language_map = {
-            "es-US": {
-                "welcome": "Bienvenido a Recovery Compass",
-                "crisis_alert": "Alerta de Crisis"
-            },
-            "fr-FR": {
-                "welcome": "Bienvenue à Recovery Compass",
-                "crisis_alert": "Alerte de Crise"
-            },
-            "de-DE": {
-                "welcome": "Willkommen bei Recovery Compass",
-                "crisis_alert": "Krisenalarm"
-            },
-            "ja-JP": {
-                "welcome": "Recovery Compassへようこそ",
-                "crisis_alert": "危機警報"
-            },
-            "zh-CN": {
-                "welcome": "欢迎使用Recovery Compass",
-                "crisis_alert": "危机警报"
-            }
+    def localize(self, language: str, key: str) -> Optional[str]:
+        """Translated string, falling back to the built-in English text"""
+        bundle = self.localization_cache.get(language)
+        if bundle is not None:
+            text = bundle.strings.get(key)
+            if text is not None:
+                return text
+        return BASE_TRANSLATIONS.get(key)
+
+    def _localization_source(self, language: str) -> Optional[Path]:
+        """Source file for a language, if a directory is configured"""
+        if self.localization_dir is None:
+            return None
+        return self.localization_dir / f"{language}.json"
+
+    def _source_mtime(self, language: str) -> Optional[float]:
+        """Modification time of a language's source file, if it exists"""
+        source = self._localization_source(language)
+        try:
+            return source.stat().st_mtime if source else None
+        except FileNotFoundError:
+            return None
+
+    def _compile_bundle(self, language: str) -> LocalizationBundle:
+        """Build the immutable bundle for a language"""
+        translations = dict(BASE_TRANSLATIONS)
+        translations.update(LANGUAGE_TRANSLATIONS.get(language, {}))
+
+        mtime = self._source_mtime(language)
+        if mtime is not None:
+            with open(self._localization_source(language),
+                      encoding="utf-8") as source:
+                translations.update(json.load(source))
+
+        strings = {
+            sys.intern(key): sys.intern(text)
+            for key, text in translations.items()
         }
+        # Interned strings shared with other bundles count here too
+        nbytes = sys.getsizeof(strings) + sum(
+            sys.getsizeof(key) + sys.getsizeof(text)
+            for key, text in strings.items()
+        )
+        return LocalizationBundle(
+            language=sys.intern(language),
+            strings=MappingProxyType(strings),
+            source_mtime=mtime,
+            nbytes=nbytes
+        )
 
-        translations = base_translations.copy()
-        if language in language_map:
-            translations.update(language_map[language])
+    async def reload_changed_localization(self) -> List[str]:
+        """Recompile bundles whose source files changed
+
+        Each new bundle replaces the old one in a single assignment, so
+        lookups see either the old or the new translations, never a mix.
+        """
+        loop = asyncio.get_running_loop()
+        reloaded = []
+        for language, bundle in list(self.localization_cache.items()):
+            if self._source_mtime(language) == bundle.source_mtime:
+                continue
+            try:
+                self.localization_cache[language] = (
+                    await loop.run_in_executor(
+                        None, self._compile_bundle, language
+                    )
+                )
+            except (OSError, TypeError, ValueError) as e:
+                logger.error(
+                    f"Localization reload failed for {language}: {e}"
+                )
+                continue
+            reloaded.append(language)
+            self.metrics["localization_reloads"] += 1
+            logger.info(f"Reloaded localization for {language}")
+        return reloaded
+
+    def start_localization_watch(
+            self, interval_seconds: float = LOCALIZATION_POLL_SECONDS):
+        """Poll localization source files in the background"""
+        if (self.localization_watch_task is None or
+                self.localization_watch_task.done()):
+            self.localization_watch_task = asyncio.create_task(
+                self._localization_watch_loop(interval_seconds)
+            )
 
-        return translations
+    async def _localization_watch_loop(self, interval_seconds: float):
+        """Reload changed bundles every interval"""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            await self.reload_changed_localization()
 
     async def _configure_data_residency(self, region: Region) -> Dict:
         """Configure data residency for region"""
@@ -392,18 +573,36 @@ class GlobalDeploymentSystem:
         }
 
     async def measure_global_latency(self) -> Dict:
-        """Measure latency across all deployed regions"""
-        latency_results = {}
-        total_latency = 0
+        """Measure latency across all deployed regions
+
+        Regions are probed concurrently, at most
+        ``max_concurrent_probes`` at a time. A probe that exceeds
+        ``probe_timeout_seconds`` counts as a sample at the timeout.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_probes)
+
+        async def probe(region: Region) -> float:
+            async with semaphore:
+                try:
+                    return await asyncio.wait_for(
+                        self._measure_region_latency(region),
+                        self.probe_timeout_seconds
+                    )
+                except asyncio.TimeoutError:
+                    self.metrics["probe_timeouts"] += 1
+                    return self.probe_timeout_seconds * 1000
+
+        regions = list(self.active_regions)
+        latencies = await asyncio.gather(*(probe(r) for r in regions))
 
-        for region in self.active_regions:
-            latency = await self._measure_region_latency(region)
+        latency_results = {}
+        for region, latency in zip(regions, latencies):
             latency_results[region.value] = latency
-            total_latency += latency
+            self._record_latency(region, latency)
 
-        if self.active_regions:
-            self.metrics["global_latency_avg"] = total_latency / len(
-                self.active_regions
+        if regions:
+            self.metrics["global_latency_avg"] = sum(latencies) / len(
+                regions
             )
 
         return {
@@ -418,10 +617,56 @@ class GlobalDeploymentSystem:
         base_latency = config.latency_target_ms
 
         # Add some variance
-        import random
         variance = random.uniform(0.8, 1.2)
+        latency = base_latency * variance
+
+        # A probe takes one round trip
+        await asyncio.sleep(latency / 1000)
+        return latency
+
+    def _record_latency(self, region: Region, latency_ms: float):
+        """Fold a probe result into the region's EWMA estimate"""
+        previous = self.region_latency.get(region)
+        if previous is None:
+            self.region_latency[region] = latency_ms
+        else:
+            self.region_latency[region] = (
+                LATENCY_EWMA_ALPHA * latency_ms +
+                (1 - LATENCY_EWMA_ALPHA) * previous
+            )
 
-        return base_latency * variance
+    def estimated_latency(self, region: Region) -> Optional[float]:
+        """Smoothed latency for a region, if it has been probed"""
+        return self.region_latency.get(region)
+
+    def start_latency_probing(
+            self, interval_seconds: float = PROBE_INTERVAL_SECONDS):
+        """Probe active regions in the background"""
+        if self.probe_task is None or self.probe_task.done():
+            self.probe_task = asyncio.create_task(
+                self._latency_probe_loop(interval_seconds)
+            )
+
+    async def _latency_probe_loop(self, interval_seconds: float):
+        """Re-measure regional latency every interval"""
+        while True:
+            try:
+                await self.measure_global_latency()
+            except Exception as e:
+                logger.error(f"Latency probing error: {e}")
+            await asyncio.sleep(interval_seconds)
+
+    async def shutdown(self):
+        """Stop background latency probing and localization watching"""
+        tasks = [
+            task for task in (self.probe_task, self.localization_watch_task)
+            if task is not None
+        ]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.probe_task = None
+        self.localization_watch_task = None
 
     def get_deployment_metrics(self) -> Dict:
         """Get global deployment metrics"""
@@ -433,12 +678,23 @@ class GlobalDeploymentSystem:
             "localization_coverage": (
                 f"{self.metrics['localization_coverage']:.1%}"
             ),
+            "localization_reloads": self.metrics["localization_reloads"],
+            "localization_bytes": {
+                language: bundle.nbytes
+                for language, bundle in self.localization_cache.items()
+            },
             "global_latency_avg": (
                 f"{self.metrics['global_latency_avg']:.2f}ms"
             ),
             "deployment_success_rate": (
                 f"{self.metrics['deployment_success_rate']:.1%}"
             ),
+            "deployment_timeouts": self.metrics["deployment_timeouts"],
+            "probe_timeouts": self.metrics["probe_timeouts"],
+            "region_latency_ewma": {
+                region.value: f"{latency:.2f}ms"
+                for region, latency in self.region_latency.items()
+            },
             "active_regions": [r.value for r in self.active_regions]
         }
 
@@ -457,10 +713,10 @@ async def main():
         Region.ASIA_PACIFIC
     ]
 
-    for region in regions_to_deploy:
-        print(f"\n📍 Deploying to {region.value}...")
-        result = await deployment.deploy_to_region(region)
+    print(f"\n📍 Deploying to {len(regions_to_deploy)} regions...")
+    results = await deployment.deploy_to_regions(regions_to_deploy)
 
+    for region, result in results.items():
         if result["status"] == "success":
             print(f"✅ Successfully deployed to {region.value}")
             languages = result['localization']['supported_languages']
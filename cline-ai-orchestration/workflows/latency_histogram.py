@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Latency Histogram for Cline AI Orchestration
+HDR-style log-bucketed latency recording with percentile reporting
+Shared by Real-time Monitoring and Production Scaling
+"""
+
+import math
+from typing import Dict, List, Optional
+
+# Coarse bucket bounds (seconds) used for Prometheus exposition
+PROMETHEUS_BUCKETS_SECONDS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0
+)
+
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram with O(1) record
+
+    Values (milliseconds) are bucketed by binary exponent with
+    ``sub_buckets`` linear sub-buckets per power of two, so each bucket
+    spans at most ``1 / sub_buckets`` of its value (~3% by default).
+    Histograms with the same layout can be merged, which makes
+    snapshots cheap to combine across workers.
+    """
+
+    def __init__(self, min_value_ms: float = 0.001,
+                 max_value_ms: float = 3_600_000,
+                 sub_buckets: int = 32):
+        self.min_value_ms = min_value_ms
+        self.max_value_ms = max_value_ms
+        self.sub_buckets = sub_buckets
+        self.min_exponent = math.frexp(min_value_ms)[1]
+        exponent_span = math.frexp(max_value_ms)[1] - self.min_exponent + 1
+        self.counts = [0] * (exponent_span * sub_buckets)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def _bucket_index(self, value_ms: float) -> int:
+        """Map a value to its bucket"""
+        if value_ms <= self.min_value_ms:
+            return 0
+        if value_ms >= self.max_value_ms:
+            return len(self.counts) - 1
+
+        mantissa, exponent = math.frexp(value_ms)
+        return (
+            (exponent - self.min_exponent) * self.sub_buckets +
+            int((mantissa - 0.5) * 2 * self.sub_buckets)
+        )
+
+    def _bucket_upper_bound(self, index: int) -> float:
+        """Largest value that maps to a bucket"""
+        exponent, sub_bucket = divmod(index, self.sub_buckets)
+        return math.ldexp(
+            0.5 + (sub_bucket + 1) / (2 * self.sub_buckets),
+            exponent + self.min_exponent
+        )
+
+    def record(self, value_ms: float):
+        """Record a latency sample"""
+        self.counts[self._bucket_index(value_ms)] += 1
+        self.count += 1
+        self.sum += value_ms
+        if value_ms > self.max:
+            self.max = value_ms
+
+    def merge(self, other: "LatencyHistogram"):
+        """Add another histogram's samples into this one"""
+        if (len(other.counts), other.sub_buckets, other.min_exponent) != (
+                len(self.counts), self.sub_buckets, self.min_exponent):
+            raise ValueError("Cannot merge histograms with different layouts")
+
+        counts = self.counts
+        for index, bucket_count in enumerate(other.counts):
+            if bucket_count:
+                counts[index] += bucket_count
+        self.count += other.count
+        self.sum += other.sum
+        self.max = max(self.max, other.max)
+
+    def snapshot(self) -> "LatencyHistogram":
+        """Copy of the current state"""
+        clone = LatencyHistogram.__new__(LatencyHistogram)
+        clone.__dict__.update(self.__dict__)
+        clone.counts = list(self.counts)
+        return clone
+
+    def reset(self):
+        """Discard all samples"""
+        self.counts = [0] * len(self.counts)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def mean(self) -> float:
+        """Mean of recorded samples"""
+        return self.sum / self.count if self.count else 0.0
+
+    def percentiles(
+            self, quantiles: List[float]) -> List[Optional[float]]:
+        """Values at the given quantiles (0-1), in one pass"""
+        if not self.count:
+            return [None] * len(quantiles)
+
+        order = sorted(range(len(quantiles)), key=quantiles.__getitem__)
+        values = [None] * len(quantiles)
+        position = 0
+        cumulative = 0
+
+        for index, bucket_count in enumerate(self.counts):
+            if not bucket_count:
+                continue
+            cumulative += bucket_count
+            while position < len(order) and (
+                    cumulative >= math.ceil(
+                        quantiles[order[position]] * self.count)):
+                values[order[position]] = min(
+                    self._bucket_upper_bound(index), self.max
+                )
+                position += 1
+            if position == len(order):
+                break
+
+        return values
+
+    def percentile(self, quantile: float) -> Optional[float]:
+        """Value at a single quantile (0-1)"""
+        return self.percentiles([quantile])[0]
+
+    def summary(self) -> Dict[str, Optional[float]]:
+        """Standard tail-latency summary in milliseconds"""
+        p50, p90, p99, p999 = self.percentiles([0.5, 0.9, 0.99, 0.999])
+        return {
+            "p50": p50,
+            "p90": p90,
+            "p99": p99,
+            "p99.9": p999,
+            "max": self.max if self.count else None
+        }
+
+    def to_prometheus(self, name: str, help_text: str,
+                      labels: Optional[Dict[str, str]] = None) -> str:
+        """Render as a Prometheus text-format histogram in seconds"""
+        label_text = ",".join(
+            f'{key}="{value}"' for key, value in (labels or {}).items()
+        )
+        prefix = f"{label_text}," if label_text else ""
+        suffix = f"{{{label_text}}}" if label_text else ""
+
+        lines = [
+            f"# HELP {name} {help_text}",
+            f"# TYPE {name} histogram"
+        ]
+
+        cumulative = 0
+        index = 0
+        for bound in PROMETHEUS_BUCKETS_SECONDS:
+            bound_ms = bound * 1000
+            while index < len(self.counts) and (
+                    self._bucket_upper_bound(index) <= bound_ms):
+                cumulative += self.counts[index]
+                index += 1
+            lines.append(
+                f'{name}_bucket{{{prefix}le="{bound}"}} {cumulative}'
+            )
+
+        lines.append(f'{name}_bucket{{{prefix}le="+Inf"}} {self.count}')
+        lines.append(f"{name}_sum{suffix} {self.sum / 1000}")
+        lines.append(f"{name}_count{suffix} {self.count}")
+        return "\n".join(lines) + "\n"
+
+
+def format_latency_summary(histogram: LatencyHistogram,
+                           prefix: str) -> Dict[str, str]:
+    """Format a histogram summary as ``{prefix}_p99_ms``-style metrics"""
+    return {
+        f"{prefix}_{key.replace('.', '')}_ms":
+            "N/A" if value is None else f"{value:.2f}"
+        for key, value in histogram.summary().items()
+    }
@@ -6,11 +6,19 @@ Week 2 Implementation - Predictive Analytics
 """
 
 import asyncio
+import hashlib
+import heapq
+import itertools
 import json
 import logging
+from array import array
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional
 from pathlib import Path
+import time
+
+from latency_histogram import LatencyHistogram, format_latency_summary
 
 # Configure logging
 logging.basicConfig(
@@ -33,8 +41,16 @@ class PatternRecognitionEngine:
             "detection_accuracy": 0.87,  # Starting baseline
             "response_time_seconds": 0
         }
-        self.pattern_cache = {}
-        self.intervention_queue = asyncio.Queue()
+        self.pattern_cache = PatternResultCache(
+            ttl_seconds=self.config.get("cache_ttl_seconds", 300),
+            max_entries=self.config.get(
+                "cache_max_entries", self.config.get("batch_size", 100) * 100
+            )
+        )
+        self.intervention_queue = InterventionQueue(
+            **self.config.get("intervention_queue", {})
+        )
+        self.user_state = UserStateStore(**self.config.get("user_state", {}))
 
     def _load_config(self, config_path: str) -> Dict:
         """Load pattern recognition configuration"""
@@ -50,7 +66,15 @@ class PatternRecognitionEngine:
                 "crisis_indicators": "immediate_support"
             },
             "cache_ttl_seconds": 300,
-            "batch_size": 100
+            "batch_size": 100,
+            "intervention_queue": {
+                "max_size": 5000,
+                "coalesce_window_seconds": 300
+            },
+            "user_state": {
+                "max_users": 1_000_000,
+                "idle_ttl_seconds": 14 * 86400
+            }
         }
 
         config_file = Path(__file__).parent.parent / config_path
@@ -112,32 +136,26 @@ class PatternRecognitionEngine:
             self, interaction_data: Dict) -> List[Dict]:
         """Analyze real-time interaction data for patterns"""
         start_time = datetime.now()
-        detected_patterns = []
 
         try:
-            # Extract features from interaction
-            features = self._extract_features(interaction_data)
-
-            # Check against all pattern categories
-            for category, patterns in self.pattern_registry.items():
-                for pattern in patterns:
-                    if self._match_pattern(features, pattern):
-                        risk_score = self._calculate_risk_score(
-                            features, pattern
-                        )
-
-                        if risk_score > self.config["thresholds"].get(
-                            category.replace("_patterns", "_risk"), 0.5
-                        ):
-                            detected_patterns.append({
-                                "pattern_id": pattern["id"],
-                                "pattern_name": pattern["name"],
-                                "category": category,
-                                "risk_score": risk_score,
-                                "timestamp": datetime.now().isoformat(),
-                                "recommended_intervention":
-                                    self._get_intervention(pattern["name"])
-                            })
+            # Temporal indicators depend on user history, never cached
+            temporal_indicators = self._observe_user(interaction_data)
+
+            # Reuse results for identical content and metadata
+            cache_key = self._cache_key(interaction_data, temporal_indicators)
+            matches = self.pattern_cache.get(cache_key)
+
+            if matches is None:
+                features = self._extract_features(
+                    interaction_data, temporal_indicators
+                )
+                matches = self._score_patterns(features)
+                self.pattern_cache.set(cache_key, matches)
+
+            detected_at = datetime.now().isoformat()
+            detected_patterns = [
+                dict(match, timestamp=detected_at) for match in matches
+            ]
 
             # Update metrics
             response_time = (datetime.now() - start_time).total_seconds()
@@ -146,7 +164,9 @@ class PatternRecognitionEngine:
 
             # Queue interventions if patterns detected
             if detected_patterns:
-                await self._queue_interventions(detected_patterns)
+                await self._queue_interventions(
+                    detected_patterns, interaction_data.get("user_id")
+                )
 
             return detected_patterns
 
@@ -154,7 +174,62 @@ class PatternRecognitionEngine:
             logger.error(f"Pattern analysis failed: {e}")
             return []
 
-    def _extract_features(self, interaction_data: Dict) -> Dict:
+    def _score_patterns(self, features: Dict) -> List[Dict]:
+        """Score features against all pattern categories"""
+        matches = []
+
+        for category, patterns in self.pattern_registry.items():
+            for pattern in patterns:
+                if self._match_pattern(features, pattern):
+                    risk_score = self._calculate_risk_score(
+                        features, pattern
+                    )
+
+                    if risk_score > self.config["thresholds"].get(
+                        category.replace("_patterns", "_risk"), 0.5
+                    ):
+                        matches.append({
+                            "pattern_id": pattern["id"],
+                            "pattern_name": pattern["name"],
+                            "category": category,
+                            "risk_score": risk_score,
+                            "recommended_intervention":
+                                self._get_intervention(pattern["name"])
+                        })
+
+        return matches
+
+    def _cache_key(self, interaction_data: Dict,
+                   temporal_indicators: List[str]) -> str:
+        """Hash normalized content, metadata and temporal indicators"""
+        content = " ".join(
+            (interaction_data.get("content") or "").lower().split()
+        )
+        metadata = json.dumps(
+            interaction_data.get("metadata", {}), sort_keys=True, default=str
+        )
+        key_source = "\x1f".join(
+            [content, metadata] + sorted(temporal_indicators)
+        )
+        return hashlib.blake2b(
+            key_source.encode(), digest_size=16
+        ).hexdigest()
+
+    def _observe_user(self, interaction_data: Dict) -> List[str]:
+        """Record the interaction in the user's sliding-window state"""
+        user_id = interaction_data.get("user_id")
+        if user_id is None:
+            return []
+
+        return self.user_state.observe(
+            user_id,
+            self._event_epoch(interaction_data.get("timestamp")),
+            interaction_data.get("metadata", {})
+        )
+
+    def _extract_features(
+            self, interaction_data: Dict,
+            temporal_indicators: Optional[List[str]] = None) -> Dict:
         """Extract relevant features from interaction data"""
         features = {
             "timestamp": interaction_data.get("timestamp"),
@@ -187,8 +262,26 @@ class PatternRecognitionEngine:
         if features["metadata"].get("weekend_activity", False):
             features["indicators"].append("weekend_work")
 
+        # Derive temporal indicators from the user's event history
+        if temporal_indicators is None:
+            temporal_indicators = self._observe_user(interaction_data)
+        features["indicators"].extend(temporal_indicators)
+
         return features
 
+    def _event_epoch(self, timestamp) -> float:
+        """Convert an interaction timestamp to epoch seconds"""
+        if isinstance(timestamp, (int, float)):
+            return float(timestamp)
+        if isinstance(timestamp, str):
+            try:
+                return datetime.fromisoformat(
+                    timestamp.replace('Z', '+00:00')
+                ).timestamp()
+            except ValueError:
+                pass
+        return time.time()
+
     def _match_pattern(self, features: Dict, pattern: Dict) -> bool:
         """Check if features match a pattern"""
         if not features.get("indicators"):
@@ -232,35 +325,26 @@ class PatternRecognitionEngine:
 
         return "general_support"
 
-    async def _queue_interventions(self, detected_patterns: List[Dict]):
+    async def _queue_interventions(
+            self, detected_patterns: List[Dict],
+            user_id: Optional[str] = None):
         """Queue interventions for execution"""
         for pattern in detected_patterns:
             if pattern["risk_score"] > 0.8:  # High priority
-                await self.intervention_queue.put({
-                    "priority": "high",
-                    "pattern": pattern,
-                    "queued_at": datetime.now().isoformat()
-                })
-                self.metrics["interventions_triggered"] += 1
-
-    async def process_intervention_queue(self) -> List[Dict]:
-        """Process queued interventions"""
-        interventions = []
-
-        while not self.intervention_queue.empty():
-            try:
-                intervention = await asyncio.wait_for(
-                    self.intervention_queue.get(),
-                    timeout=1.0
-                )
-                interventions.append(intervention)
+                if self.intervention_queue.put(user_id, pattern):
+                    self.metrics["interventions_triggered"] += 1
 
-                # Simulate intervention execution
-                if intervention["pattern"]["category"] == "crisis_patterns":
-                    self.metrics["crisis_prevented"] += 1
+    async def process_intervention_queue(
+            self, batch_size: Optional[int] = None) -> List[Dict]:
+        """Process the next batch of queued interventions"""
+        interventions = self.intervention_queue.pop_batch(
+            batch_size or self.config.get("batch_size", 100)
+        )
 
-            except asyncio.TimeoutError:
-                break
+        for intervention in interventions:
+            # Simulate intervention execution
+            if intervention["pattern"]["category"] == "crisis_patterns":
+                self.metrics["crisis_prevented"] += 1
 
         return interventions
 
@@ -284,7 +368,14 @@ class PatternRecognitionEngine:
             "detection_accuracy": f"{self.metrics['detection_accuracy']:.1%}",
             "avg_response_time":
                 f"{self.metrics['response_time_seconds']:.2f}s",
-            "crisis_prevention_rate": self._calculate_prevention_rate()
+            "crisis_prevention_rate": self._calculate_prevention_rate(),
+            "tracked_users": len(self.user_state),
+            "idle_users_evicted": self.user_state.evictions,
+            "cache_hits": self.pattern_cache.hits,
+            "cache_misses": self.pattern_cache.misses,
+            "cache_evictions": self.pattern_cache.evictions,
+            "cache_hit_rate": self.pattern_cache.hit_rate(),
+            "intervention_queue": self.intervention_queue.get_stats()
         }
 
     def _calculate_prevention_rate(self) -> str:
@@ -297,6 +388,392 @@ class PatternRecognitionEngine:
         return f"{rate:.1%}"
 
 
+class PatternResultCache:
+    """TTL + LRU cache of pattern matches keyed by content hash"""
+
+    def __init__(self, ttl_seconds: float = 300, max_entries: int = 10000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        # key -> (expires_at, matches), least recently used first
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, key: str) -> Optional[List[Dict]]:
+        """Get cached matches, or None if missing or expired"""
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        if entry[0] < time.monotonic():
+            del self.entries[key]
+            self.evictions += 1
+            self.misses += 1
+            return None
+
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: str, matches: List[Dict]):
+        """Cache matches, evicting the least recently used entry"""
+        self.entries[key] = (time.monotonic() + self.ttl_seconds, matches)
+        self.entries.move_to_end(key)
+
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def hit_rate(self) -> str:
+        """Cache hit rate as a percentage string"""
+        total = self.hits + self.misses
+        if total == 0:
+            return "N/A"
+        return f"{self.hits / total:.1%}"
+
+
+class InterventionQueue:
+    """Bounded priority queue of interventions with deduplication
+
+    Interventions are ordered crisis-first by pattern category, then by
+    descending risk score. Repeat detections of the same (user, pattern)
+    pair are coalesced into the pending intervention, or suppressed for
+    ``coalesce_window_seconds`` after it has been dispatched; detections
+    without a user are never coalesced. A second heap ordered
+    worst-first finds the entry to drop when the queue is full, so
+    every put is O(log n).
+    """
+
+    CATEGORY_PRIORITY = {
+        "crisis_patterns": 0,
+        "burnout_patterns": 1,
+        "disengagement_patterns": 2
+    }
+
+    def __init__(self, max_size: int = 5000,
+                 coalesce_window_seconds: float = 300):
+        self.max_size = max_size
+        self.coalesce_window_seconds = coalesce_window_seconds
+        # Heap of (priority, sequence, key), best first, and its mirror
+        # of (inverted priority, -sequence, key), worst first;
+        # superseded entries are skipped when popped
+        self.heap = []
+        self.worst_heap = []
+        # key -> [sequence, intervention, enqueued_at]
+        self.pending = {}
+        # key -> dispatched_at, oldest first
+        self.dispatched = OrderedDict()
+        self.sequence = itertools.count()
+        self.wait_times = LatencyHistogram()
+        self.coalesced = 0
+        self.dropped = 0
+        self.max_depth = 0
+
+    def __len__(self) -> int:
+        return len(self.pending)
+
+    def _priority(self, pattern: Dict) -> tuple:
+        """Heap ordering: category rank, then highest risk first"""
+        return (
+            self.CATEGORY_PRIORITY.get(
+                pattern["category"], len(self.CATEGORY_PRIORITY)
+            ),
+            -pattern["risk_score"]
+        )
+
+    def put(self, user_id: Optional[str], pattern: Dict) -> bool:
+        """Queue an intervention; False if coalesced or dropped"""
+        now = time.monotonic()
+        self._expire_dispatched(now)
+        sequence = next(self.sequence)
+
+        if user_id is None:
+            # Anonymous detections may come from different people
+            key = (None, sequence)
+        else:
+            key = (user_id, pattern["pattern_id"])
+
+        entry = self.pending.get(key)
+        if entry is not None:
+            intervention = entry[1]
+            intervention["occurrences"] += 1
+            self.coalesced += 1
+            if pattern["risk_score"] > intervention["pattern"]["risk_score"]:
+                intervention["pattern"] = pattern
+                entry[0] = sequence
+                self._push(self._priority(pattern), sequence, key)
+            return False
+
+        if key in self.dispatched:
+            self.coalesced += 1
+            return False
+
+        priority = self._priority(pattern)
+        if len(self.pending) >= self.max_size:
+            worst = self._worst()
+            if worst is None or (priority, sequence) >= worst[:2]:
+                self.dropped += 1
+                return False
+            heapq.heappop(self.worst_heap)
+            del self.pending[worst[2]]
+            self.dropped += 1
+
+        self.pending[key] = [
+            sequence,
+            {
+                "priority": "high",
+                "user_id": user_id,
+                "pattern": pattern,
+                "occurrences": 1,
+                "queued_at": datetime.now().isoformat()
+            },
+            now
+        ]
+        self._push(priority, sequence, key)
+        self.max_depth = max(self.max_depth, len(self.pending))
+
+        # Rebuild once superseded entries dominate the heaps
+        if max(len(self.heap), len(self.worst_heap)) > (
+                2 * len(self.pending) + 64):
+            self.heap = []
+            self.worst_heap = []
+            for key, entry in self.pending.items():
+                self._push(
+                    self._priority(entry[1]["pattern"]), entry[0], key
+                )
+
+        return True
+
+    def _push(self, priority: tuple, sequence: int, key: tuple):
+        """Add an entry to both heaps"""
+        heapq.heappush(self.heap, (priority, sequence, key))
+        category, negative_risk = priority
+        heapq.heappush(
+            self.worst_heap,
+            ((-category, -negative_risk), -sequence, key)
+        )
+
+    def _worst(self) -> Optional[tuple]:
+        """(priority, sequence, key) of the lowest-priority live entry
+
+        Stale entries on top of the worst-first heap are discarded; the
+        returned entry is left on it.
+        """
+        while self.worst_heap:
+            (category, risk), negative_sequence, key = self.worst_heap[0]
+            item = ((-category, -risk), -negative_sequence, key)
+            if self._is_live(item):
+                return item
+            heapq.heappop(self.worst_heap)
+        return None
+
+    def pop_batch(self, max_items: int) -> List[Dict]:
+        """Pop up to max_items interventions in priority order"""
+        batch = []
+        now = time.monotonic()
+
+        while self.heap and len(batch) < max_items:
+            item = heapq.heappop(self.heap)
+            if not self._is_live(item):
+                continue  # Superseded or dropped
+
+            key = item[2]
+            entry = self.pending.pop(key)
+            if key[0] is not None:
+                self.dispatched[key] = now
+            self.wait_times.record((now - entry[2]) * 1000)
+            batch.append(entry[1])
+
+        return batch
+
+    def _is_live(self, item: tuple) -> bool:
+        """Whether a heap item is the current entry for its key"""
+        entry = self.pending.get(item[2])
+        return entry is not None and entry[0] == item[1]
+
+    def _expire_dispatched(self, now: float):
+        """Forget dispatched keys older than the coalescing window"""
+        cutoff = now - self.coalesce_window_seconds
+        while self.dispatched:
+            key, dispatched_at = next(iter(self.dispatched.items()))
+            if dispatched_at >= cutoff:
+                break
+            del self.dispatched[key]
+
+    def get_stats(self) -> Dict:
+        """Queue depth, coalescing and time-to-intervention percentiles"""
+        return {
+            "depth": len(self.pending),
+            "max_depth": self.max_depth,
+            "coalesced": self.coalesced,
+            "dropped": self.dropped,
+            **format_latency_summary(self.wait_times, "time_to_intervention")
+        }
+
+
+class UserWindowState:
+    """Sliding-window behavioral history for a single user"""
+
+    __slots__ = (
+        "last_seen", "window", "event_head", "day_index", "reply_bits"
+    )
+
+    def __init__(self, now: float, event_slots: int, day_slots: int):
+        self.last_seen = now
+        # One uint32 ring buffer: recent event times (epoch seconds)
+        # followed by per-day event counters indexed by day number
+        self.window = array("I", bytes(4 * (event_slots + day_slots)))
+        self.event_head = 0
+        self.day_index = int(now // 86400)
+        # Bitmask of recent replies, 1 = delayed
+        self.reply_bits = 0
+
+
+class UserStateStore:
+    """Compact per-user sliding-window state with TTL eviction
+
+    Each tracked user costs one ``UserWindowState`` record holding a
+    single ring buffer plus its index entry, measured at under
+    ``BYTES_PER_USER`` bytes including a typical 12-character user ID.
+    Capacity is capped at ``max_users``; beyond that the least recently
+    seen user is evicted, so the store stays within
+    ``memory_budget_bytes()`` (512 MB for the default 1M users). Users
+    idle for longer than ``idle_ttl_seconds`` are evicted as new events
+    arrive.
+    """
+
+    BYTES_PER_USER = 512
+    EVENT_SLOTS = 8
+    DAY_SLOTS = 14
+    NO_RESPONSE_SECONDS = 48 * 3600
+    OVERTIME_SPAN_SECONDS = 12 * 3600
+    DELAYED_REPLY_HOURS = 24
+    DELAYED_REPLY_MIN = 3
+    REPLY_WINDOW = 8
+    PARTICIPATION_BASELINE = 5
+
+    def __init__(self, max_users: int = 1_000_000,
+                 idle_ttl_seconds: float = 14 * 86400):
+        self.max_users = max_users
+        self.idle_ttl_seconds = idle_ttl_seconds
+        # Ordered by last event, least recently seen first
+        self.states = OrderedDict()
+        self.clock = 0.0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self.states)
+
+    def memory_budget_bytes(self) -> int:
+        """Upper bound on memory held at full capacity"""
+        return self.max_users * self.BYTES_PER_USER
+
+    def observe(self, user_id: str, now: float,
+                metadata: Optional[Dict] = None) -> List[str]:
+        """Record an event and return the temporal indicators it raises"""
+        self.clock = max(self.clock, now)
+        indicators = []
+
+        state = self.states.get(user_id)
+        if state is None:
+            if len(self.states) >= self.max_users:
+                self.states.popitem(last=False)
+                self.evictions += 1
+            state = UserWindowState(now, self.EVENT_SLOTS, self.DAY_SLOTS)
+            self.states[user_id] = state
+        else:
+            self.states.move_to_end(user_id)
+            if now - state.last_seen >= self.NO_RESPONSE_SECONDS:
+                indicators.append("no_response_48h")
+
+        state.last_seen = max(state.last_seen, now)
+        self._record_event(state, now)
+
+        if self._activity_span(state, now) >= self.OVERTIME_SPAN_SECONDS:
+            indicators.append("overtime")
+
+        if self._participation_dropped(state):
+            indicators.append("silent_in_chat")
+
+        response_hours = (metadata or {}).get("response_time_hours")
+        if response_hours is not None:
+            state.reply_bits = (
+                (state.reply_bits << 1) |
+                (response_hours > self.DELAYED_REPLY_HOURS)
+            ) & ((1 << self.REPLY_WINDOW) - 1)
+            if bin(state.reply_bits).count("1") >= self.DELAYED_REPLY_MIN:
+                indicators.append("delayed_replies")
+
+        self.evict_idle()
+        return indicators
+
+    def _record_event(self, state: UserWindowState, now: float):
+        """Push the event into the timestamp and day-counter rings"""
+        window = state.window
+        window[state.event_head] = int(now)
+        state.event_head = (state.event_head + 1) % self.EVENT_SLOTS
+
+        day = int(now // 86400)
+        if day > state.day_index:
+            # Clear buckets for the days that rolled out of the window
+            for skipped in range(
+                    max(state.day_index + 1, day - self.DAY_SLOTS + 1),
+                    day + 1):
+                window[self.EVENT_SLOTS + skipped % self.DAY_SLOTS] = 0
+            state.day_index = day
+        elif day <= state.day_index - self.DAY_SLOTS:
+            return  # Too old for the window
+
+        window[self.EVENT_SLOTS + day % self.DAY_SLOTS] += 1
+
+    def _activity_span(self, state: UserWindowState, now: float) -> float:
+        """Seconds between the earliest event in the last day and now"""
+        horizon = now - 86400
+        earliest = now
+        for index in range(self.EVENT_SLOTS):
+            event_time = state.window[index]
+            if horizon <= event_time < earliest:
+                earliest = event_time
+        return now - earliest
+
+    def _participation_dropped(self, state: UserWindowState) -> bool:
+        """Whether this week's activity fell below half of last week's"""
+        current = previous = 0
+        for offset in range(self.DAY_SLOTS):
+            count = state.window[
+                self.EVENT_SLOTS +
+                (state.day_index - offset) % self.DAY_SLOTS
+            ]
+            if offset < self.DAY_SLOTS // 2:
+                current += count
+            else:
+                previous += count
+        return (
+            previous >= self.PARTICIPATION_BASELINE and
+            current * 2 < previous
+        )
+
+    def evict_idle(self, now: Optional[float] = None) -> int:
+        """Evict users idle for longer than the TTL"""
+        cutoff = (self.clock if now is None else now) - self.idle_ttl_seconds
+        evicted = 0
+
+        while self.states:
+            user_id = next(iter(self.states))
+            if self.states[user_id].last_seen >= cutoff:
+                break
+            del self.states[user_id]
+            evicted += 1
+
+        self.evictions += evicted
+        return evicted
+
+
 # Integration with orchestrator
 async def integrate_with_orchestrator():
     """Integrate pattern recognition with workflow orchestrator"""
@@ -1,18 +1,23 @@
 #!/usr/bin/env python3
 """
 Production Scaling System for Cline AI Orchestration
-Handles high-throughput async processing, load balancing, and caching
+Handles high-throughput async processing, worker pooling, and caching
 Week 2 Implementation - Scaling to Production Workloads
 """
 
 import asyncio
 import logging
 from datetime import datetime
-from typing import Dict, Optional
-from collections import deque
-import hashlib
+from typing import Callable, Dict, Optional
+from collections import OrderedDict, deque
 import json
-from concurrent.futures import ThreadPoolExecutor
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from canonical_hash import CanonicalHasher
+from latency_histogram import LatencyHistogram, format_latency_summary
 
 # Configure logging
 logging.basicConfig(
@@ -25,23 +30,61 @@ logger = logging.getLogger(__name__)
 class ProductionScaler:
     """Production-ready scaling system for 1000+ workflows/day"""
 
-    def __init__(self, worker_count: int = 10, cache_size: int = 10000):
+    def __init__(self, worker_count: int = 10, cache_size: int = 10000,
+                 min_workers: Optional[int] = None,
+                 max_workers: Optional[int] = None,
+                 autoscale_interval_seconds: float = 1.0,
+                 target_queue_wait_ms: float = 100.0,
+                 process_workers: Optional[int] = None,
+                 hasher: Optional[Callable[[Dict], str]] = None):
         self.worker_count = worker_count
-        self.workers = []
+        # Workflow ID function; any canonical, deterministic hash fits
+        self.hasher = hasher or CanonicalHasher()
+        self.min_workers = min_workers or worker_count
+        self.max_workers = max(
+            max_workers or worker_count * 4, self.min_workers
+        )
+        self.autoscale_interval_seconds = autoscale_interval_seconds
+        self.target_queue_wait_ms = target_queue_wait_ms
+        # worker_id -> task; idle workers are blocked on the shared queue
+        self.workers: Dict[int, asyncio.Task] = {}
+        self.idle_workers = set()
+        self.next_worker_id = 0
+        self.background_tasks = []
         self.work_queue = asyncio.Queue(maxsize=5000)
         self.cache = WorkflowCache(max_size=cache_size)
-        self.load_balancer = LoadBalancer(worker_count)
         self.metrics = {
             "workflows_processed": 0,
             "cache_hits": 0,
             "cache_misses": 0,
+            "coalesced_submissions": 0,
+            "pool_resizes": 0,
             "avg_processing_time_ms": 0,
             "peak_throughput": 0,
             "system_capacity": 1000,  # workflows/day target
             "start_time": datetime.now()
         }
+        # workflow_id -> future shared by identical in-flight submissions
+        self.in_flight: Dict[str, asyncio.Future] = {}
         self.processing_times = deque(maxlen=1000)
-        self.thread_pool = ThreadPoolExecutor(max_workers=worker_count // 2)
+        self.processing_histogram = LatencyHistogram()
+        # Queue wait since the last autoscale decision
+        self.queue_wait_histogram = LatencyHistogram()
+        self.loop_lag_histogram = LatencyHistogram()
+        # workflow type -> (handler, cpu_bound)
+        self.workflow_handlers: Dict[str, tuple] = {}
+        self.process_workers = process_workers or os.cpu_count() or 1
+        self.process_pool: Optional[ProcessPoolExecutor] = None
+
+    def register_workflow_type(self, workflow_type: str, handler: Callable,
+                               cpu_bound: bool = False):
+        """Declare how a workflow type is processed
+
+        I/O-bound handlers are coroutine functions run on the event loop.
+        CPU-bound handlers are plain module-level functions run in the
+        process pool; they receive and return JSON-compatible dicts.
+        """
+        self.workflow_handlers[workflow_type] = (handler, cpu_bound)
 
     async def initialize(self):
         """Initialize the production scaling system"""
@@ -50,98 +93,239 @@ class ProductionScaler:
         )
 
         # Start worker tasks
-        for i in range(self.worker_count):
-            worker = asyncio.create_task(self._worker_loop(i))
-            self.workers.append(worker)
+        self._add_workers(self.worker_count)
+
+        # Warm the process pool before CPU-bound work arrives
+        if any(cpu for _, cpu in self.workflow_handlers.values()):
+            await self._start_process_pool()
 
-        # Start metrics collector
-        asyncio.create_task(self._metrics_collector())
+        # Start metrics collector, pool autoscaler and loop lag probe
+        self.background_tasks = [
+            asyncio.create_task(self._metrics_collector()),
+            asyncio.create_task(self._autoscale_loop()),
+            asyncio.create_task(self._loop_lag_monitor())
+        ]
 
         logger.info("Production scaling system initialized")
 
-    async def submit_workflow(self, workflow: Dict) -> str:
-        """Submit a workflow for processing"""
-        workflow_id = self._generate_workflow_id(workflow)
+    async def submit_workflow(
+            self, workflow: Dict,
+            idempotency_key: Optional[str] = None) -> "WorkflowHandle":
+        """Submit a workflow and return an awaitable handle to its result
+
+        Cache hits resolve immediately; identical workflows submitted
+        while one is in flight share its result instead of re-queueing.
+        An ``idempotency_key`` is used as the workflow ID as-is, which
+        skips hashing the payload.
+        """
+        workflow_id = (
+            idempotency_key if idempotency_key is not None
+            else self._generate_workflow_id(workflow)
+        )
+        loop = asyncio.get_running_loop()
 
         # Check cache first
         cached_result = await self.cache.get(workflow_id)
-        if cached_result:
+        if cached_result is not None:
             self.metrics["cache_hits"] += 1
-            return workflow_id  # Return workflow_id, not the cached result
+            future = loop.create_future()
+            future.set_result(cached_result)
+            return WorkflowHandle(workflow_id, future, cached=True)
+
+        # Join an identical workflow that is already queued or running
+        in_flight = self.in_flight.get(workflow_id)
+        if in_flight is not None:
+            self.metrics["coalesced_submissions"] += 1
+            return WorkflowHandle(workflow_id, in_flight, coalesced=True)
 
         self.metrics["cache_misses"] += 1
+        future = loop.create_future()
+        self.in_flight[workflow_id] = future
 
         # Add to processing queue
-        await self.work_queue.put({
-            "id": workflow_id,
-            "workflow": workflow,
-            "submitted_at": datetime.now()
-        })
-
-        return workflow_id
+        try:
+            await self.work_queue.put({
+                "id": workflow_id,
+                "workflow": workflow,
+                "submitted_at": datetime.now()
+            })
+        except BaseException:
+            self.in_flight.pop(workflow_id, None)
+            future.cancel()
+            raise
+
+        return WorkflowHandle(workflow_id, future)
 
     def _generate_workflow_id(self, workflow: Dict) -> str:
         """Generate unique workflow ID"""
-        workflow_str = json.dumps(workflow, sort_keys=True)
-        return hashlib.sha256(workflow_str.encode()).hexdigest()[:16]
+        return self.hasher(workflow)
+
+    def _add_workers(self, count: int):
+        """Start workers pulling from the shared queue"""
+        for _ in range(count):
+            worker_id = self.next_worker_id
+            self.next_worker_id += 1
+            self.workers[worker_id] = asyncio.create_task(
+                self._worker_loop(worker_id)
+            )
+
+    def _retire_workers(self, count: int):
+        """Stop idle workers; busy ones are never interrupted"""
+        for worker_id in list(self.idle_workers)[:count]:
+            self.idle_workers.discard(worker_id)
+            self.workers.pop(worker_id).cancel()
 
     async def _worker_loop(self, worker_id: int):
-        """Worker loop for processing workflows"""
+        """Worker loop: pull the next workflow as soon as this one is done"""
         logger.info(f"Worker {worker_id} started")
 
         while True:
-            try:
-                # Get work item with load balancing
-                if not self.load_balancer.should_worker_process(worker_id):
-                    await asyncio.sleep(0.1)
-                    continue
-
-                work_item = await asyncio.wait_for(
-                    self.work_queue.get(),
-                    timeout=1.0
-                )
+            self.idle_workers.add(worker_id)
+            work_item = await self.work_queue.get()
+            self.idle_workers.discard(worker_id)
 
+            try:
                 # Process workflow
                 start_time = datetime.now()
-                result = await self._process_workflow(work_item)
+                self.queue_wait_histogram.record(
+                    (start_time - work_item["submitted_at"]).total_seconds()
+                    * 1000
+                )
+                try:
+                    result = await self._process_workflow(work_item)
+                except Exception as e:
+                    self._resolve_workflow(work_item["id"], error=e)
+                    raise
                 processing_time = (
                     (datetime.now() - start_time).total_seconds() * 1000
                 )
 
                 # Update metrics
                 self.processing_times.append(processing_time)
+                self.processing_histogram.record(processing_time)
                 self.metrics["workflows_processed"] += 1
 
-                # Cache result
+                # Cache result and wake everyone waiting on it
                 await self.cache.set(work_item["id"], result)
+                self._resolve_workflow(work_item["id"], result=result)
 
-                # Update load balancer
-                await self.load_balancer.update_worker_load(
-                    worker_id, processing_time
-                )
-
-            except asyncio.TimeoutError:
-                continue
             except Exception as e:
                 logger.error(f"Worker {worker_id} error: {e}")
+            finally:
+                self.work_queue.task_done()
+
+    async def _autoscale_loop(self):
+        """Periodically resize the worker pool"""
+        while True:
+            await asyncio.sleep(self.autoscale_interval_seconds)
+            self._autoscale()
+
+    def _autoscale(self):
+        """Grow on backlog or slow queue wait, shrink when idle
+
+        Growth doubles the pool (up to ``max_workers``) so a burst is
+        absorbed in a few intervals; shrinking retires half of the idle
+        workers above ``min_workers`` at a time.
+        """
+        depth = self.work_queue.qsize()
+        size = len(self.workers)
+        wait_p90 = self.queue_wait_histogram.percentile(0.9) or 0.0
+        self.queue_wait_histogram.reset()
+
+        if depth > len(self.idle_workers) and (
+                depth >= size or wait_p90 > self.target_queue_wait_ms):
+            grow = min(max(1, size), self.max_workers - size)
+            if grow > 0:
+                self._add_workers(grow)
+                self.metrics["pool_resizes"] += 1
+                logger.info(
+                    f"Worker pool grown to {len(self.workers)} "
+                    f"(queue depth {depth}, wait p90 {wait_p90:.0f}ms)"
+                )
+        elif depth == 0 and size > self.min_workers and self.idle_workers:
+            shrink = min(
+                size - self.min_workers,
+                max(1, len(self.idle_workers) // 2)
+            )
+            self._retire_workers(shrink)
+            self.metrics["pool_resizes"] += 1
+            logger.info(f"Worker pool shrunk to {len(self.workers)}")
+
+    def _resolve_workflow(self, workflow_id: str,
+                          result: Optional[Dict] = None,
+                          error: Optional[Exception] = None):
+        """Complete the shared future for an in-flight workflow"""
+        future = self.in_flight.pop(workflow_id, None)
+        if future is None or future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
 
     async def _process_workflow(self, work_item: Dict) -> Dict:
         """Process a single workflow"""
-        # Simulate complex workflow processing
-        # In production, this would integrate with orchestrator
-        await asyncio.sleep(0.05)  # Simulate 50ms processing
+        workflow = work_item["workflow"]
+        handler, cpu_bound = self.workflow_handlers.get(
+            workflow.get("type"), (None, False)
+        )
 
-        return {
-            "workflow_id": work_item["id"],
-            "status": "completed",
-            "processed_at": datetime.now().isoformat(),
-            "results": {
+        if cpu_bound:
+            results = await self._run_in_process(handler, workflow)
+        elif handler is not None:
+            results = await handler(workflow)
+        else:
+            # Simulate complex workflow processing
+            # In production, this would integrate with orchestrator
+            await asyncio.sleep(0.05)  # Simulate 50ms processing
+            results = {
                 "patterns_detected": 3,
                 "interventions_triggered": 2,
                 "force_multiplication": 81
             }
+
+        return {
+            "workflow_id": work_item["id"],
+            "status": "completed",
+            "processed_at": datetime.now().isoformat(),
+            "results": results
         }
 
+    async def _start_process_pool(self):
+        """Create the process pool and start every worker process"""
+        self.process_pool = ProcessPoolExecutor(
+            max_workers=self.process_workers
+        )
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(
+            loop.run_in_executor(self.process_pool, _warm_process)
+            for _ in range(self.process_workers)
+        ))
+        logger.info(f"Process pool warmed with {self.process_workers} workers")
+
+    async def _run_in_process(self, handler: Callable, workflow: Dict) -> Dict:
+        """Run a CPU-bound handler in the process pool
+
+        The workflow crosses the process boundary as compact JSON bytes,
+        so pickling is a single bytes copy rather than an object walk.
+        """
+        if self.process_pool is None:
+            await self._start_process_pool()
+
+        payload = _encode_payload(workflow)
+        result = await asyncio.get_running_loop().run_in_executor(
+            self.process_pool, _run_cpu_workflow, handler, payload
+        )
+        return json.loads(result)
+
+    async def _loop_lag_monitor(self, interval_seconds: float = 0.05):
+        """Record how late the event loop wakes a sleeping task"""
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(interval_seconds)
+            lag = time.perf_counter() - start - interval_seconds
+            self.loop_lag_histogram.record(max(lag, 0.0) * 1000)
+
     async def _metrics_collector(self):
         """Collect and update performance metrics"""
         while True:
@@ -177,13 +361,33 @@ class ProductionScaler:
             ),
             "avg_processing_time_ms":
                 f"{self.metrics['avg_processing_time_ms']:.2f}",
+            **format_latency_summary(
+                self.processing_histogram, "processing_time"
+            ),
+            "active_workers": len(self.workers),
+            "idle_workers": len(self.idle_workers),
+            "queue_depth": self.work_queue.qsize(),
+            "pool_resizes": self.metrics["pool_resizes"],
+            **format_latency_summary(
+                self.loop_lag_histogram, "event_loop_lag"
+            ),
             "cache_hit_rate": self._calculate_cache_hit_rate(),
+            "cache": self.cache.get_stats(),
+            "coalesced_submissions": self.metrics["coalesced_submissions"],
+            "in_flight_workflows": len(self.in_flight),
             "peak_throughput": int(self.metrics["peak_throughput"]),
             "system_availability": "99.9%",
             "force_multiplication": "100x",
             "capacity_utilization": self._calculate_capacity_utilization()
         }
 
+    def export_prometheus_metrics(self) -> str:
+        """Export workflow processing time in Prometheus text format"""
+        return self.processing_histogram.to_prometheus(
+            "production_scaler_processing_seconds",
+            "Workflow processing time per worker"
+        )
+
     def _calculate_cache_hit_rate(self) -> str:
         """Calculate cache hit rate"""
         total = self.metrics["cache_hits"] + self.metrics["cache_misses"]
@@ -206,74 +410,189 @@ class ProductionScaler:
         """Gracefully shutdown the scaling system"""
         logger.info("Shutting down production scaler")
 
-        # Cancel all workers
-        for worker in self.workers:
-            worker.cancel()
+        # Cancel all workers and background tasks
+        tasks = list(self.workers.values()) + self.background_tasks
+        for task in tasks:
+            task.cancel()
 
         # Wait for workers to finish
-        await asyncio.gather(*self.workers, return_exceptions=True)
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.workers.clear()
+        self.idle_workers.clear()
+
+        # Release callers still waiting on unprocessed workflows
+        for future in self.in_flight.values():
+            future.cancel()
+        self.in_flight.clear()
 
-        # Shutdown thread pool
-        self.thread_pool.shutdown(wait=True)
+        # Shutdown process pool
+        if self.process_pool is not None:
+            self.process_pool.shutdown(wait=True)
+            self.process_pool = None
 
         logger.info("Production scaler shutdown complete")
 
 
+class WorkflowHandle:
+    """Awaitable handle to a submitted workflow's result
+
+    Handles for coalesced submissions share one future. Awaiting goes
+    through ``asyncio.shield`` so a cancelled caller does not cancel
+    the result for everyone else.
+    """
+
+    __slots__ = ("workflow_id", "cached", "coalesced", "_future")
+
+    def __init__(self, workflow_id: str, future: asyncio.Future,
+                 cached: bool = False, coalesced: bool = False):
+        self.workflow_id = workflow_id
+        self.cached = cached
+        self.coalesced = coalesced
+        self._future = future
+
+    def __await__(self):
+        return asyncio.shield(self._future).__await__()
+
+    def done(self) -> bool:
+        """Whether the result is available"""
+        return self._future.done()
+
+    def result(self) -> Dict:
+        """Result of a completed workflow"""
+        return self._future.result()
+
+    def __repr__(self) -> str:
+        state = "done" if self._future.done() else "pending"
+        return f"WorkflowHandle({self.workflow_id!r}, {state})"
+
+
+def _warm_process() -> int:
+    """No-op run once per pool process to start it ahead of demand"""
+    return os.getpid()
+
+
+def _run_cpu_workflow(handler: Callable, payload: bytes) -> bytes:
+    """Decode a workflow, run a CPU-bound handler, encode its result"""
+    result = handler(json.loads(payload))
+    return json.dumps(result, separators=(",", ":")).encode()
+
+
+def _is_preserialized(value) -> bool:
+    """Whether a value carries its own JSON encoding"""
+    return hasattr(value, "content_hash") and hasattr(value, "to_bytes")
+
+
+def _encode_payload(value) -> bytes:
+    """Compact JSON bytes of a workflow
+
+    Pre-serialized values (e.g. dashboard snapshots), which expose
+    ``content_hash()`` and ``to_bytes()``, are spliced in as-is; the
+    dicts holding them are assembled member by member and everything
+    else goes through the C encoder.
+    """
+    if _is_preserialized(value):
+        return value.to_bytes()
+    if isinstance(value, dict) and all(
+            isinstance(key, str) for key in value) and any(
+            _is_preserialized(member) or isinstance(member, dict)
+            for member in value.values()):
+        return b"{" + b",".join(
+            json.dumps(key).encode() + b":" + _encode_payload(member)
+            for key, member in value.items()
+        ) + b"}"
+    return json.dumps(value, separators=(",", ":")).encode()
+
+
 class WorkflowCache:
-    """High-performance cache for workflow results"""
+    """High-performance LRU cache for workflow results
 
-    def __init__(self, max_size: int = 10000):
+    Entries live in an ``OrderedDict`` in recency order, so hits and
+    evictions are O(1). Every operation completes without awaiting, so
+    no lock is needed within the event loop. Optional ``ttl_seconds``
+    expires entries and ``max_bytes`` bounds their estimated size.
+    """
+
+    def __init__(self, max_size: int = 10000,
+                 ttl_seconds: Optional[float] = None,
+                 max_bytes: Optional[int] = None):
         self.max_size = max_size
-        self.cache = {}
-        self.access_times = {}
-        self.lock = asyncio.Lock()
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        # key -> (value, expires_at, size_bytes), least recent first
+        self.cache = OrderedDict()
+        self.memory_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self.cache)
 
     async def get(self, key: str) -> Optional[Dict]:
         """Get cached result"""
-        async with self.lock:
-            if key in self.cache:
-                self.access_times[key] = datetime.now()
-                return self.cache[key]
-        return None
+        entry = self.cache.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        if entry[1] is not None and entry[1] < time.monotonic():
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self.cache.move_to_end(key)
+        self.hits += 1
+        return entry[0]
 
     async def set(self, key: str, value: Dict):
         """Set cached result"""
-        async with self.lock:
-            # Evict oldest if at capacity
-            if len(self.cache) >= self.max_size:
-                oldest_key = min(
-                    self.access_times.items(),
-                    key=lambda x: x[1]
-                )[0]
-                del self.cache[oldest_key]
-                del self.access_times[oldest_key]
-
-            self.cache[key] = value
-            self.access_times[key] = datetime.now()
+        if key in self.cache:
+            self._remove(key)
 
+        expires_at = (
+            time.monotonic() + self.ttl_seconds
+            if self.ttl_seconds is not None else None
+        )
+        size = _estimate_size(value)
+        self.cache[key] = (value, expires_at, size)
+        self.memory_bytes += size
+
+        # Evict least recently used entries beyond the limits
+        while len(self.cache) > self.max_size or (
+                self.max_bytes is not None and
+                self.memory_bytes > self.max_bytes and
+                len(self.cache) > 1):
+            self._remove(next(iter(self.cache)))
+            self.evictions += 1
+
+    def _remove(self, key: str):
+        """Remove an entry and release its size"""
+        self.memory_bytes -= self.cache.pop(key)[2]
+
+    def get_stats(self) -> Dict:
+        """Cache effectiveness and memory usage"""
+        total = self.hits + self.misses
+        return {
+            "entries": len(self.cache),
+            "hit_rate": f"{self.hits / total:.1%}" if total else "N/A",
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "memory_bytes": self.memory_bytes
+        }
 
-class LoadBalancer:
-    """Load balancer for worker distribution"""
 
-    def __init__(self, worker_count: int):
-        self.worker_count = worker_count
-        self.worker_loads = {i: 0.0 for i in range(worker_count)}
-        self.lock = asyncio.Lock()
-
-    def should_worker_process(self, worker_id: int) -> bool:
-        """Determine if worker should process next item"""
-        # Simple round-robin with load awareness
-        avg_load = sum(self.worker_loads.values()) / self.worker_count
-        return self.worker_loads[worker_id] <= avg_load * 1.2
-
-    async def update_worker_load(self, worker_id: int, processing_time: float):
-        """Update worker load metric"""
-        async with self.lock:
-            # Exponential moving average
-            self.worker_loads[worker_id] = (
-                0.7 * self.worker_loads[worker_id] +
-                0.3 * processing_time
-            )
+def _estimate_size(value) -> int:
+    """Approximate deep size in bytes of a JSON-like value"""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        for key, item in value.items():
+            size += _estimate_size(key) + _estimate_size(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            size += _estimate_size(item)
+    return size
 
 
 # Integration with orchestration layer
@@ -297,7 +616,7 @@ async def main():
     # Simulate high-volume workflow submission
     print("\n📥 Submitting 100 test workflows...")
 
-    workflow_ids = []
+    handles = []
     for i in range(100):
         workflow = {
             "type": "pattern_analysis",
@@ -307,8 +626,7 @@ async def main():
                 "risk_level": "medium" if i % 3 == 0 else "low"
             }
         }
-        workflow_id = await scaler.submit_workflow(workflow)
-        workflow_ids.append(workflow_id)
+        handles.append(await scaler.submit_workflow(workflow))
 
         # Simulate realistic submission rate
         if i % 10 == 0:
@@ -316,7 +634,8 @@ async def main():
 
     # Wait for processing
     print("\n⏳ Processing workflows...")
-    await asyncio.sleep(3)
+    results = await asyncio.gather(*handles)
+    print(f"  - {len(results)} results received")
 
     # Show metrics
     print("\n📊 Production Scaling Metrics:")
@@ -326,6 +645,7 @@ async def main():
 
     # Test cache effectiveness
     print("\n🔄 Testing cache (resubmitting 10 workflows)...")
+    cached = 0
     for i in range(10):
         workflow = {
             "type": "pattern_analysis",
@@ -335,9 +655,10 @@ async def main():
                 "risk_level": "low"
             }
         }
-        await scaler.submit_workflow(workflow)
-
-    await asyncio.sleep(1)
+        handle = await scaler.submit_workflow(workflow)
+        await handle
+        cached += handle.cached
+    print(f"  - {cached}/10 served from cache")
 
     # Final metrics
     print("\n📊 Final Metrics:")
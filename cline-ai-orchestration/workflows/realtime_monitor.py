@@ -6,12 +6,19 @@ Week 2 Implementation - Real-time Monitoring Activation
 """
 
 import asyncio
+import hashlib
+import heapq
+import itertools
+import json
 import logging
+import sys
 from datetime import datetime
-from typing import Dict, List, Callable
-from collections import deque
+from typing import Dict, Iterable, List, Callable, Optional, Tuple
+from collections import OrderedDict, deque
 import time
 
+from latency_histogram import LatencyHistogram, format_latency_summary
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -19,13 +26,21 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# asyncio.Task(..., eager_start=True) is available from Python 3.12
+EAGER_TASKS = sys.version_info >= (3, 12)
+
 
 class RealtimeMonitor:
     """Real-time monitoring system with event-driven triggers"""
 
-    def __init__(self, max_streams: int = 1000):
+    def __init__(self, max_streams: int = 1000,
+                 handler_timeout_seconds: float = 1.0,
+                 stale_after_seconds: float = 300):
         self.max_streams = max_streams
+        self.handler_timeout_seconds = handler_timeout_seconds
         self.active_streams = {}
+        self.stream_health = StreamHealthIndex(stale_after_seconds)
+        self.health_task = None
         self.event_handlers = {}
         self.metrics = {
             "events_processed": 0,
@@ -36,7 +51,17 @@ class RealtimeMonitor:
             "uptime_start": datetime.now()
         }
         self.latency_buffer = deque(maxlen=1000)
+        self.latency_sum = 0.0
+        self.latency_histogram = LatencyHistogram()
         self.dashboard_data = {}
+        self.dashboard_version = 0
+        # Version of the latest snapshot; entries at or below it are
+        # shared with snapshots and copied before being modified
+        self.snapshot_version = 0
+        # stream_id -> version of last change, least recent first
+        self.dashboard_changes = OrderedDict()
+        # stream_id -> (version, encoded entry) shared by snapshots
+        self.stream_fragments = {}
 
     async def register_stream(
             self, stream_id: str,
@@ -46,13 +71,19 @@ class RealtimeMonitor:
             logger.warning(f"Stream limit reached: {self.max_streams}")
             return False
 
+        previous = self.active_streams.get(stream_id)
+        if previous is not None:
+            self.stream_health.remove(previous)
+
         self.active_streams[stream_id] = {
             "config": stream_config,
             "status": "active",
             "created_at": datetime.now(),
             "last_event": None,
+            "last_event_ts": None,
             "event_count": 0
         }
+        self.stream_health.add()
 
         self.metrics["stream_count"] = len(self.active_streams)
         logger.info(f"Registered stream: {stream_id}")
@@ -72,135 +103,258 @@ class RealtimeMonitor:
             self, stream_id: str,
             event_data: Dict) -> Dict:
         """Process incoming event from a stream"""
-        start_time = time.time()
-
-        if stream_id not in self.active_streams:
-            logger.warning(f"Unknown stream: {stream_id}")
-            return {"status": "error", "message": "Unknown stream"}
-
-        try:
-            # Update stream metadata
-            stream = self.active_streams[stream_id]
-            stream["last_event"] = datetime.now()
-            stream["event_count"] += 1
-
-            # Extract event type and payload
-            event_type = event_data.get("type", "unknown")
-            payload = event_data.get("payload", {})
-
-            # Trigger event handlers
-            handlers = self.event_handlers.get(event_type, [])
-            alerts = []
-
-            for handler in handlers:
-                try:
-                    if asyncio.iscoroutinefunction(handler):
-                        result = await handler(stream_id, payload)
-                    else:
-                        result = handler(stream_id, payload)
-
-                    if result and result.get("alert"):
-                        alerts.append(result)
-                        self.metrics["alerts_generated"] += 1
+        results = await self.process_events_batch([(stream_id, event_data)])
+        return results[0]
+
+    async def process_events_batch(
+            self, events: List[Tuple[str, Dict]]) -> List[Dict]:
+        """Process a batch of (stream_id, event_data) pairs
+
+        Each coroutine handler runs as its own task; those still running
+        after the batch is started are awaited together, bounded by
+        ``handler_timeout_seconds``.
+        """
+        results = []
+        suspended = []  # (result index, event type, start time, tasks)
+
+        for stream_id, event_data in events:
+            start_time = time.perf_counter()
+            stream = self.active_streams.get(stream_id)
+
+            if stream is None:
+                logger.warning(f"Unknown stream: {stream_id}")
+                results.append(
+                    {"status": "error", "message": "Unknown stream"}
+                )
+                continue
 
-                except Exception as e:
-                    logger.error(f"Handler error for {event_type}: {e}")
+            try:
+                # Update stream metadata
+                self.stream_health.touch(stream_id, stream, time.time())
+                stream["event_count"] += 1
 
-            # Calculate latency
-            latency_ms = (time.time() - start_time) * 1000
-            self.latency_buffer.append(latency_ms)
-            self._update_latency_metric()
+                # Extract event type and payload
+                event_type = event_data.get("type", "unknown")
+                payload = event_data.get("payload", {})
 
-            # Update metrics
-            self.metrics["events_processed"] += 1
+                # Trigger event handlers
+                alerts, tasks = self._start_handlers(
+                    event_type, stream_id, payload
+                )
 
-            # Update dashboard
-            await self._update_dashboard(stream_id, event_type, alerts)
+            except Exception as e:
+                logger.error(f"Event processing error: {e}")
+                results.append({"status": "error", "message": str(e)})
+                continue
 
-            return {
+            results.append({
                 "status": "success",
                 "stream_id": stream_id,
                 "event_type": event_type,
                 "alerts": alerts,
-                "latency_ms": latency_ms
-            }
+                "latency_ms": 0.0
+            })
 
-        except Exception as e:
-            logger.error(f"Event processing error: {e}")
-            return {"status": "error", "message": str(e)}
+            if tasks:
+                suspended.append(
+                    (len(results) - 1, event_type, start_time, tasks)
+                )
+            else:
+                self._complete_event(results[-1], start_time)
 
-    def _update_latency_metric(self):
-        """Update average latency metric"""
-        if self.latency_buffer:
-            self.metrics["avg_latency_ms"] = sum(self.latency_buffer) / len(
-                self.latency_buffer
+        if suspended:
+            await self._await_handlers(
+                [task for *_, tasks in suspended for task in tasks]
             )
+            for index, event_type, start_time, tasks in suspended:
+                for task in tasks:
+                    self._collect_alert(
+                        event_type, self._task_result(event_type, task),
+                        results[index]["alerts"]
+                    )
+                self._complete_event(results[index], start_time)
+
+        return results
+
+    def _start_handlers(
+            self, event_type: str, stream_id: str,
+            payload: Dict) -> Tuple[List[Dict], List[asyncio.Task]]:
+        """Start an event's handlers, returning alerts from those that
+        already finished and the tasks still running"""
+        alerts = []
+        tasks = []
+
+        for handler in self.event_handlers.get(event_type, ()):
+            try:
+                result = handler(stream_id, payload)
+                if asyncio.iscoroutine(result):
+                    task = _start_handler_task(result)
+                    if not task.done():
+                        tasks.append(task)
+                        continue
+                    result = self._task_result(event_type, task)
+                self._collect_alert(event_type, result, alerts)
+
+            except Exception as e:
+                logger.error(f"Handler error for {event_type}: {e}")
+
+        return alerts, tasks
+
+    async def _await_handlers(self, tasks: List[asyncio.Task]):
+        """Wait for suspended handlers, cancelling any that time out"""
+        _, timed_out = await asyncio.wait(
+            tasks, timeout=self.handler_timeout_seconds
+        )
+        for task in timed_out:
+            task.cancel()
+        if timed_out:
+            logger.error(
+                f"{len(timed_out)} handlers exceeded "
+                f"{self.handler_timeout_seconds}s timeout"
+            )
+            await asyncio.wait(timed_out)
+
+    def _task_result(self, event_type: str,
+                     task: asyncio.Task) -> Optional[Dict]:
+        """Get a suspended handler's result, logging failures"""
+        if task.cancelled():
+            return None
+        if task.exception() is not None:
+            logger.error(f"Handler error for {event_type}: "
+                         f"{task.exception()}")
+            return None
+        return task.result()
+
+    def _collect_alert(self, event_type: str,
+                       result: Optional[Dict], alerts: List[Dict]):
+        """Record a handler result if it raised an alert"""
+        if result and result.get("alert"):
+            alerts.append(result)
+            self.metrics["alerts_generated"] += 1
+
+    def _complete_event(self, result: Dict, start_time: float):
+        """Record latency, metrics and dashboard state for an event"""
+        latency_ms = (time.perf_counter() - start_time) * 1000
+        result["latency_ms"] = latency_ms
+        self._record_latency(latency_ms)
+
+        # Update metrics
+        self.metrics["events_processed"] += 1
+
+        # Update dashboard
+        self._update_dashboard(
+            result["stream_id"], result["event_type"], result["alerts"]
+        )
+
+    def _record_latency(self, latency_ms: float):
+        """Update the running-sum average latency metric"""
+        buffer = self.latency_buffer
+        if len(buffer) == buffer.maxlen:
+            self.latency_sum -= buffer[0]
+        buffer.append(latency_ms)
+        self.latency_sum += latency_ms
+        self.latency_histogram.record(latency_ms)
 
-    async def _update_dashboard(
+        # Re-sum periodically so float error cannot accumulate
+        if self.metrics["events_processed"] % 100000 == 0:
+            self.latency_sum = sum(buffer)
+
+        self.metrics["avg_latency_ms"] = self.latency_sum / len(buffer)
+
+    def _update_dashboard(
             self, stream_id: str,
             event_type: str,
             alerts: List[Dict]):
         """Update real-time dashboard data"""
-        if stream_id not in self.dashboard_data:
-            self.dashboard_data[stream_id] = {
+        self.dashboard_version += 1
+        dashboard = self.dashboard_data.get(stream_id)
+        if dashboard is None:
+            dashboard = self.dashboard_data[stream_id] = {
                 "event_counts": {},
                 "alert_counts": {},
-                "last_update": None
+                "last_update": None,
+                "version": 0
+            }
+        elif dashboard["version"] <= self.snapshot_version:
+            # Copy on write: a snapshot still references this entry
+            dashboard = self.dashboard_data[stream_id] = {
+                "event_counts": dict(dashboard["event_counts"]),
+                "alert_counts": dict(dashboard["alert_counts"]),
+                "last_update": dashboard["last_update"],
+                "version": 0
             }
 
-        dashboard = self.dashboard_data[stream_id]
+        dashboard["version"] = self.dashboard_version
+        self.dashboard_changes[stream_id] = self.dashboard_version
+        self.dashboard_changes.move_to_end(stream_id)
 
         # Update event counts
-        if event_type not in dashboard["event_counts"]:
-            dashboard["event_counts"][event_type] = 0
-        dashboard["event_counts"][event_type] += 1
+        event_counts = dashboard["event_counts"]
+        event_counts[event_type] = event_counts.get(event_type, 0) + 1
 
         # Update alert counts
-        for alert in alerts:
-            alert_type = alert.get("type", "unknown")
-            if alert_type not in dashboard["alert_counts"]:
-                dashboard["alert_counts"][alert_type] = 0
-            dashboard["alert_counts"][alert_type] += 1
+        if alerts:
+            alert_counts = dashboard["alert_counts"]
+            for alert in alerts:
+                alert_type = alert.get("type", "unknown")
+                alert_counts[alert_type] = alert_counts.get(alert_type, 0) + 1
 
         dashboard["last_update"] = datetime.now().isoformat()
 
-    async def get_stream_health(self) -> Dict:
-        """Get health status of all streams"""
-        health_data = {
-            "total_streams": len(self.active_streams),
-            "active_streams": 0,
-            "stale_streams": 0,
-            "stream_details": []
-        }
-
-        current_time = datetime.now()
-
-        for stream_id, stream in self.active_streams.items():
-            is_active = True
+    async def get_stream_health(
+            self, offset: int = 0, limit: int = 100) -> Dict:
+        """Get stream health counts and one page of stream details"""
+        self.stream_health.expire(self.active_streams, time.time())
 
-            if stream["last_event"]:
-                time_since_last = (
-                    current_time - stream["last_event"]
-                ).total_seconds()
-                if time_since_last > 300:  # 5 minutes = stale
-                    is_active = False
-                    health_data["stale_streams"] += 1
-                else:
-                    health_data["active_streams"] += 1
-            else:
-                health_data["active_streams"] += 1
-
-            health_data["stream_details"].append({
+        details = [
+            {
                 "stream_id": stream_id,
-                "status": "active" if is_active else "stale",
+                "status": stream["status"],
                 "event_count": stream["event_count"],
                 "last_event": (
                     stream["last_event"].isoformat()
                     if stream["last_event"] else None
                 )
-            })
+            }
+            for stream_id, stream in itertools.islice(
+                self.active_streams.items(), offset, offset + limit
+            )
+        ]
+        next_offset = offset + len(details)
+
+        return {
+            "total_streams": len(self.active_streams),
+            "active_streams": self.stream_health.active_count,
+            "stale_streams": self.stream_health.stale_count,
+            "stream_details": details,
+            "next_offset": (
+                next_offset if next_offset < len(self.active_streams)
+                else None
+            )
+        }
 
-        return health_data
+    def start_health_monitor(self, interval_seconds: float = 1.0):
+        """Start the background timer that marks idle streams stale"""
+        if self.health_task is None or self.health_task.done():
+            self.health_task = asyncio.create_task(
+                self._health_monitor_loop(interval_seconds)
+            )
+
+    async def stop_health_monitor(self):
+        """Stop the background stale-stream timer"""
+        if self.health_task is not None:
+            self.health_task.cancel()
+            await asyncio.gather(self.health_task, return_exceptions=True)
+            self.health_task = None
+
+    async def _health_monitor_loop(self, interval_seconds: float):
+        """Periodically transition idle streams to stale"""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                self.stream_health.expire(self.active_streams, time.time())
+            except Exception as e:
+                logger.error(f"Stream health check error: {e}")
 
     def get_performance_metrics(self) -> Dict:
         """Get monitoring system performance metrics"""
@@ -212,6 +366,7 @@ class RealtimeMonitor:
             "events_processed": self.metrics["events_processed"],
             "alerts_generated": self.metrics["alerts_generated"],
             "avg_latency_ms": f"{self.metrics['avg_latency_ms']:.2f}",
+            **format_latency_summary(self.latency_histogram, "latency"),
             "concurrent_streams": self.metrics["stream_count"],
             "alert_accuracy": f"{self.metrics['alert_accuracy']:.1%}",
             "uptime_hours": f"{uptime / 3600:.1f}",
@@ -220,16 +375,188 @@ class RealtimeMonitor:
             )
         }
 
-    def get_dashboard_snapshot(self) -> Dict:
-        """Get current dashboard snapshot"""
-        return {
+    def export_prometheus_metrics(self) -> str:
+        """Export event latency in Prometheus text format"""
+        return self.latency_histogram.to_prometheus(
+            "realtime_monitor_event_latency_seconds",
+            "Event processing latency including handlers"
+        )
+
+    def get_dashboard_snapshot(
+            self, since_version: Optional[int] = None) -> "DashboardSnapshot":
+        """Get a serializable dashboard snapshot
+
+        With ``since_version`` only streams changed after that version
+        are included, so pollers can apply deltas instead of re-reading
+        the whole dashboard.
+        """
+        if since_version is None:
+            streams = dict(self.dashboard_data)
+        else:
+            streams = {}
+            for stream_id in reversed(self.dashboard_changes):
+                if self.dashboard_changes[stream_id] <= since_version:
+                    break
+                streams[stream_id] = self.dashboard_data[stream_id]
+
+        self.stream_health.expire(self.active_streams, time.time())
+        self.snapshot_version = self.dashboard_version
+
+        return DashboardSnapshot({
+            "version": self.dashboard_version,
+            "since_version": since_version,
             "timestamp": datetime.now().isoformat(),
-            "streams": self.dashboard_data,
+            "streams": streams,
             "system_metrics": self.get_performance_metrics(),
-            "stream_health": asyncio.create_task(
-                self.get_stream_health()
+            "stream_health": {
+                "total_streams": len(self.active_streams),
+                "active_streams": self.stream_health.active_count,
+                "stale_streams": self.stream_health.stale_count
+            }
+        }, self.stream_fragments)
+
+
+class DashboardSnapshot(dict):
+    """Versioned snapshot of the monitoring dashboard
+
+    A plain dict of JSON-safe values that also knows its ``version``.
+    Stream entries are shared with the monitor copy-on-write, so taking
+    a snapshot does not copy them, and they must not be modified. The
+    snapshot is encoded to JSON bytes at most once, reusing each
+    stream's encoding for as long as that stream is unchanged.
+    """
+
+    def __init__(self, data: Dict, stream_fragments: Dict):
+        super().__init__(data)
+        self.version = data["version"]
+        self.stream_fragments = stream_fragments
+        self.encoded = None
+        self.digest = None
+
+    def _encode_stream(self, stream_id: str, entry: Dict) -> bytes:
+        """Encode one stream entry, reusing the cached encoding"""
+        cached = self.stream_fragments.get(stream_id)
+        if cached is not None and cached[0] == entry["version"]:
+            return cached[1]
+
+        fragment = json.dumps(entry, separators=(",", ":")).encode()
+        if cached is None or cached[0] < entry["version"]:
+            self.stream_fragments[stream_id] = (entry["version"], fragment)
+        return fragment
+
+    def to_bytes(self) -> bytes:
+        """JSON encoding of the snapshot, computed once"""
+        if self.encoded is None:
+            self.encoded = _encode_object(
+                (key, self._encode_streams() if key == "streams" else
+                 json.dumps(value, separators=(",", ":")).encode())
+                for key, value in self.items()
             )
-        }
+        return self.encoded
+
+    def _encode_streams(self) -> bytes:
+        """JSON object of every stream, from per-stream encodings"""
+        return _encode_object(
+            (stream_id, self._encode_stream(stream_id, entry))
+            for stream_id, entry in self["streams"].items()
+        )
+
+    def content_hash(self) -> str:
+        """Stable hash of the encoded snapshot"""
+        if self.digest is None:
+            self.digest = hashlib.blake2b(
+                self.to_bytes(), digest_size=16
+            ).hexdigest()
+        return self.digest
+
+
+class StreamHealthIndex:
+    """Incremental active/stale accounting for monitoring streams
+
+    Streams that have seen events sit in a min-heap keyed by the time
+    they would go stale. Events only update ``last_event`` (a datetime
+    for readers) and ``last_event_ts`` (epoch seconds for the heap);
+    entries are re-armed lazily when they reach the top of the heap, so
+    the event path is O(1) and each stale transition costs O(log n).
+    """
+
+    def __init__(self, stale_after_seconds: float = 300):
+        self.stale_after_seconds = stale_after_seconds
+        self.deadlines = []  # (stale_at, stream_id)
+        self.active_count = 0
+        self.stale_count = 0
+
+    def add(self):
+        """Count a newly registered stream as active"""
+        self.active_count += 1
+
+    def remove(self, stream: Dict):
+        """Stop counting a stream that is being replaced"""
+        if stream["status"] == "stale":
+            self.stale_count -= 1
+        else:
+            self.active_count -= 1
+
+    def touch(self, stream_id: str, stream: Dict, now: float):
+        """Record an event, reviving the stream if it was stale"""
+        first_event = stream["last_event_ts"] is None
+        stream["last_event_ts"] = now
+        stream["last_event"] = datetime.fromtimestamp(now)
+
+        if stream["status"] == "stale":
+            stream["status"] = "active"
+            self.stale_count -= 1
+            self.active_count += 1
+        elif not first_event:
+            return  # Already armed in the heap
+
+        heapq.heappush(
+            self.deadlines, (now + self.stale_after_seconds, stream_id)
+        )
+
+    def expire(self, streams: Dict[str, Dict], now: float) -> int:
+        """Mark streams stale whose last event is older than the limit"""
+        transitioned = 0
+
+        while self.deadlines and self.deadlines[0][0] <= now:
+            _, stream_id = heapq.heappop(self.deadlines)
+            stream = streams.get(stream_id)
+            if (stream is None or stream["last_event_ts"] is None or
+                    stream["status"] == "stale"):
+                continue  # Replaced, or already transitioned
+
+            stale_at = stream["last_event_ts"] + self.stale_after_seconds
+            if stale_at > now:
+                heapq.heappush(self.deadlines, (stale_at, stream_id))
+                continue
+
+            stream["status"] = "stale"
+            self.active_count -= 1
+            self.stale_count += 1
+            transitioned += 1
+
+        return transitioned
+
+
+def _encode_object(members: Iterable[Tuple[str, bytes]]) -> bytes:
+    """JSON object from keys and already-encoded member values"""
+    return b"{" + b",".join(
+        json.dumps(key).encode() + b":" + value for key, value in members
+    ) + b"}"
+
+
+def _start_handler_task(coro) -> asyncio.Task:
+    """Schedule a handler coroutine as its own task
+
+    Where the event loop supports eager tasks, the handler's first step
+    runs immediately inside that task, so handlers that never suspend
+    finish without a trip through the scheduler.
+    """
+    if EAGER_TASKS:
+        return asyncio.Task(
+            coro, loop=asyncio.get_running_loop(), eager_start=True
+        )
+    return asyncio.ensure_future(coro)
 
 
 # Event handlers for pattern-based alerts
@@ -297,6 +624,7 @@ async def create_monitoring_system():
         "performance_metric",
         performance_degradation_handler
     )
+    monitor.start_health_monitor()
 
     logger.info("Real-time monitoring system initialized")
     return monitor
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Adaptive Region Router for Cline AI Orchestration
+Latency- and load-aware region selection with compliance, data residency
+and failover
+Week 3 Implementation - Global Deployment Readiness
+"""
+
+import logging
+import random
+import time
+from collections import defaultdict
+from typing import Awaitable, Callable, Dict, List, Optional, TypeVar
+
+from global_deployment import ComplianceLevel, GlobalDeploymentSystem, Region
+from production_scaler import ProductionScaler
+
+logger = logging.getLogger(__name__)
+
+# Regions that may hold each user region's data, home region first
+RESIDENCY_AREAS = {
+    "us-east": (Region.US_EAST, Region.US_WEST),
+    "us-west": (Region.US_WEST, Region.US_EAST),
+    "eu": (Region.EU_WEST, Region.EU_CENTRAL),
+    "asia": (Region.ASIA_PACIFIC, Region.ASIA_NORTHEAST)
+}
+DEFAULT_USER_REGION = "us-east"
+
+# Expected delay added by each queued workflow per worker
+QUEUE_PENALTY_MS = 50.0
+# Consecutive failures before a region is taken out of rotation
+FAILURE_THRESHOLD = 3
+DEGRADED_SECONDS = 30.0
+# A region whose latency estimate exceeds its target by this factor
+# is treated as degraded
+DEGRADED_LATENCY_FACTOR = 3.0
+
+T = TypeVar("T")
+
+
+class NoEligibleRegionError(LookupError):
+    """No active region may process a workflow"""
+
+
+class RegionRouter:
+    """Routes workflows to the least-loaded, fastest eligible region
+
+    A region is eligible when it is active, allowed to hold the user's
+    data and meets every compliance framework the workflow asks for.
+    Among eligible regions, ``choices`` are sampled (power of two
+    choices) and the one with the lowest cost wins: its live latency
+    estimate plus a penalty for queued work, taken from the region's
+    ProductionScaler when one is registered and from requests routed
+    but not finished otherwise. Regions that keep failing or whose
+    latency far exceeds target are skipped until they recover.
+    """
+
+    def __init__(self, deployment: GlobalDeploymentSystem,
+                 choices: int = 2,
+                 queue_penalty_ms: float = QUEUE_PENALTY_MS,
+                 rng: Optional[random.Random] = None):
+        self.deployment = deployment
+        self.choices = choices
+        self.queue_penalty_ms = queue_penalty_ms
+        self.rng = rng or random.Random()
+        self.scalers: Dict[Region, ProductionScaler] = {}
+        # Requests routed to each region and not yet finished
+        self.outstanding: Dict[Region, int] = defaultdict(int)
+        self.consecutive_failures: Dict[Region, int] = defaultdict(int)
+        self.degraded_until: Dict[Region, float] = {}
+
+        self.metrics = {
+            "requests_routed": 0,
+            "failovers": 0,
+            "regions_degraded": 0
+        }
+
+    def register_scaler(self, region: Region, scaler: ProductionScaler):
+        """Use a region's scaler queue as its load signal"""
+        self.scalers[region] = scaler
+
+    def eligible_regions(self, workflow: Dict) -> List[Region]:
+        """Active regions allowed to process a workflow"""
+        if workflow.get("data_residency", True):
+            area = RESIDENCY_AREAS.get(
+                workflow.get("user_region", DEFAULT_USER_REGION),
+                RESIDENCY_AREAS[DEFAULT_USER_REGION]
+            )
+        else:
+            area = tuple(self.deployment.region_configs)
+
+        required = {
+            self.compliance_level(level)
+            for level in workflow.get("compliance", ())
+        }
+        return [
+            region for region in area
+            if region in self.deployment.active_regions and required <= set(
+                self.deployment.region_configs[region].compliance_requirements
+            )
+        ]
+
+    @staticmethod
+    def compliance_level(level) -> ComplianceLevel:
+        """Compliance framework named by a workflow, case-insensitively"""
+        if isinstance(level, ComplianceLevel):
+            return level
+        try:
+            return ComplianceLevel(str(level).strip().lower())
+        except ValueError:
+            raise ValueError(
+                f"Unknown compliance framework: {level!r}"
+            ) from None
+
+    def select(self, workflow: Dict,
+               exclude: Optional[set] = None) -> Optional[Region]:
+        """Pick a region for a workflow, or None when none is eligible"""
+        candidates = [
+            region for region in self.eligible_regions(workflow)
+            if not exclude or region not in exclude
+        ]
+        healthy = [r for r in candidates if not self.is_degraded(r)]
+        # Degraded regions still beat having nowhere to go
+        candidates = healthy or candidates
+        if not candidates:
+            return None
+
+        if len(candidates) > self.choices:
+            candidates = self.rng.sample(candidates, self.choices)
+        return min(candidates, key=self.cost)
+
+    def home_region(self, workflow: Dict) -> Region:
+        """First region of the user's area"""
+        return RESIDENCY_AREAS.get(
+            workflow.get("user_region", DEFAULT_USER_REGION),
+            RESIDENCY_AREAS[DEFAULT_USER_REGION]
+        )[0]
+
+    def cost(self, region: Region) -> float:
+        """Estimated milliseconds to serve a request from a region"""
+        latency = self.deployment.estimated_latency(region)
+        if latency is None:
+            latency = self.deployment.region_configs[
+                region
+            ].latency_target_ms
+
+        scaler = self.scalers.get(region)
+        if scaler is not None:
+            queued = len(scaler.in_flight) / max(1, len(scaler.workers))
+        else:
+            queued = self.outstanding[region]
+        return latency + self.queue_penalty_ms * queued
+
+    def is_degraded(self, region: Region) -> bool:
+        """Whether a region is out of rotation"""
+        if self.degraded_until.get(region, 0.0) > time.monotonic():
+            return True
+        latency = self.deployment.estimated_latency(region)
+        target = self.deployment.region_configs[region].latency_target_ms
+        return latency is not None and (
+            latency > target * DEGRADED_LATENCY_FACTOR
+        )
+
+    def record_success(self, region: Region):
+        """Reset a region's failure streak"""
+        self.consecutive_failures[region] = 0
+
+    def record_failure(self, region: Region):
+        """Count a failure, degrading the region after a streak"""
+        self.consecutive_failures[region] += 1
+        if self.consecutive_failures[region] >= FAILURE_THRESHOLD:
+            self.degraded_until[region] = time.monotonic() + DEGRADED_SECONDS
+            self.consecutive_failures[region] = 0
+            self.metrics["regions_degraded"] += 1
+            logger.warning(f"Region {region.value} degraded")
+
+    async def route(self, workflow: Dict,
+                    process: Callable[[Region], Awaitable[T]],
+                    max_attempts: int = 2) -> T:
+        """Run ``process`` in the chosen region, failing over on errors
+
+        Each retry goes to a region not tried yet; the last error is
+        raised when every attempt fails. Raises NoEligibleRegionError
+        when no active region meets the workflow's residency and
+        compliance requirements.
+        """
+        tried = set()
+        region = self.select(workflow)
+        if region is None:
+            raise NoEligibleRegionError(
+                f"No active region for user region "
+                f"{workflow.get('user_region', DEFAULT_USER_REGION)!r} "
+                f"with compliance {list(workflow.get('compliance', ()))}"
+            )
+        while True:
+            tried.add(region)
+            self.outstanding[region] += 1
+            self.metrics["requests_routed"] += 1
+            try:
+                result = await process(region)
+            except Exception as e:
+                error = e
+            else:
+                self.record_success(region)
+                return result
+            finally:
+                self.outstanding[region] -= 1
+
+            self.record_failure(region)
+            fallback = self.select(workflow, exclude=tried)
+            if fallback is None or len(tried) >= max_attempts:
+                raise error
+            logger.warning(
+                f"Failing over from {region.value} to {fallback.value}: "
+                f"{error}"
+            )
+            self.metrics["failovers"] += 1
+            region = fallback
+
+    def get_routing_metrics(self) -> Dict:
+        """Get routing metrics"""
+        return {
+            "requests_routed": self.metrics["requests_routed"],
+            "failovers": self.metrics["failovers"],
+            "regions_degraded": self.metrics["regions_degraded"],
+            "outstanding_requests": {
+                region.value: count
+                for region, count in self.outstanding.items() if count
+            },
+            "degraded_regions": [
+                region.value for region in self.deployment.region_configs
+                if self.is_degraded(region)
+            ]
+        }
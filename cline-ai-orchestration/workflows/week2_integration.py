@@ -122,10 +122,15 @@ class Week2Integration:
 
     async def _monitor_to_scaler_pipeline(self):
         """Pipeline: Monitoring Alerts → Production Scaling"""
+        dashboard_version = None
+
         while True:
             try:
-                # Get monitoring snapshot
-                dashboard = self.monitor.get_dashboard_snapshot()
+                # Get streams changed since the previous snapshot
+                dashboard = self.monitor.get_dashboard_snapshot(
+                    since_version=dashboard_version
+                )
+                dashboard_version = dashboard.version
 
                 # Check for high load
                 metrics = dashboard.get("system_metrics", {})
@@ -178,14 +183,14 @@ class Week2Integration:
             "interaction": interaction,
             "patterns": patterns
         }
-        workflow_id = await self.scaler.submit_workflow(workflow)
+        handle = await self.scaler.submit_workflow(workflow)
 
         # Calculate end-to-end latency
         latency_ms = (datetime.now() - start_time).total_seconds() * 1000
         self.integration_metrics["monitoring_latency_ms"] = latency_ms
 
         return {
-            "workflow_id": workflow_id,
+            "workflow_id": handle.workflow_id,
             "patterns_detected": len(patterns),
             "latency_ms": latency_ms,
             "status": "processed"
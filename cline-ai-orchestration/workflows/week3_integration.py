@@ -7,7 +7,7 @@ Advanced Pattern Learning, Global Deployment, AI Workforce Expansion
 import asyncio
 import logging
 from datetime import datetime
-from typing import Dict
+from typing import Dict, Iterable, List, Optional, Tuple
 
 # Import Week 2 components
 from week2_integration import Week2Integration
@@ -16,6 +16,7 @@ from week2_integration import Week2Integration
 from advanced_pattern_learning import create_advanced_pattern_learner
 from global_deployment import GlobalDeploymentSystem, Region
 from ai_workforce_expansion import AIWorkforceExpansion
+from region_router import RegionRouter
 
 # Configure logging
 logging.basicConfig(
@@ -24,6 +25,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# process_global_batch: items buffered between stages, workers per stage
+# (enough pattern evolutions in flight to fill a prediction batch)
+PIPELINE_QUEUE_SIZE = 64
+PIPELINE_STAGE_WORKERS = 64
+
 
 class Week3Integration:
     """Integrates Week 3 advanced capabilities with existing infrastructure"""
@@ -32,7 +38,10 @@ class Week3Integration:
         self.week2_integration = None
         self.pattern_learner = None
         self.global_deployment = None
+        self.region_router = None
         self.ai_workforce = None
+        # Initial regional rollout; routing waits for it to finish
+        self.rollout_task: Optional[asyncio.Task] = None
 
         self.integration_metrics = {
             "start_time": datetime.now(),
@@ -59,6 +68,7 @@ class Week3Integration:
 
         # Initialize Global Deployment
         self.global_deployment = GlobalDeploymentSystem()
+        self.region_router = RegionRouter(self.global_deployment)
         logger.info("Global Deployment System initialized")
 
         # Initialize AI Workforce
@@ -81,11 +91,16 @@ class Week3Integration:
         asyncio.create_task(self._pattern_learning_pipeline())
 
         # Connect global deployment to workforce distribution
-        asyncio.create_task(self._global_deployment_pipeline())
+        self.rollout_task = asyncio.create_task(
+            self._global_deployment_pipeline()
+        )
 
         # Advanced monitoring across regions
         asyncio.create_task(self._global_monitoring_pipeline())
 
+        # Keep regional latency estimates live for routing
+        self.global_deployment.start_latency_probing()
+
     async def _pattern_learning_pipeline(self):
         """Pipeline: Advanced Learning → AI Workforce → Interventions"""
         while True:
@@ -134,14 +149,24 @@ class Week3Integration:
             Region.ASIA_PACIFIC
         ]
 
-        for region in initial_regions:
-            result = await self.global_deployment.deploy_to_region(region)
-            if result["status"] == "success":
-                self.integration_metrics["regions_deployed"] += 1
-                logger.info(f"Deployed to {region.value}")
+        results = await self.global_deployment.deploy_to_regions(
+            initial_regions
+        )
+
+        deployed = [
+            region for region, result in results.items()
+            if result["status"] == "success"
+        ]
+        for region in deployed:
+            self.integration_metrics["regions_deployed"] += 1
+            logger.info(f"Deployed to {region.value}")
+
+            # Scale workforce based on region
+            await self._scale_workforce_for_region(region)
 
-                # Scale workforce based on region
-                await self._scale_workforce_for_region(region)
+        # Seed latency estimates for the new regions
+        if deployed:
+            await self.global_deployment.measure_global_latency()
 
     async def _scale_workforce_for_region(self, region: Region):
         """Scale AI workforce based on regional requirements"""
@@ -166,9 +191,6 @@ class Week3Integration:
         """Monitor performance across all regions"""
         while True:
             try:
-                # Measure global latency
-                await self.global_deployment.measure_global_latency()
-
                 # Optimize workforce based on regional performance
                 await self.ai_workforce.optimize_workforce_distribution()
 
@@ -183,34 +205,105 @@ class Week3Integration:
                 logger.error(f"Global monitoring error: {e}")
 
     async def process_global_workflow(self, workflow: Dict) -> Dict:
-        """Process workflow with Week 3 enhancements"""
-        start_time = datetime.now()
+        """Process workflow with Week 3 enhancements
 
-        # Determine best region for processing
-        region = await self._select_optimal_region(workflow)
+        Pattern evolution comes first, since the Week 2 pipeline hashes
+        and queues the workflow with its evolved patterns; in the region,
+        workforce dispatch runs alongside the Week 2 pipeline.
+        """
+        start_time = datetime.now()
 
-        # Enhanced pattern analysis
-        pattern_data = workflow.get("pattern_data", {})
-        if pattern_data:
-            evolution_result = await self.pattern_learner.evolve_pattern(
-                pattern_data
-            )
+        await self._evolve_workflow(workflow)
+        routed = await self._route_workflow(workflow)
+
+        return self._global_result(start_time, *routed)
+
+    async def process_global_batch(
+            self, workflows: Iterable[Dict],
+            queue_size: int = PIPELINE_QUEUE_SIZE,
+            stage_workers: int = PIPELINE_STAGE_WORKERS) -> List[Dict]:
+        """Stream workflows through the stages as a pipeline
+
+        Pattern evolution and regional processing each have their own
+        workers, joined by bounded queues, so a batch moves at the pace
+        of the slowest stage. Each workflow goes through the same steps,
+        in the same order, as with process_global_workflow. Results come
+        back in input order; a
+        workflow that fails gets an error result instead of failing
+        the batch.
+        """
+        workflows = list(workflows)
+        results: List[Optional[Dict]] = [None] * len(workflows)
+        evolve_queue = asyncio.Queue(maxsize=queue_size)
+        region_queue = asyncio.Queue(maxsize=queue_size)
+
+        async def evolve_stage():
+            while True:
+                index, workflow, start_time = await evolve_queue.get()
+                try:
+                    await self._evolve_workflow(workflow)
+                    await region_queue.put((index, workflow, start_time))
+                except Exception as e:
+                    results[index] = self._failed_result(e)
+                finally:
+                    evolve_queue.task_done()
+
+        async def region_stage():
+            while True:
+                index, workflow, start_time = await region_queue.get()
+                try:
+                    routed = await self._route_workflow(workflow)
+                    results[index] = self._global_result(start_time, *routed)
+                except Exception as e:
+                    results[index] = self._failed_result(e)
+                finally:
+                    region_queue.task_done()
+
+        workers = [
+            asyncio.create_task(stage())
+            for stage in (evolve_stage, region_stage)
+            for _ in range(stage_workers)
+        ]
+        try:
+            for index, workflow in enumerate(workflows):
+                await evolve_queue.put((index, workflow, datetime.now()))
+            await evolve_queue.join()
+            await region_queue.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        return results
+
+    async def _evolve_workflow(self, workflow: Dict):
+        """Attach evolved patterns before the regional stages see it"""
+        evolution_result = await self._evolve_workflow_patterns(workflow)
+        if evolution_result is not None:
             workflow["evolved_patterns"] = evolution_result
 
-        # Distribute to AI workforce
-        task = {
-            "type": workflow.get("type", "general"),
-            "complexity": workflow.get("complexity", 1.0),
-            "region": region.value if region else "global"
-        }
-
-        task_id = await self.ai_workforce.distribute_task(task)
-
-        # Process through Week 2 pipeline
-        week2_result = await self.week2_integration.process_user_interaction(
-            workflow
+    async def _evolve_workflow_patterns(
+            self, workflow: Dict) -> Optional[Dict]:
+        """Enhanced pattern analysis, if the workflow carries pattern data"""
+        pattern_data = workflow.get("pattern_data", {})
+        if not pattern_data:
+            return None
+        return await self.pattern_learner.evolve_pattern(pattern_data)
+
+    async def _route_workflow(
+            self, workflow: Dict) -> Tuple[Region, str, Dict]:
+        """Process in the best region, failing over if it errors"""
+        if self.rollout_task is not None:
+            # Regions only become eligible once they are deployed
+            await asyncio.wait([self.rollout_task])
+        return await self.region_router.route(
+            workflow,
+            lambda region: self._process_in_region(workflow, region)
         )
 
+    def _global_result(self, start_time: datetime, region: Region,
+                       task_id: str, week2_result: Dict) -> Dict:
+        """Result of a processed global workflow"""
         self.integration_metrics["global_workflows_processed"] += 1
 
         processing_time = (datetime.now() - start_time).total_seconds() * 1000
@@ -225,19 +318,28 @@ class Week3Integration:
             ]
         }
 
-    async def _select_optimal_region(self, workflow: Dict) -> Region:
-        """Select optimal region for workflow processing"""
-        # Simple selection based on workflow metadata
-        user_region = workflow.get("user_region", "us-east")
+    @staticmethod
+    def _failed_result(error: Exception) -> Dict:
+        """Result of a workflow that could not be processed"""
+        logger.error(f"Global workflow failed: {error}")
+        return {"status": "error", "message": str(error)}
 
-        region_map = {
-            "us-east": Region.US_EAST,
-            "us-west": Region.US_WEST,
-            "eu": Region.EU_WEST,
-            "asia": Region.ASIA_PACIFIC
+    async def _process_in_region(self, workflow: Dict,
+                                 region: Region) -> Tuple[Region, str, Dict]:
+        """Region-specific stages of a global workflow"""
+        # Distribute to AI workforce
+        task = {
+            "type": workflow.get("type", "general"),
+            "complexity": workflow.get("complexity", 1.0),
+            "region": region.value if region else "global"
         }
 
-        return region_map.get(user_region, Region.US_EAST)
+        # Workforce dispatch and the Week 2 pipeline are independent
+        task_id, week2_result = await asyncio.gather(
+            self.ai_workforce.distribute_task(task),
+            self.week2_integration.process_user_interaction(workflow)
+        )
+        return region, task_id, week2_result
 
     def get_week3_metrics(self) -> Dict:
         """Get comprehensive Week 3 metrics"""
@@ -282,6 +384,7 @@ class Week3Integration:
                     "compliance_validations"
                 ]
             },
+            "region_routing": self.region_router.get_routing_metrics(),
             "ai_workforce": {
                 "total_agents": workforce_metrics["total_agents"],
                 "tasks_completed": workforce_metrics["tasks_completed"],